@@ -0,0 +1 @@
+"""Local benchmarks (no network): fake API servers + measurement scripts."""
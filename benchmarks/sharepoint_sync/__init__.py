@@ -0,0 +1,4 @@
+"""SharePoint sync benchmarks against a local fake Microsoft Graph server.
+
+    python -m benchmarks.sharepoint_sync.bench --help
+"""
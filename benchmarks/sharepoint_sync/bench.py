@@ -0,0 +1,170 @@
+"""Request-count and wall-time benchmark for the ``oa auto`` SharePoint stages.
+
+Runs the real pull and push stages (``auto._pull_sharepoint`` /
+``auto._push_sharepoint``: discovery, site users, delta read, feedback
+stamps, diff-only push, reconcile) with the real ``GraphClient`` —
+limiter, retries, ``$batch``, executor — against ``FakeGraphServer`` on
+localhost, and prints one row per stage and round. Nothing leaves the
+machine.
+
+    python -m benchmarks.sharepoint_sync.bench [--rows 100 --rows 1000] [--latency-ms 20]
+
+Each row count runs three rounds on a fresh database and list:
+``cold`` (empty list: full delta round, every row created), ``steady``
+(nothing changed since) and ``edits`` (5% of rows edited in SharePoint,
+5% of archives changed status, 2% closed). Columns: wall time, HTTP
+requests (and ``$batch`` sub-requests), KiB sent by the server, 429s,
+and the rate limiter's own waits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from oa_tracker import auto, db, ratelimit, sharepoint as sp_mod, status as st  # noqa: E402
+from oa_tracker.config import Config, SharePointSettings  # noqa: E402
+
+from tests.fake_graph import Faults, FakeGraphServer  # noqa: E402
+
+TOKEN = "bench-token"
+NOW = "2026-07-02T10:00:00"
+USERS = 50
+
+
+def _config(tmp: Path, server: FakeGraphServer, workers: int) -> Config:
+    database = tmp / "bench.sqlite"
+    db.init_db(database)
+    out = tmp / "output"
+    (out / "email_drafts").mkdir(parents=True)
+    return Config(
+        project_root=tmp, sharepoint_root=tmp / "publications", database=database,
+        output_dir=out, email_drafts_dir=out / "email_drafts", template_dir=tmp / "templates",
+        sharepoint=SharePointSettings(
+            enabled=True, client_id="bench", site=server.site,
+            max_concurrent_requests=workers,
+        ),
+    )
+
+
+def _seed(config: Config, rows: int) -> None:
+    with db.get_connection(config.database) as conn:
+        for n in range(rows):
+            pub_id = str(3000 + n)
+            db.upsert_archive(
+                conn, publication_id=pub_id,
+                folder_path=str(config.sharepoint_root / pub_id),
+                first_seen_at=NOW, last_seen_at=NOW, status=st.OPEN_ACTIVE,
+                pub_title=f"A study of things, part {n}", pub_doi=f"10.1000/bench.{n}",
+                pub_journal="Nature Things", pub_year=2026,
+                oa_data_required=1, oa_paper_required=1, oa_mandate_missing=0,
+                pub_db_last_refreshed_at=NOW,
+                data_contact_name=f"User {n % USERS}",
+                data_contact_email=f"user{n % USERS}@example.org",
+            )
+
+
+def _change(config: Config, server: FakeGraphServer, list_id: str, rows: int) -> None:
+    """The ``edits`` round's changes, on both sides."""
+    ids = [str(3000 + n) for n in range(rows)]
+    by_pub = {f.get("PubId"): iid for iid, f in server.items(list_id).items()}
+    for pub_id in ids[::20]:
+        server.edit(list_id, by_pub[pub_id], {"UserNotes": f"checked {pub_id}"})
+    with db.get_connection(config.database) as conn:
+        for pub_id in ids[1::20]:
+            db.upsert_archive(conn, publication_id=pub_id, status=st.OPEN_INACTIVE)
+        for pub_id in ids[2::50]:
+            db.upsert_archive(conn, publication_id=pub_id, status=st.CLOSED_DATA_ARCHIVED)
+
+
+def _stage(server: FakeGraphServer, fn) -> tuple[object, dict]:
+    ratelimit.reset_stats()
+    server.reset_stats()
+    t0 = time.perf_counter()
+    out = fn()
+    wall = time.perf_counter() - t0
+    stats = server.stats
+    return out, {
+        "wall": wall,
+        "requests": stats.total,
+        "subs": stats.sub_total,
+        "kib": stats.bytes_sent / 1024,
+        "throttled": stats.status[429] + stats.sub_throttled,
+        "waits": ratelimit.wait_report(),
+    }
+
+
+def run(rows: int, faults: Faults, workers: int, tmp: Path) -> list[dict]:
+    # A fresh limiter per row count: throttling in one must not slow the next.
+    ratelimit._LIMITERS.pop("127.0.0.1", None)
+    out: list[dict] = []
+    with FakeGraphServer(token=TOKEN) as server:
+        server.add_users(*((f"user{n}@example.org", f"User {n}") for n in range(USERS)))
+        config = _config(tmp, server, workers)
+        _seed(config, rows)
+
+        class Client(sp_mod.GraphClient):
+            def __init__(self, sp, **kw):
+                super().__init__(sp, base_url=server.graph_url, token=TOKEN, **kw)
+
+        sp_mod.GraphClient, real = Client, sp_mod.GraphClient
+        try:
+            client = Client(config.sharepoint)
+            list_id, _, _ = sp_mod.ensure_list(client, client.get_site_id(server.site),
+                                               config.sharepoint)
+            server.faults = replace(faults)
+            for rnd in ("cold", "steady", "edits"):
+                if rnd == "edits":
+                    _change(config, server, list_id, rows)
+                result = auto.AutoRunResult(started_at=NOW)
+                ctx, pull = _stage(server, lambda: auto._pull_sharepoint(config, result))
+                _, push = _stage(server, lambda: auto._push_sharepoint(config, ctx, result))
+                for stage, m in (("pull", pull), ("push", push)):
+                    out.append({"rows": rows, "round": rnd, "stage": stage,
+                                "ok": not result.errors, **m})
+                if result.errors:
+                    print(f"  {rows}/{rnd}: {result.errors[:3]}", file=sys.stderr)
+            on_list = len(server.items(list_id))
+            out[-1]["ok"] &= on_list == rows        # closed rows are relabelled, not yet removed
+        finally:
+            sp_mod.GraphClient = real
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, action="append",
+                    help="list size (repeatable; default 100, 1000, 5000)")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="added per HTTP request")
+    ap.add_argument("--throttle-every", type=int, default=0,
+                    help="answer every n-th request 429 (and every n-th $batch sub-request)")
+    ap.add_argument("--retry-after", type=float, default=0.5, help="Retry-After on a 429, seconds")
+    ap.add_argument("--workers", type=int, default=SharePointSettings.max_concurrent_requests,
+                    help="[sharepoint] max_concurrent_requests")
+    args = ap.parse_args()
+
+    faults = Faults(latency=args.latency_ms / 1000, throttle_every=args.throttle_every,
+                    sub_throttle_every=args.throttle_every, retry_after=args.retry_after)
+    print(f"latency {args.latency_ms:g} ms, 429 every {args.throttle_every or '-'}, "
+          f"{args.workers} worker(s)")
+    print(f"{'rows':>5s} {'round':7s} {'stage':5s} {'ok':3s} {'wall s':>7s} {'reqs':>5s} "
+          f"{'subreqs':>7s} {'KiB':>8s} {'429':>4s}  limiter")
+    failed = False
+    for rows in args.rows or [100, 1000, 5000]:
+        with tempfile.TemporaryDirectory() as tmp:
+            for r in run(rows, faults, args.workers, Path(tmp)):
+                failed |= not r["ok"]
+                print(f"{r['rows']:5d} {r['round']:7s} {r['stage']:5s} "
+                      f"{'yes' if r['ok'] else 'NO':3s} {r['wall']:7.2f} {r['requests']:5d} "
+                      f"{r['subs']:7d} {r['kib']:8.1f} {r['throttled']:4d}  {r['waits']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
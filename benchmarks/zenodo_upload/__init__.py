@@ -0,0 +1,4 @@
+"""Zenodo upload benchmarks against a local fake InvenioRDM server.
+
+    python -m benchmarks.zenodo_upload.bench --help
+"""
@@ -0,0 +1,119 @@
+"""Throughput + request-count benchmark for ``zenodo.upload_files``.
+
+Runs the real ``ZenodoClient`` (retries, limiter, keep-alive streaming)
+against ``FakeInvenioServer`` on localhost and prints one row per
+scenario: wall time, MiB/s, HTTP requests by outcome, TCP connections
+opened and limiter wait. Nothing leaves the machine.
+
+    python -m benchmarks.zenodo_upload.bench [--mb 256] [--part-mb 32] [--only multipart]
+
+Scenarios: ``single`` (one PUT), ``multipart``, ``throttled`` (every
+5th request 429s), ``flaky`` (every 7th 503s + one dropped part),
+``latency`` (50 ms per request), ``fallback`` (part PUTs denied → single
+PUT, today's production Zenodo behaviour).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import zipfile
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from oa_tracker import ratelimit, zenodo  # noqa: E402
+from oa_tracker.config import ZenodoSettings  # noqa: E402
+
+from tests.fake_invenio import Faults, FakeInvenioServer  # noqa: E402
+
+TOKEN = "bench-token"
+
+SCENARIOS: dict[str, tuple[bool, Faults]] = {
+    # name: (multipart?, faults)
+    "single": (False, Faults()),
+    "multipart": (True, Faults()),
+    "throttled": (True, Faults(throttle_every=5, retry_after=0.2)),
+    "flaky": (True, Faults(fail_every=7, drop_part_at=2)),
+    "latency": (True, Faults(latency=0.05)),
+    "fallback": (True, Faults(deny_part_put=True)),
+}
+
+
+def _make_file(folder: Path, mb: int) -> Path:
+    """A valid stored zip of ~``mb`` MiB (the uploader CRC-checks zips)."""
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / "data.zip"
+    block = bytes(range(256)) * 4096          # 1 MiB
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        with zf.open("data.bin", "w", force_zip64=True) as f:
+            for _ in range(mb):
+                f.write(block)
+    return path
+
+
+def run(name: str, mb: int, part_mb: int, tmp: Path) -> dict:
+    multipart, faults = SCENARIOS[name]
+    folder = tmp / name
+    path = _make_file(folder, mb)
+    settings = ZenodoSettings(
+        enabled=True, manifest_dir=tmp / "manifests",
+        multipart_threshold_mb=(part_mb if multipart else mb + 1),
+        multipart_part_size_mb=part_mb,
+        single_put_max_mb=10 * mb,
+    )
+    # A fresh limiter per scenario: throttling in one must not slow the next.
+    ratelimit._LIMITERS.pop("127.0.0.1", None)
+    ratelimit.reset_stats()
+    with FakeInvenioServer(token=TOKEN) as server:
+        client = zenodo.ZenodoClient(server.url, TOKEN)
+        draft = zenodo.create_draft(client, {"metadata": {"title": name}})
+        server.faults = replace(faults)
+        server.reset_stats()
+        t0 = time.perf_counter()
+        res = zenodo.upload_files(client, draft.record_id, folder, settings)
+        wall = time.perf_counter() - t0
+        client.close()
+        ok = res.complete and server.entry(draft.record_id, "data.zip")["_md5"] == zenodo._md5(path)
+        stats = server.stats
+    return {
+        "scenario": name,
+        "ok": ok,
+        "wall": wall,
+        "mibps": mb / wall if wall else 0.0,
+        "requests": stats.total,
+        "errors": sum(n for code, n in stats.status.items() if code >= 400),
+        "dropped": stats.total - sum(stats.status.values()),
+        "connections": stats.connections,
+        "waits": ratelimit.wait_report(),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=int, default=256, help="file size in MiB")
+    ap.add_argument("--part-mb", type=int, default=32, help="multipart part size in MiB")
+    ap.add_argument("--only", choices=sorted(SCENARIOS), action="append",
+                    help="run just these scenarios (repeatable)")
+    args = ap.parse_args()
+
+    names = args.only or list(SCENARIOS)
+    print(f"{args.mb} MiB file, {args.part_mb} MiB parts")
+    print(f"{'scenario':10s} {'ok':3s} {'wall s':>7s} {'MiB/s':>8s} "
+          f"{'reqs':>5s} {'4xx/5xx':>7s} {'drop':>4s} {'conns':>5s}  limiter")
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            r = run(name, args.mb, args.part_mb, Path(tmp))
+            failed |= not r["ok"]
+            print(f"{r['scenario']:10s} {'yes' if r['ok'] else 'NO':3s} {r['wall']:7.2f} "
+                  f"{r['mibps']:8.1f} {r['requests']:5d} {r['errors']:7d} "
+                  f"{r['dropped']:4d} {r['connections']:5d}  {r['waits']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
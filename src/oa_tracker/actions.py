@@ -20,6 +20,7 @@ class ApplyResult:
     skipped: int = 0
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    deferred: list[str] = field(default_factory=list)   # waiting for the upload window
 
     @property
     def summary(self) -> str:
@@ -369,6 +370,36 @@ def _append_note(archive: dict, note: str, now: str) -> str:
     return f"{existing_notes}{separator}[{now}] {note}"
 
 
+class DbUploadProgress:
+    """``zenodo.UploadProgress`` backed by the tracker DB's ``upload_parts``.
+
+    Each call opens its own short connection and commits at once — the
+    upload runs inside the apply transaction, and a part recorded there
+    would be rolled back (or lost with the process) exactly when it is
+    needed: after an interrupted run.
+    """
+
+    def __init__(self, db_path: Path):
+        self._db_path = db_path
+
+    def completed_parts(self, record_id: str, key: str) -> list[dict]:
+        with db.get_connection(self._db_path) as conn:
+            return db.get_upload_parts(conn, record_id, key)
+
+    def part_done(
+        self, record_id: str, key: str, *, file_size: int, file_md5: str,
+        part_size: int, part_number: int,
+    ) -> None:
+        with db.get_connection(self._db_path) as conn:
+            db.record_upload_part(
+                conn, record_id, key, file_size, file_md5, part_size, part_number,
+            )
+
+    def clear(self, record_id: str, key: str) -> None:
+        with db.get_connection(self._db_path) as conn:
+            db.clear_upload_parts(conn, record_id, key)
+
+
 def _confirm_zenodo_published(
     conn: sqlite3.Connection,
     archive: dict,
@@ -441,6 +472,83 @@ def _confirm_zenodo_published(
     return (True, old_status, st.OPEN_ZENODO_PUBLISHED)
 
 
+def draft_refusal(archive: dict) -> str | None:
+    """Why no new Zenodo draft may be created for ``archive`` (``None``:
+    go ahead). The one check shared by ``zenodo_create_draft`` and the
+    ``oa auto`` draft pipeline."""
+    if archive.get("zenodo_code"):
+        return f"already has zenodo_code {archive['zenodo_code']!r}"
+    return None
+
+
+def draft_payload(archive: dict, zset: Any, extras: dict[str, Any]) -> dict[str, Any]:
+    """The RDM draft payload for an archive, from the live central-DB
+    ``extras`` (``zenodo.fetch_publication_extras``; ``{}`` when absent)."""
+    from oa_tracker import zenodo
+
+    pub_id = archive["publication_id"]
+    return zenodo.build_record_payloads([archive], zset, {pub_id: extras})[pub_id]
+
+
+def record_draft_created(
+    conn: sqlite3.Connection,
+    archive: dict,
+    new_status: str,
+    draft: Any,
+    payload: dict[str, Any],
+    note: str,
+    now: str,
+    zset: Any,
+    source: str,
+) -> None:
+    """Write a just-created Zenodo draft (code, reserved DOI, environment)
+    to the archive and the audit log. Shared by the apply path and the
+    ``oa auto`` draft pipeline, which creates drafts off the DB thread."""
+    from oa_tracker import zenodo
+
+    pub_id = archive["publication_id"]
+    event_note = (
+        f"Zenodo draft {draft.record_id} created on {zset.environment}"
+        + (f"; reserved DOI {draft.doi}" if draft.doi else "; DOI reserve failed (minted at publish)")
+        + f" — {zenodo.summarize_payload(payload)}"
+    )
+    extra_fields: dict[str, Any] = {
+        "zenodo_code": draft.record_id,
+        "zenodo_code_overridden": 1,   # protect from scan re-seed
+        "zenodo_env": zset.environment,
+        "notes": _append_note(archive, note or event_note, now),
+    }
+    if draft.doi:
+        extra_fields["zenodo_doi"] = draft.doi
+    db.update_archive_status(conn, pub_id, new_status, **extra_fields)
+    db.insert_event(
+        conn, pub_id, "zenodo_create_draft", archive["status"], new_status, source,
+        pid=draft.doi, url=zenodo.record_ui_url(zset, draft.record_id),
+        note=event_note,
+    )
+
+
+def record_files_uploaded(
+    conn: sqlite3.Connection,
+    archive: dict,
+    res: Any,
+    note: str,
+    now: str,
+    source: str,
+) -> None:
+    """Write a successful draft upload (``zenodo.UploadResult``) to the
+    archive notes and the audit log. The status does not change."""
+    pub_id = archive["publication_id"]
+    db.upsert_archive(
+        conn, publication_id=pub_id,
+        notes=_append_note(archive, note or f"Zenodo upload: {res.summary}", now),
+    )
+    db.insert_event(
+        conn, pub_id, "zenodo_upload_files", archive["status"], archive["status"], source,
+        note=res.summary,
+    )
+
+
 def _apply_zenodo_row(
     conn: sqlite3.Connection,
     archive: dict,
@@ -475,42 +583,18 @@ def _apply_zenodo_row(
         client = zenodo.get_client(zset)
 
         if task_code == "zenodo_create_draft":
-            if archive.get("zenodo_code"):
+            refusal = draft_refusal(archive)
+            if refusal:
                 result.errors.append(
-                    f"{row_label} ({pub_id}): already has zenodo_code "
-                    f"{archive['zenodo_code']!r} — refusing to create a second draft. "
-                    "Run `oa action ... reset_zenodo_code` first if that code is stale."
+                    f"{row_label} ({pub_id}): {refusal} — refusing to create a second "
+                    "draft. Run `oa action ... reset_zenodo_code` first if that code is stale."
                 )
                 return (False, old_status, None)
             extras = zenodo.fetch_publication_extras(pub_id) if pub_id.isdigit() else {}
-            payload = zenodo.build_record_payload(
-                archive, zset,
-                abstract=extras.get("abstract"),
-                author_with_affiliation=extras.get("author_with_affiliation"),
-                author_fallback=extras.get("author"),
-                extra_biomagune_names=(
-                    [extras["first_author_name"]] if extras.get("first_author_name") else []
-                ),
-            )
+            payload = draft_payload(archive, zset, extras)
             draft = zenodo.create_draft(client, payload)
-            event_note = (
-                f"Zenodo draft {draft.record_id} created on {zset.environment}"
-                + (f"; reserved DOI {draft.doi}" if draft.doi else "; DOI reserve failed (minted at publish)")
-                + f" — {zenodo.summarize_payload(payload)}"
-            )
-            extra_fields: dict[str, Any] = {
-                "zenodo_code": draft.record_id,
-                "zenodo_code_overridden": 1,   # protect from scan re-seed
-                "zenodo_env": zset.environment,
-                "notes": _append_note(archive, note or event_note, now),
-            }
-            if draft.doi:
-                extra_fields["zenodo_doi"] = draft.doi
-            db.update_archive_status(conn, pub_id, new_status, **extra_fields)
-            db.insert_event(
-                conn, pub_id, task_code, old_status, new_status, source,
-                pid=draft.doi, url=zenodo.record_ui_url(zset, draft.record_id),
-                note=event_note,
+            record_draft_created(
+                conn, archive, new_status, draft, payload, note, now, zset, source,
             )
             result.applied += 1
             return (True, old_status, new_status)
@@ -537,18 +621,23 @@ def _apply_zenodo_row(
 
         if task_code == "zenodo_upload_files":
             from pathlib import Path as _P
-            res = zenodo.upload_files(client, str(code), _P(archive["folder_path"]), zset)
+            # Make earlier rows durable before a transfer that can run
+            # for hours — and release this transaction's write lock, which
+            # the progress connection would otherwise wait on.
+            conn.commit()
+            res = zenodo.upload_files(
+                client, str(code), _P(archive["folder_path"]), zset,
+                progress=DbUploadProgress(config.database),
+            )
             if not res.ok:
                 result.errors.append(f"{row_label} ({pub_id}): upload failed — {res.summary}")
                 return (False, old_status, None)
-            db.upsert_archive(
-                conn, publication_id=pub_id,
-                notes=_append_note(archive, note or f"Zenodo upload: {res.summary}", now),
-            )
-            db.insert_event(
-                conn, pub_id, task_code, old_status, old_status, source,
-                note=res.summary,
-            )
+            if res.deferred:
+                # Not done yet: no event, so the next in-window run retries
+                # (files already sent are recognised by checksum).
+                result.deferred.append(f"{row_label} ({pub_id}): {res.summary}")
+                return (False, old_status, None)
+            record_files_uploaded(conn, archive, res, note, now, source)
             result.applied += 1
             return (True, old_status, old_status)
 
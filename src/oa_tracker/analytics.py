@@ -0,0 +1,210 @@
+"""Pipeline flow metrics from the events log.
+
+Every status change is an event (``old_status → new_status`` at ``ts``),
+so the log already holds each archive's path through the pipeline. A
+single streaming pass over the events turns that into stage intervals —
+one row per stint of an archive in a status — cached in the
+``stage_intervals`` table. The cursor (the last event id replayed) lives
+in ``sync_state``, so each run replays only the events added since.
+
+From the intervals: per-stage dwell-time percentiles (how long archives
+sit in OPEN_ACTIVE, OPEN_ZENODO_DRAFT_VALIDATED, …), weekly throughput
+(archives closed for the first time per week) and weekly work in
+progress per stage.
+``oa report --metrics`` writes them to ``pipeline_metrics.md``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from oa_tracker import db, status as st
+from oa_tracker.config import Config
+
+# sync_state key for the last event folded into stage_intervals.
+CURSOR_KEY = "analytics.last_event_id"
+
+# Weeks shown in the throughput and work-in-progress tables.
+WEEKS = 12
+
+
+def update_intervals(conn: sqlite3.Connection) -> int:
+    """Fold events added since the last run into ``stage_intervals`` and
+    return how many status events were replayed.
+
+    An event whose ``new_status`` differs from the archive's current stage
+    ends that interval at the event's ``ts`` and opens one in the new
+    status. Events that leave the status as it was (reminders, notes) are
+    skipped. An archive first seen mid-history simply starts at its
+    first status event.
+    """
+    last = int(db.get_sync_state(conn, CURSOR_KEY) or 0)
+    current = db.get_open_stage_intervals(conn)
+    opened: dict[int, dict[str, Any]] = {}
+    left: list[tuple[str, int]] = []
+    replayed = 0
+    for ev in db.iter_status_events(conn, last):
+        replayed += 1
+        last = ev["event_id"]
+        pub_id, new = ev["publication_id"], ev["new_status"]
+        cur = current.get(pub_id)
+        if cur is not None and cur["stage"] == new:
+            continue
+        if cur is not None:
+            if cur["enter_event_id"] in opened:
+                cur["left_at"] = ev["ts"]
+            else:
+                left.append((ev["ts"], cur["enter_event_id"]))
+        cur = current[pub_id] = {
+            "enter_event_id": ev["event_id"], "publication_id": pub_id,
+            "stage": new, "entered_at": ev["ts"], "left_at": None,
+        }
+        opened[ev["event_id"]] = cur
+    if replayed:
+        db.save_stage_intervals(conn, opened.values(), left)
+        db.set_sync_state(conn, CURSOR_KEY, str(last))
+    return replayed
+
+
+@dataclass
+class StageStats:
+    """Dwell time in one stage, in days. Percentiles cover the intervals
+    that ended; ``wip``/``oldest`` describe archives in it now."""
+
+    stage: str
+    completed: int = 0
+    p50: float | None = None
+    p90: float | None = None
+    wip: int = 0
+    oldest: float | None = None
+
+
+@dataclass
+class PipelineMetrics:
+    stages: list[StageStats] = field(default_factory=list)
+    throughput: list[tuple[str, int]] = field(default_factory=list)      # (week, closed)
+    wip: list[tuple[str, dict[str, int]]] = field(default_factory=list)  # (week, per stage)
+
+    @property
+    def bottleneck(self) -> StageStats | None:
+        """The stage with the longest median dwell (ties: most in it now).
+        OPEN_INACTIVE waits on the author, not the pipeline, and is left out."""
+        timed = [s for s in self.stages if s.p50 is not None and s.stage != st.OPEN_INACTIVE]
+        return max(timed, key=lambda s: (s.p50, s.wip), default=None)
+
+
+def _days(start: str, end: str | datetime) -> float:
+    end_dt = end if isinstance(end, datetime) else datetime.fromisoformat(end)
+    return (end_dt - datetime.fromisoformat(start)).total_seconds() / 86400
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile of sorted ``values`` (0 ≤ q ≤ 1)."""
+    pos = (len(values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def _week_start(day: datetime) -> datetime:
+    monday = day - timedelta(days=day.weekday())
+    return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def compute_metrics(conn: sqlite3.Connection, now: datetime, weeks: int = WEEKS) -> PipelineMetrics:
+    """Metrics over the cached intervals (run ``update_intervals`` first)."""
+    metrics = PipelineMetrics()
+    by_stage = {s: StageStats(s) for s in st.PIPELINE_ORDER}
+    durations: dict[str, list[float]] = {s: [] for s in st.PIPELINE_ORDER}
+    for iv in db.get_stage_intervals(conn, st.PIPELINE_ORDER):
+        stats = by_stage[iv["stage"]]
+        if iv["left_at"] is None:
+            stats.wip += 1
+            age = _days(iv["entered_at"], now)
+            stats.oldest = age if stats.oldest is None else max(stats.oldest, age)
+        else:
+            durations[iv["stage"]].append(_days(iv["entered_at"], iv["left_at"]))
+    for stage, values in durations.items():
+        if values:
+            values.sort()
+            stats = by_stage[stage]
+            stats.completed = len(values)
+            stats.p50, stats.p90 = _percentile(values, 0.5), _percentile(values, 0.9)
+    metrics.stages = [by_stage[s] for s in st.PIPELINE_ORDER]
+
+    first = _week_start(now) - timedelta(weeks=weeks - 1)
+    starts = [first + timedelta(weeks=i) for i in range(weeks)]
+    closed = {w: 0 for w in starts}
+    since = first.isoformat(timespec="seconds")
+    # An archive counts once, in the week it first closed: a reopen and
+    # re-close (or a move between closed statuses) is not a new archive.
+    first_closed = db.get_first_stage_entries(conn, sorted(st.CLOSED_STATUSES), since)
+    for entered_at in first_closed.values():
+        week = _week_start(datetime.fromisoformat(entered_at))
+        if week in closed:
+            closed[week] += 1
+    metrics.throughput = [(w.date().isoformat(), closed[w]) for w in starts]
+
+    # Work in progress as of each week's end (the current week: now).
+    for w in starts:
+        at = min(w + timedelta(weeks=1), now).isoformat(timespec="seconds")
+        metrics.wip.append((w.date().isoformat(), db.count_stage_wip(conn, at)))
+    return metrics
+
+
+def _fmt(days: float | None) -> str:
+    return "—" if days is None else f"{days:.1f}"
+
+
+def render_metrics(metrics: PipelineMetrics, now: datetime) -> str:
+    lines = [f"# Pipeline Metrics — {now.strftime('%Y-%m-%d')}", ""]
+
+    lines.append("## Time in Stage (days)")
+    lines.append("| Stage | Completed | Median | P90 | In stage now | Oldest now |")
+    lines.append("|---|---:|---:|---:|---:|---:|")
+    for s in metrics.stages:
+        lines.append(f"| {s.stage} | {s.completed} | {_fmt(s.p50)} | {_fmt(s.p90)} "
+                     f"| {s.wip} | {_fmt(s.oldest)} |")
+    lines.append("")
+    neck = metrics.bottleneck
+    lines.append(
+        f"Bottleneck: **{neck.stage}** (median {_fmt(neck.p50)} days, {neck.wip} waiting)"
+        if neck else "Bottleneck: _not enough history yet_"
+    )
+    lines.append("")
+
+    lines.append("## Throughput (archives closed per week)")
+    lines.append("| Week of | Closed |")
+    lines.append("|---|---:|")
+    for week, n in metrics.throughput:
+        lines.append(f"| {week} | {n} |")
+    lines.append("")
+
+    lines.append("## Work in Progress (end of week)")
+    lines.append("| Week of | " + " | ".join(st.PIPELINE_ORDER) + " | Total open |")
+    lines.append("|---|" + "---:|" * (len(st.PIPELINE_ORDER) + 1))
+    for week, counts in metrics.wip:
+        row = [counts.get(s, 0) for s in st.PIPELINE_ORDER]
+        lines.append(f"| {week} | " + " | ".join(map(str, row)) + f" | {sum(row)} |")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _now() -> datetime:
+    return datetime.now()
+
+
+def generate_metrics(config: Config) -> Path:
+    """Bring the interval cache up to date and write pipeline_metrics.md."""
+    config.output_dir.mkdir(parents=True, exist_ok=True)
+    now = _now()
+    with db.get_connection(config.database) as conn:
+        update_intervals(conn)
+        metrics = compute_metrics(conn, now)
+    path = config.output_dir / "pipeline_metrics.md"
+    path.write_text(render_metrics(metrics, now))
+    return path
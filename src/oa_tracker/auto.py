@@ -14,8 +14,9 @@ recorded in the digest and the remaining stages still run):
    - auto-QC: OPEN_ACTIVE + Tracker "done" + detected package
      (``.zip`` + ``README.txt``) + data-required mandate → ``qa_pass``;
    - Zenodo: READY archives get a draft (metadata + reserved DOI) and the
-     package files uploaded — then STOP: validation and publish stay
-     operator-confirmed;
+     package files uploaded — several archives at once on a worker pool,
+     with every DB write kept on the main thread — then STOP: validation
+     and publish stay operator-confirmed;
    - closure: OPEN_DB_UPDATED + folder gone + PID on record →
      ``folder_removed`` (CLOSED_DATA_ARCHIVED).
 4. **Push** fresh statuses back to the List (+ closed-row reconcile).
@@ -34,8 +35,9 @@ resolves them.
 from __future__ import annotations
 
 import csv
+import urllib.error
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from oa_tracker import db, status as st
@@ -50,9 +52,13 @@ class AutoRunResult:
     manual_rows: list[str] = field(default_factory=list)
     mismatches: list[str] = field(default_factory=list)
     awaiting_operator: list[str] = field(default_factory=list)
+    scheduled: list[str] = field(default_factory=list)     # large uploads waiting for the window
     user_notes: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    sharepoint_pulled: str = ""
     sharepoint_pushed: str = ""
+    rate_limit_wait: str = ""
+    zenodo_requests: str = ""
 
     @property
     def summary(self) -> str:
@@ -76,6 +82,9 @@ class _SpContext:
     list_id: str
     name_for: dict
     items: dict
+    users: object = None            # sharepoint.UserDirectory
+    executor: object = None         # sharepoint.GraphExecutor
+    full: bool = False              # this run re-read the whole list
 
 
 def _pull_sharepoint(config: Config, result: AutoRunResult) -> _SpContext | None:
@@ -87,21 +96,96 @@ def _pull_sharepoint(config: Config, result: AutoRunResult) -> _SpContext | None
 
     sp = sp_mod.load_settings(config)
     client = sp_mod.GraphClient(sp, interactive=False)
-    site_id = client.get_site_id(sp.site)
-    lst = sp_mod.get_list(client, site_id, sp.list_name)
-    if lst is None:
+    executor = sp_mod.GraphExecutor(sp.max_concurrent_requests)
+
+    # Site id, list id and column map are cached between runs. The cached
+    # handle is validated by its first use (the delta read below); a 404 or
+    # 400 there, or a registry column missing from the map, rediscovers.
+    handle_key = f"sharepoint.list.{sp.site}|{sp.list_name}"
+    with db.get_connection(config.database) as conn:
+        handle = sp_mod.ListHandle.from_json(db.get_sync_state(conn, handle_key))
+    from_cache = handle is not None and handle.covers_registry()
+    if not from_cache:
+        handle = sp_mod.discover_list(client, sp)
+    if handle is None:
         result.errors.append(
             f"SharePoint list {sp.list_name!r} not provisioned — run `oa sharepoint provision`."
         )
         return None
-    list_id = lst["id"]
-    name_for = sp_mod.resolve_names(client, site_id, list_id)
-    items = sp_mod.fetch_items(client, site_id, list_id, name_for[sp_mod.D_PUBID])
-    user_details = client.resolve_user_details(site_id)
+
+    def read_delta(handle):
+        # Only rows changed since the last run come back; the rest of the
+        # list is the local mirror as of the stored delta link. Every
+        # full_resync_days the whole list is re-read instead, and the push
+        # compares every row, catching edits the local marks can't see.
+        key = f"sharepoint.delta_link.{handle.list_id}"
+        with db.get_connection(config.database) as conn:
+            link = db.get_sync_state(conn, key)
+            last_full = db.get_sync_state(conn, f"sharepoint.full_sync.{handle.list_id}")
+            mirror = db.get_sharepoint_items(conn, handle.list_id)
+        if _full_resync_due(last_full, sp.full_resync_days):
+            link = None
+        return key, mirror, sp_mod.fetch_delta(
+            client, handle.site_id, handle.list_id, link,
+            select=sp_mod.select_fields(handle.name_for, "sync"),
+        )
+
+    try:
+        delta_key, mirror, delta = read_delta(handle)
+    except urllib.error.HTTPError as e:
+        # 404: the list is gone (re-created under a new id). 400: Graph
+        # rejected a field in $select — a column deleted or renamed on the
+        # live list, which the cached map (registry-complete) can't show.
+        if not (from_cache and e.code in (400, 404)):
+            raise
+        handle = sp_mod.discover_list(client, sp)
+        if handle is None:
+            result.errors.append(
+                f"SharePoint list {sp.list_name!r} not provisioned — run `oa sharepoint provision`."
+            )
+            return None
+        if e.code == 400 and handle.missing:
+            result.errors.append(
+                f"SharePoint list {sp.list_name!r} is missing column(s) "
+                f"{', '.join(handle.missing)} — run `oa sharepoint provision`."
+            )
+            return None
+        delta_key, mirror, delta = read_delta(handle)
+    site_id, list_id, name_for = handle.site_id, handle.list_id, handle.name_for
+    pubid_field = name_for[sp_mod.D_PUBID]
+    previous = mirror
+    if delta.full:
+        mirror = {}
+    for it in delta.changed:
+        # Fresh fields; the local push/pull marks carry over.
+        prev = previous.get(str(it["id"])) or {}
+        mirror[str(it["id"])] = {
+            **it, **{k: prev[k] for k in ("pushed_hash", "pulled_sig") if k in prev},
+        }
+    for item_id in delta.removed:
+        mirror.pop(item_id, None)
+    items = sp_mod.items_by_pubid(mirror.values(), pubid_field)
+    result.sharepoint_pulled = (
+        f"{len(delta.changed)} changed, {len(delta.removed)} removed"
+        + (" (full resync)" if delta.full else "")
+    )
+    # One read of the site users per run, shared with the push; cached
+    # between runs and topped up incrementally.
+    users_key = f"sharepoint.users.{site_id}"
+    with db.get_connection(config.database) as conn:
+        cached_users = sp_mod.UserDirectory.from_json(db.get_sync_state(conn, users_key))
+    users = sp_mod.load_user_directory(
+        client, site_id, cached_users, datetime.now(), sp.user_cache_ttl_hours,
+    )
+    with db.get_connection(config.database) as conn:
+        db.set_sync_state(conn, users_key, users.to_json())
+    user_details = users.details()
     pulled = sp_mod.pull_proposals(list(items.values()), name_for, user_details)
 
     gates = config.automation
     tsv_rows: list[dict] = []
+    stamps: list[tuple] = []
+    ingested: list = []             # PulledItems whose signature is taken in
 
     with db.get_connection(config.database) as conn:
         archives = {a["publication_id"]: a for a in db.get_all_archives(conn)}
@@ -203,12 +287,24 @@ def _pull_sharepoint(config: Config, result: AutoRunResult) -> _SpContext | None
             if (pi.proposals and auto_ok)
             else None  # default behavior: pending when proposals, else sig only
         )
-        try:
-            sp_mod.write_proposal_feedback(
-                client, site_id, list_id, name_for, pi, request_status=status_label,
-            )
-        except Exception as e:  # feedback failure shouldn't lose the pull
-            result.errors.append(f"{pi.pub_id}: feedback stamp failed: {e}")
+        if pi.proposals or pi.user_notes:
+            stamps.append((pi, status_label))
+        else:
+            # Nothing for the user to see (an un-tick, a cleared field, our
+            # own create coming back): the local mark alone stops a re-pull.
+            ingested.append(pi)
+
+    # The stamps go out together (batched, concurrent) once routing is done.
+    try:
+        feedback = sp_mod.write_feedback_batch(
+            client, site_id, list_id, name_for, stamps, executor,
+        )
+        result.errors.extend(feedback.warnings)
+        ingested.extend(feedback.stamped)
+    except Exception as e:  # feedback failure shouldn't lose the pull
+        result.errors.append(f"feedback stamps failed: {e}")
+    for pi in ingested:
+        mirror[str(pi.item_id)]["pulled_sig"] = pi.new_sig
 
     if tsv_rows:
         config.output_dir.mkdir(parents=True, exist_ok=True)
@@ -220,7 +316,28 @@ def _pull_sharepoint(config: Config, result: AutoRunResult) -> _SpContext | None
                 w.writeheader()
             w.writerows(tsv_rows)
 
-    return _SpContext(client, site_id, list_id, name_for, items)
+    # Saved last: a run that fails above re-reads the same changes next time.
+    with db.get_connection(config.database) as conn:
+        db.apply_sharepoint_delta(
+            conn, list_id, delta.changed, delta.removed, pubid_field, full=delta.full,
+        )
+        db.save_sharepoint_items(
+            conn, list_id, [mirror[str(pi.item_id)] for pi in ingested], pubid_field,
+        )
+        db.set_sync_state(conn, delta_key, delta.delta_link or None)
+        if delta.full:
+            db.set_sync_state(conn, f"sharepoint.full_sync.{list_id}", _now())
+        db.set_sync_state(conn, handle_key, handle.to_json())
+
+    return _SpContext(client, site_id, list_id, name_for, items, users, executor, delta.full)
+
+
+def _full_resync_due(last_full: str | None, days: int) -> bool:
+    if days <= 0:
+        return False
+    if not last_full:
+        return True
+    return datetime.now() - datetime.fromisoformat(last_full) >= timedelta(days=days)
 
 
 def _push_sharepoint(config: Config, ctx: _SpContext, result: AutoRunResult) -> None:
@@ -231,17 +348,27 @@ def _push_sharepoint(config: Config, ctx: _SpContext, result: AutoRunResult) ->
     now = _now()
     with db.get_connection(config.database) as conn:
         archives = db.get_open_archives(conn)
-    email_to_lookup = ctx.client.resolve_users(ctx.site_id)
+    email_to_lookup = ctx.users.by_email()
+    # The pull's mirror stands in for a second full list fetch; the push
+    # keeps it current for the reconcile below.
+    items = ctx.items
     push = sp_mod.push_archives(
         ctx.client, ctx.site_id, ctx.list_id, sp, ctx.name_for,
-        email_to_lookup, archives, now,
+        email_to_lookup, archives, now, existing=items, executor=ctx.executor,
+        full=ctx.full,
+    )
+    with db.get_connection(config.database) as conn:
+        db.save_sharepoint_items(
+            conn, ctx.list_id, [items[p] for p in push.touched if p in items],
+            ctx.name_for[sp_mod.D_PUBID],
+        )
+    result.sharepoint_pushed = (
+        f"created {push.created}, updated {push.updated}, "
+        f"unchanged {push.skipped_unchanged}"
     )
-    result.sharepoint_pushed = f"created {push.created}, updated {push.updated}"
     result.errors.extend(push.errors)
 
     open_ids = {a["publication_id"] for a in archives}
-    items = sp_mod.fetch_items(ctx.client, ctx.site_id, ctx.list_id,
-                               ctx.name_for[sp_mod.D_PUBID])
     non_open = [pid for pid in items if pid not in open_ids]
     archive_by_id: dict = {}
     if non_open:
@@ -250,7 +377,7 @@ def _push_sharepoint(config: Config, ctx: _SpContext, result: AutoRunResult) ->
                 archive_by_id[pid] = db.get_archive(conn, pid)
     rec = sp_mod.reconcile_closed_rows(
         ctx.client, ctx.site_id, ctx.list_id, sp, ctx.name_for, items,
-        archive_by_id, now,
+        archive_by_id, now, executor=ctx.executor,
     )
     result.errors.extend(rec.warnings)
 
@@ -344,7 +471,9 @@ def _advance(config: Config, result: AutoRunResult) -> None:
                 "Tracker 'done' tick — QA manually or wait for confirmation"
             )
 
-    # 3c. Zenodo drafts + uploads for READY archives.
+    # 3c. Zenodo drafts + uploads for READY archives — concurrently on a
+    # worker pool (_zenodo_pipeline); the DB writes stay on this thread.
+    candidates: list[dict] = []
     if config.zenodo.enabled and gates.auto_zenodo_draft:
         with db.get_connection(config.database) as conn:
             ready = db.get_all_archives(conn, status_filter=st.OPEN_READY_FOR_ZENODO_DRAFT)
@@ -356,25 +485,12 @@ def _advance(config: Config, result: AutoRunResult) -> None:
                     "metadata) — create the draft manually"
                 )
                 continue
-            if a.get("zenodo_code"):
-                result.awaiting_operator.append(
-                    f"{pub_id}: ready for Zenodo but already has code "
-                    f"{a['zenodo_code']} — advance manually (zenodo_draft_created)"
-                )
-                continue
-            r, old_s, new_s = apply_single(
-                config, pub_id, "zenodo_create_draft", done=1,
-            )
-            if r.applied and not r.errors:
-                result.auto_applied.append(f"{pub_id}: Zenodo draft created ({old_s} → {new_s})")
-                if gates.auto_zenodo_upload:
-                    r2, _, _ = apply_single(config, pub_id, "zenodo_upload_files", done=1)
-                    if r2.applied and not r2.errors:
-                        result.auto_applied.append(f"{pub_id}: package uploaded to draft")
-                    else:
-                        result.errors.extend(r2.errors or [f"{pub_id}: upload did not apply"])
-            else:
-                result.errors.extend(r.errors or [f"{pub_id}: draft creation did not apply"])
+            candidates.append(a)
+        if candidates:
+            _zenodo_pipeline(config, candidates, result)
+    # Archives 3c already worked on this run — their upload, deferred or
+    # failed, has been reported; 3d leaves them to the next run.
+    handled = {a["publication_id"] for a in candidates}
 
     # 3d. Retry uploads for drafts created earlier whose upload never
     # succeeded (idempotent — checksummed against the draft's files).
@@ -383,6 +499,8 @@ def _advance(config: Config, result: AutoRunResult) -> None:
             created = db.get_all_archives(conn, status_filter=st.OPEN_ZENODO_DRAFT_CREATED)
             for a in created:
                 pub_id = a["publication_id"]
+                if pub_id in handled:
+                    continue
                 if not a.get("zenodo_code") or a.get("zenodo_env") != config.zenodo.environment:
                     continue
                 create_ev = db.get_last_event(conn, pub_id, "zenodo_create_draft")
@@ -394,6 +512,8 @@ def _advance(config: Config, result: AutoRunResult) -> None:
                 r, _, _ = apply_single(config, pub_id, "zenodo_upload_files", done=1)
                 if r.applied and not r.errors:
                     result.auto_applied.append(f"{pub_id}: package uploaded to draft (retry)")
+                elif r.deferred and not r.errors:
+                    result.scheduled.extend(r.deferred)
                 else:
                     result.errors.extend(r.errors or [f"{pub_id}: upload retry did not apply"])
                     # A retry failure means at least two runs have failed —
@@ -435,14 +555,190 @@ def _advance(config: Config, result: AutoRunResult) -> None:
                 )
 
 
+# ── Stage 3c: the Zenodo draft/upload pipeline ──────────────────────
+
+@dataclass
+class _ZenodoJob:
+    """One unit of pipeline work and its outcome (filled on a worker)."""
+    archive: dict
+    stage: str                      # "draft" | "upload"
+    payload: dict | None = None
+    draft: object = None            # zenodo.DraftInfo
+    upload: object = None           # zenodo.UploadResult
+    error: str = ""
+
+
+def _draft_job(client, archive: dict, payload: dict) -> _ZenodoJob:
+    """Worker: create the draft + reserve its DOI. No SQLite here — the
+    outcome is recorded by the main thread. Never raises: an escaping
+    exception would stop the loop before the other drafts in flight are
+    recorded."""
+    from oa_tracker import zenodo
+
+    job = _ZenodoJob(archive, "draft", payload=payload)
+    try:
+        job.draft = zenodo.create_draft(client, payload)
+    except zenodo.ZenodoError as e:
+        job.error = f"Zenodo [{e.kind}] {e}"
+    except Exception as e:
+        job.error = f"draft creation failed: {e}"
+    return job
+
+
+def _upload_job(client, zset, archive: dict, record_id: str, progress) -> _ZenodoJob:
+    """Worker: upload the package to a freshly created draft. Never
+    raises, like ``_draft_job``; step 3d of a later run retries."""
+    from oa_tracker import zenodo
+
+    job = _ZenodoJob(archive, "upload")
+    try:
+        job.upload = zenodo.upload_files(
+            client, record_id, Path(archive["folder_path"]), zset, progress=progress,
+        )
+    except zenodo.ZenodoError as e:
+        job.error = f"Zenodo [{e.kind}] {e}"
+    except Exception as e:
+        job.error = f"upload failed: {e}"
+    return job
+
+
+def _zenodo_pipeline(config: Config, candidates: list[dict], result: AutoRunResult) -> None:
+    """Draft + upload READY archives on a worker pool.
+
+    All draft payloads are built first, as one batch
+    (``zenodo.build_record_payloads``); the pool then only talks to the
+    API. Up to ``[zenodo] max_parallel_archives`` archives are in flight; API
+    pacing is shared through ``ratelimit``. Each draft is recorded (status,
+    code, reserved DOI, event) by this thread as soon as it exists —
+    before its upload starts — so a crash never leaves an unrecorded
+    draft behind. Writes are serial; digest lines keep the READY order.
+
+    Candidates are re-read and go through ``actions.draft_refusal``, the
+    check ``zenodo_create_draft`` applies, before anything is sent. If
+    recording an outcome fails, that archive gets an error line and the
+    pool keeps draining, so the other drafts in flight are still
+    recorded.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    from oa_tracker import zenodo
+    from oa_tracker.actions import (
+        DbUploadProgress,
+        draft_refusal,
+        record_draft_created,
+        record_files_uploaded,
+    )
+
+    with db.get_connection(config.database) as conn:
+        fresh = [db.get_archive(conn, a["publication_id"]) for a in candidates]
+    candidates = []
+    for a in fresh:
+        refusal = draft_refusal(a)
+        if refusal:
+            result.awaiting_operator.append(
+                f"{a['publication_id']}: ready for Zenodo but {refusal} — "
+                "advance manually (zenodo_draft_created)"
+            )
+        else:
+            candidates.append(a)
+    if not candidates:
+        return
+
+    zset = config.zenodo
+    upload = config.automation.auto_zenodo_upload
+    applied: dict[str, list[str]] = {a["publication_id"]: [] for a in candidates}
+    errors: dict[str, list[str]] = {a["publication_id"]: [] for a in candidates}
+    scheduled: dict[str, list[str]] = {a["publication_id"]: [] for a in candidates}
+    try:
+        client = zenodo.get_client(zset)
+    except zenodo.ZenodoError as e:
+        result.errors.extend(f"Action ({pid}): Zenodo [{e.kind}] {e}" for pid in errors)
+        return
+    progress = DbUploadProgress(config.database)
+    # Every READY payload is prepared up front, in one batch — one
+    # central-DB connection for all of their extras. Placeholder ids have
+    # no central-DB record (their payload degrades, as in actions.py).
+    extras = zenodo.fetch_publication_extras_bulk(
+        [a["publication_id"] for a in candidates if a["publication_id"].isdigit()]
+    )
+    payloads = zenodo.build_record_payloads(candidates, zset, extras)
+
+    with ThreadPoolExecutor(max_workers=max(1, zset.max_parallel_archives)) as pool:
+        pending = {
+            pool.submit(_draft_job, client, a, payloads[a["publication_id"]])
+            for a in candidates
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                job = fut.result()
+                pub_id = job.archive["publication_id"]
+                if job.error:
+                    errors[pub_id].append(f"Action ({pub_id}): {job.error}")
+                    continue
+                try:
+                    with db.get_connection(config.database) as conn:
+                        archive = db.get_archive(conn, pub_id)
+                        if job.stage == "draft":
+                            record_draft_created(
+                                conn, archive, st.OPEN_ZENODO_DRAFT_CREATED, job.draft,
+                                job.payload, "", _now(), zset, "cli",
+                            )
+                        elif job.upload.complete:
+                            record_files_uploaded(conn, archive, job.upload, "", _now(), "cli")
+                except Exception as e:
+                    # Keep draining: the other drafts in flight must still
+                    # be recorded. This one needs the operator.
+                    if job.stage == "draft":
+                        errors[pub_id].append(
+                            f"Action ({pub_id}): Zenodo draft {job.draft.record_id} was "
+                            f"created but recording it failed: {e} — record it with "
+                            f"`oa action {pub_id} set_zenodo_code --code "
+                            f"{job.draft.record_id}`, then zenodo_draft_created"
+                        )
+                    else:
+                        errors[pub_id].append(
+                            f"Action ({pub_id}): upload finished but recording it failed: {e}"
+                        )
+                    continue
+                if job.stage == "draft":
+                    applied[pub_id].append(
+                        f"{pub_id}: Zenodo draft created "
+                        f"({archive['status']} → {st.OPEN_ZENODO_DRAFT_CREATED})"
+                    )
+                    if upload:
+                        pending.add(pool.submit(
+                            _upload_job, client, zset, archive, job.draft.record_id, progress,
+                        ))
+                elif job.upload.complete:
+                    applied[pub_id].append(f"{pub_id}: package uploaded to draft")
+                elif job.upload.ok:
+                    # Big files wait for the upload window; step 3d of a
+                    # later run (not this one) picks the draft up again.
+                    scheduled[pub_id].append(f"{pub_id}: {job.upload.summary}")
+                else:
+                    errors[pub_id].append(
+                        f"Action ({pub_id}): upload failed — {job.upload.summary}"
+                    )
+
+    for a in candidates:
+        result.auto_applied.extend(applied[a["publication_id"]])
+        result.errors.extend(errors[a["publication_id"]])
+        result.scheduled.extend(scheduled[a["publication_id"]])
+
+
 # ── Orchestration + digest ───────────────────────────────────────────
 
 def run_auto(config: Config) -> AutoRunResult:
     """Run the full unattended cycle. Never raises for per-stage failures —
     everything lands in the digest."""
+    from oa_tracker import ratelimit, zenodo
     from oa_tracker.scanner import scan_folders
 
     result = AutoRunResult(started_at=_now())
+    ratelimit.reset_stats()
+    # Per-run Zenodo state cache: a fresh client (and cache) each run.
+    zenodo.reset_clients()
 
     # Unattended runs must never trip over a pending schema migration —
     # init_db is idempotent and brings the DB to the current version.
@@ -477,6 +773,8 @@ def run_auto(config: Config) -> AutoRunResult:
         except Exception as e:
             result.errors.append(f"SharePoint push failed: {e}")
 
+    result.rate_limit_wait = ratelimit.wait_report()
+    result.zenodo_requests = zenodo.request_report()
     return result
 
 
@@ -503,11 +801,18 @@ def write_digest(config: Config, result: AutoRunResult) -> Path:
                 result.manual_rows + result.mismatches, "nothing waiting"),
         section("Operator worklist (pipeline states only you can advance)",
                 result.awaiting_operator, "pipeline is idle"),
+        section("Scheduled for the large-upload window", result.scheduled, "nothing deferred"),
         section("User notes from the Tracker", result.user_notes, "none"),
         section("Errors", result.errors, "none"),
     ]
+    if result.sharepoint_pulled:
+        md.append(f"\nSharePoint pull: {result.sharepoint_pulled}\n")
     if result.sharepoint_pushed:
         md.append(f"\nSharePoint push: {result.sharepoint_pushed}\n")
+    if result.rate_limit_wait:
+        md.append(f"\nAPI rate limiting: {result.rate_limit_wait}\n")
+    if result.zenodo_requests:
+        md.append(f"\nZenodo requests: {result.zenodo_requests}\n")
     path.write_text("\n".join(md))
 
     # Append one line to the rolling log so cron runs leave a visible trail.
@@ -58,6 +58,10 @@ def scan(
 def report(
     config: Optional[str] = ConfigOption,
     db: Optional[str] = DbOption,
+    metrics: bool = typer.Option(
+        False, "--metrics",
+        help="Also write pipeline_metrics.md: time in stage, weekly throughput and WIP.",
+    ),
 ):
     """Generate the weekly report."""
     from oa_tracker.report import generate_report
@@ -65,6 +69,10 @@ def report(
     cfg = _get_config(config, db)
     path = generate_report(cfg)
     typer.echo(f"Report generated: {path}")
+    if metrics:
+        from oa_tracker.analytics import generate_metrics
+
+        typer.echo(f"Pipeline metrics: {generate_metrics(cfg)}")
 
 
 @app.command()
@@ -103,13 +111,15 @@ def emails(
     from oa_tracker.emails import generate_emails, pending_response_pubs
 
     cfg = _get_config(config, db)
-    paths = generate_emails(cfg)
-    if paths:
-        typer.echo(f"Generated {len(paths)} email draft(s):")
-        for p in paths:
+    result = generate_emails(cfg)
+    if result.paths:
+        typer.echo(f"Generated {len(result.paths)} email draft(s) ({result.summary}):")
+        for p in result.written:
             typer.echo(f"  {p}")
     else:
         typer.echo("No email drafts to generate.")
+    if result.removed:
+        typer.echo(f"Removed {len(result.removed)} stale draft(s).")
 
     pending = pending_response_pubs(cfg)
     if pending:
@@ -203,6 +213,8 @@ def action(
 
     for w in result.warnings:
         typer.echo(f"Warning: {w}")
+    for d in result.deferred:
+        typer.echo(f"Deferred: {d}")
     for e in result.errors:
         typer.echo(f"Error: {e}")
 
@@ -430,7 +442,8 @@ def sharepoint_sync(
     from datetime import datetime
     from oa_tracker import sharepoint as sp_mod
     from oa_tracker.db import (
-        get_archive, get_connection, get_open_archives, insert_event, upsert_archive,
+        get_archive, get_connection, get_open_archives, get_sharepoint_items, insert_event,
+        upsert_archive,
     )
     from oa_tracker.sheet import SHEET_COLUMNS, proposal_row
 
@@ -440,6 +453,7 @@ def sharepoint_sync(
         archives = get_open_archives(conn)
 
     client = sp_mod.GraphClient(sp)
+    executor = sp_mod.GraphExecutor(sp.max_concurrent_requests)
     site_id = client.get_site_id(sp.site)
 
     if read_only:
@@ -452,7 +466,12 @@ def sharepoint_sync(
         list_id = lst["id"]
         name_for = sp_mod.resolve_names(client, site_id, list_id)
         pubid = name_for.get(sp_mod.D_PUBID)
-        existing = sp_mod.fetch_items(client, site_id, list_id, pubid) if pubid else {}
+        existing = sp_mod.fetch_items(
+            client, site_id, list_id, pubid,
+            sp_mod.select_fields(name_for, "diff", "pull"),
+        ) if pubid else {}
+        with get_connection(cfg.database) as conn:
+            sp_mod.carry_pulled_sigs(existing.values(), get_sharepoint_items(conn, list_id))
         diff = sp_mod.diff_against_list(archives, existing, sp)
         pulled = sp_mod.pull_proposals(list(existing.values()), name_for) if pubid else []
         waiting = sum(len(p.proposals) for p in pulled)
@@ -475,7 +494,8 @@ def sharepoint_sync(
     email_to_lookup = client.resolve_users(site_id)
     now = datetime.now().isoformat(timespec="seconds")
     result = sp_mod.push_archives(
-        client, site_id, list_id, sp, name_for, email_to_lookup, archives, now
+        client, site_id, list_id, sp, name_for, email_to_lookup, archives, now,
+        executor=executor,
     )
     typer.echo(result.summary)
 
@@ -484,7 +504,13 @@ def sharepoint_sync(
     # proposal name the person and pre-fill the set_data_contact command.
     user_details = client.resolve_user_details(site_id)
     by_id = {a["publication_id"]: a for a in archives}
-    items = sp_mod.fetch_items(client, site_id, list_id, name_for[sp_mod.D_PUBID])
+    items = sp_mod.fetch_items(
+        client, site_id, list_id, name_for[sp_mod.D_PUBID],
+        sp_mod.select_fields(name_for, "pull", "reconcile"),
+    )
+    # Rows `oa auto` already took in locally (no IngestedSig stamp) stay quiet.
+    with get_connection(cfg.database) as conn:
+        sp_mod.carry_pulled_sigs(items.values(), get_sharepoint_items(conn, list_id))
     pulled = sp_mod.pull_proposals(list(items.values()), name_for, user_details)
 
     # Persist the "I think this is done" tick (set or cleared) on the
@@ -537,8 +563,10 @@ def sharepoint_sync(
     else:
         typer.echo("No new user proposals.")
     # Stamp IngestedSig (+ RequestStatus where actionable) so edits aren't re-emitted.
-    for pi in pulled:
-        sp_mod.write_proposal_feedback(client, site_id, list_id, name_for, pi)
+    for w in sp_mod.write_feedback_batch(
+        client, site_id, list_id, name_for, [(pi, None) for pi in pulled], executor,
+    ).warnings:
+        typer.echo(f"Warning: {w}")
 
     # Reconcile rows whose archive closed since the last sync: relabel to the
     # closed status once ("show Done"), then remove on the following sync (or
@@ -552,7 +580,8 @@ def sharepoint_sync(
             for pid in non_open:
                 archive_by_id[pid] = get_archive(conn, pid)
     rec = sp_mod.reconcile_closed_rows(
-        client, site_id, list_id, sp, name_for, items, archive_by_id, now
+        client, site_id, list_id, sp, name_for, items, archive_by_id, now,
+        executor=executor,
     )
     if rec.relabeled or rec.removed or rec.warnings:
         typer.echo(rec.summary)
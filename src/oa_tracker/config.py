@@ -29,6 +29,7 @@ class EmailSettings:
     sender_title: str = "Data Quality Officer"
     sender_email: str = ""          # used as the From header in .eml drafts; blank → omit From
     draft_format: str = "txt"       # "txt" | "eml" | "both"
+    render_workers: int = 4         # threads for big draft batches; 1 = render inline
 
 
 @dataclass
@@ -51,6 +52,16 @@ class SharePointSettings:
     # the Folder column links to the publication's SharePoint folder.
     folder_url_template: str = ""
     sync_closed: bool = False
+    # The site User Information List is cached locally (``oa auto``):
+    # newer entries are picked up each run via a Modified filter, and
+    # the whole list is re-read once the cache is this old.
+    user_cache_ttl_hours: int = 24
+    # Independent Graph writes ($batch calls) in flight at once; the
+    # shared rate limiter still paces them and pauses all on a 429.
+    max_concurrent_requests: int = 4
+    # ``oa auto`` diffs against its local mirror of the list; this often
+    # (days) it re-reads the whole list and compares every row instead.
+    full_resync_days: int = 7
     token_cache: Path = field(default_factory=lambda: Path("~/.oa_sharepoint_token.json"))
 
 
@@ -94,6 +105,19 @@ class ZenodoSettings:
     # and `oa action <pub> zenodo_upload_files` closes the loop after a
     # hand upload (checksum match — no bytes re-sent).
     single_put_max_mb: int = 5120
+    # ``oa auto`` step 3c: how many READY archives are drafted + uploaded
+    # at once (worker pool; DB writes stay serial on the main thread).
+    # 1 = the old one-at-a-time behavior.
+    max_parallel_archives: int = 3
+    # Upload bandwidth cap shared by every concurrent transfer
+    # (bytes/second; 0 = uncapped) so a bulk run leaves the office
+    # uplink usable.
+    upload_bytes_per_sec: int = 0
+    # Local-time window "HH:MM-HH:MM" (may wrap midnight) in which files
+    # above single_put_max_mb are sent unattended; outside it they are
+    # deferred to a later run, not handed to the operator. Empty = no
+    # window (the manual-upload rule above applies).
+    large_upload_window: str = ""
 
     @property
     def base_url(self) -> str:
@@ -216,6 +240,10 @@ def load_config(config_path: Path | None = None, project_root: Path | None = Non
             tracker_url=sp_raw.get("tracker_url", sp_defaults.tracker_url),
             folder_url_template=sp_raw.get("folder_url_template", sp_defaults.folder_url_template),
             sync_closed=sp_raw.get("sync_closed", sp_defaults.sync_closed),
+            user_cache_ttl_hours=sp_raw.get("user_cache_ttl_hours", sp_defaults.user_cache_ttl_hours),
+            max_concurrent_requests=sp_raw.get(
+                "max_concurrent_requests", sp_defaults.max_concurrent_requests),
+            full_resync_days=sp_raw.get("full_resync_days", sp_defaults.full_resync_days),
             token_cache=token_cache,
         ),
         email=EmailSettings(
@@ -223,6 +251,7 @@ def load_config(config_path: Path | None = None, project_root: Path | None = Non
             sender_title=email_raw.get("sender_title", email_defaults.sender_title),
             sender_email=email_raw.get("sender_email", email_defaults.sender_email),
             draft_format=email_raw.get("draft_format", email_defaults.draft_format),
+            render_workers=email_raw.get("render_workers", email_defaults.render_workers),
         ),
         zenodo=ZenodoSettings(
             enabled=zen_raw.get("enabled", zen_defaults.enabled),
@@ -239,6 +268,12 @@ def load_config(config_path: Path | None = None, project_root: Path | None = Non
                 "multipart_part_size_mb", zen_defaults.multipart_part_size_mb),
             single_put_max_mb=zen_raw.get(
                 "single_put_max_mb", zen_defaults.single_put_max_mb),
+            max_parallel_archives=zen_raw.get(
+                "max_parallel_archives", zen_defaults.max_parallel_archives),
+            upload_bytes_per_sec=zen_raw.get(
+                "upload_bytes_per_sec", zen_defaults.upload_bytes_per_sec),
+            large_upload_window=zen_raw.get(
+                "large_upload_window", zen_defaults.large_upload_window),
         ),
         automation=AutomationSettings(
             enabled=auto_raw.get("enabled", auto_defaults.enabled),
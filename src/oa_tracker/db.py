@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, Iterable
 
-_SCHEMA_VERSION = 5
+_SCHEMA_VERSION = 6
 
 _SCHEMA_SQL = """\
 CREATE TABLE IF NOT EXISTS schema_version (
@@ -83,6 +85,55 @@ CREATE TABLE IF NOT EXISTS events (
     note            TEXT,
     source          TEXT NOT NULL
 );
+
+-- v6: resumable multipart uploads — one row per part confirmed by the
+-- server, keyed by draft + file key. file_size/file_md5/part_size pin
+-- the local file the parts were cut from; a mismatch means start clean.
+CREATE TABLE IF NOT EXISTS upload_parts (
+    record_id       TEXT NOT NULL,
+    file_key        TEXT NOT NULL,
+    file_size       INTEGER NOT NULL,
+    file_md5        TEXT NOT NULL,
+    part_size       INTEGER NOT NULL,
+    part_number     INTEGER NOT NULL,
+    completed_at    TEXT NOT NULL,
+    PRIMARY KEY (record_id, file_key, part_number)
+);
+
+-- v6: local mirror of the SharePoint list as of the stored Graph delta
+-- link (fields is the item's JSON field set), and a small key/value
+-- table for sync bookkeeping such as that delta link. Per row, a hash
+-- of the system fields last pushed and the user signature last pulled
+-- — so the push and the pull diff locally instead of against a fresh
+-- fetch.
+CREATE TABLE IF NOT EXISTS sharepoint_items (
+    list_id         TEXT NOT NULL,
+    item_id         TEXT NOT NULL,
+    pub_id          TEXT,
+    fields          TEXT NOT NULL,
+    synced_at       TEXT NOT NULL,
+    pushed_hash     TEXT,
+    pulled_sig      TEXT,
+    PRIMARY KEY (list_id, item_id)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key             TEXT PRIMARY KEY,
+    value           TEXT,
+    updated_at      TEXT NOT NULL
+);
+
+-- v6: pipeline analytics cache — one row per stint of an archive in a
+-- status, replayed incrementally from events (analytics.py). The row is
+-- keyed by the event that entered the status; left_at stays NULL while
+-- the archive is still in it.
+CREATE TABLE IF NOT EXISTS stage_intervals (
+    enter_event_id  INTEGER PRIMARY KEY,
+    publication_id  TEXT NOT NULL,
+    stage           TEXT NOT NULL,
+    entered_at      TEXT NOT NULL,
+    left_at         TEXT
+);
 """
 
 # v1 → v2: ALTER TABLE adds for existing databases. Order matches the
@@ -138,6 +189,35 @@ _V4_TO_V5_ALTERS = [
     "ALTER TABLE archives ADD COLUMN package_has_manuscript INTEGER",
 ]
 
+# v5 → v6: upload_parts, sharepoint_items, sync_state and
+# stage_intervals. No ALTERs — new tables only, created by the CREATE
+# TABLE IF NOT EXISTS block above on every init_db. Analytics replays the
+# events log into stage_intervals on first use.
+
+
+# Lookup indexes for the set-based loaders (load_sheet_context, the
+# grouped event queries) and the report's per-section queries.
+# Idempotent, so no version bump: created on every init_db, after any
+# migration has added the columns they cover.
+_INDEXES = [
+    ("idx_events_pub_action", "events", ("publication_id", "action_code", "event_id")),
+    ("idx_events_action", "events", ("action_code", "publication_id")),
+    ("idx_events_ts", "events", ("ts",)),
+    ("idx_archives_status", "archives", ("status",)),
+    ("idx_archives_first_seen", "archives", ("first_seen_at",)),
+    ("idx_archives_became_active", "archives", ("became_active_at",)),
+    ("idx_stage_intervals_stage", "stage_intervals", ("stage", "entered_at")),
+]
+
+
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    columns: dict[str, set[str]] = {}
+    for name, table, cols in _INDEXES:
+        if table not in columns:
+            columns[table] = {r["name"] for r in conn.execute(f"PRAGMA table_info({table})")}
+        if set(cols) <= columns[table]:   # a partial legacy table may lack some
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(cols)})")
+
 
 def init_db(path: Path) -> None:
     """Create the database and tables; run any pending migrations."""
@@ -147,11 +227,11 @@ def init_db(path: Path) -> None:
         row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
         current = row[0] if row and row[0] is not None else 0
         if current == 0:
-            # Fresh database — CREATE TABLE already produced v2 schema.
+            # Fresh database — CREATE TABLE already produced the current schema.
             conn.execute("INSERT INTO schema_version (version) VALUES (?)", (_SCHEMA_VERSION,))
-            return
-        if current < _SCHEMA_VERSION:
+        elif current < _SCHEMA_VERSION:
             _migrate(conn, current)
+        _create_indexes(conn)
 
 
 def _migrate(conn: sqlite3.Connection, from_version: int) -> None:
@@ -277,6 +357,143 @@ def get_last_event(
     return dict(row) if row else None
 
 
+def get_last_event_ids(conn: sqlite3.Connection) -> dict[str, int]:
+    """Newest event id per open archive — a cheap "anything happened?"
+    signal for callers that cache per-archive work (the action sheet)."""
+    rows = conn.execute(
+        "SELECT e.publication_id, MAX(e.event_id) AS last_id FROM events e "
+        "JOIN archives a ON a.publication_id = e.publication_id "
+        "WHERE a.status LIKE 'OPEN_%' GROUP BY e.publication_id"
+    ).fetchall()
+    return {r["publication_id"]: r["last_id"] for r in rows}
+
+
+@dataclass
+class SheetContext:
+    """Everything the action sheet and the email drafts read about the
+    open archives, loaded in a fixed number of queries
+    (``load_sheet_context``) instead of per-archive event lookups."""
+
+    open_archives: list[dict[str, Any]] = field(default_factory=list)
+    reminders_due: list[dict[str, Any]] = field(default_factory=list)   # by next_reminder_at
+    pending_handovers: dict[str, dict[str, Any]] = field(default_factory=dict)
+    completion_sent: set[str] = field(default_factory=set)
+    last_event_ids: dict[str, int] = field(default_factory=dict)
+    recently_closed: list[dict[str, Any]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.due_ids = {a["publication_id"] for a in self.reminders_due}
+
+    def with_status(self, *statuses: str) -> list[dict[str, Any]]:
+        """Open archives in any of ``statuses``, by publication_id."""
+        return [a for a in self.open_archives if a["status"] in statuses]
+
+
+def load_sheet_context(
+    conn: sqlite3.Connection, now: str | None = None, closed_since: str | None = None,
+) -> SheetContext:
+    """Load a ``SheetContext``. ``now`` decides which reminders are due (as
+    ``get_reminders_due``); ``closed_since`` additionally loads the
+    CLOSED_DATA_ARCHIVED archives closed since then (the email drafts'
+    recent-closure window)."""
+    now = now or _now()
+    open_archives = get_open_archives(conn)
+    due = sorted(
+        (a for a in open_archives
+         if a.get("next_reminder_at") and a["next_reminder_at"] <= now),
+        key=lambda a: a["next_reminder_at"],
+    )
+    # The operative handover per archive: its newest data_contact_handover,
+    # unless a handover_sent came after it (see get_pending_handover).
+    handovers = conn.execute(
+        "SELECT e.* FROM events e JOIN ("
+        "  SELECT ev.publication_id, MAX(ev.event_id) AS event_id FROM events ev"
+        "  JOIN archives a ON a.publication_id = ev.publication_id"
+        "  WHERE ev.action_code = 'data_contact_handover' AND a.status LIKE 'OPEN_%'"
+        "  GROUP BY ev.publication_id"
+        ") h ON e.event_id = h.event_id "
+        "WHERE NOT EXISTS (SELECT 1 FROM events s WHERE s.publication_id = e.publication_id"
+        "  AND s.action_code = 'handover_sent' AND s.event_id > e.event_id)"
+    ).fetchall()
+    sent = conn.execute(
+        "SELECT DISTINCT e.publication_id FROM events e "
+        "JOIN archives a ON a.publication_id = e.publication_id "
+        "WHERE e.action_code = 'completion_sent' AND a.status LIKE 'OPEN_%'"
+    ).fetchall()
+    recently_closed: list[dict[str, Any]] = []
+    if closed_since is not None:
+        recently_closed = [dict(r) for r in conn.execute(
+            "SELECT * FROM archives a WHERE a.status = ? AND EXISTS ("
+            "  SELECT 1 FROM events e WHERE e.publication_id = a.publication_id"
+            "  AND e.new_status = ? AND e.ts >= ?) ORDER BY a.publication_id",
+            ("CLOSED_DATA_ARCHIVED", "CLOSED_DATA_ARCHIVED", closed_since),
+        ).fetchall()]
+    return SheetContext(
+        open_archives=open_archives,
+        reminders_due=due,
+        pending_handovers={r["publication_id"]: dict(r) for r in handovers},
+        completion_sent={r["publication_id"] for r in sent},
+        last_event_ids=get_last_event_ids(conn),
+        recently_closed=recently_closed,
+    )
+
+
+def get_sync_state(conn: sqlite3.Connection, key: str) -> str | None:
+    """A sync bookkeeping value (``None`` when never set)."""
+    row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else None
+
+
+# Per-row marks kept beside the mirrored fields (see the v6 schema note).
+SHAREPOINT_MARKS = ("pushed_hash", "pulled_sig")
+
+
+def get_sharepoint_items(conn: sqlite3.Connection, list_id: str) -> dict[str, dict[str, Any]]:
+    """The mirrored list: item id → ``{"id", "fields"}`` (the shape Graph
+    returns for an item with expanded fields), plus whichever of
+    ``SHAREPOINT_MARKS`` are set for the row."""
+    rows = conn.execute(
+        "SELECT item_id, fields, pushed_hash, pulled_sig "
+        "FROM sharepoint_items WHERE list_id = ?", (list_id,)
+    ).fetchall()
+    return {
+        r["item_id"]: {
+            "id": r["item_id"], "fields": json.loads(r["fields"]),
+            **{k: r[k] for k in SHAREPOINT_MARKS if r[k] is not None},
+        }
+        for r in rows
+    }
+
+
+def save_sharepoint_items(
+    conn: sqlite3.Connection,
+    list_id: str,
+    items: Iterable[dict[str, Any]],
+    pubid_field: str,
+) -> None:
+    """Write mirror rows as the push/pull left them: fields and marks."""
+    now = _now()
+    conn.executemany(
+        "INSERT INTO sharepoint_items "
+        "(list_id, item_id, pub_id, fields, synced_at, pushed_hash, pulled_sig) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (list_id, item_id) DO UPDATE SET pub_id = excluded.pub_id, "
+        "fields = excluded.fields, synced_at = excluded.synced_at, "
+        "pushed_hash = excluded.pushed_hash, pulled_sig = excluded.pulled_sig",
+        [
+            (list_id, str(it["id"]), _pub_id_of(it, pubid_field),
+             json.dumps(it.get("fields") or {}, sort_keys=True), now,
+             *(it.get(k) for k in SHAREPOINT_MARKS))
+            for it in items
+        ],
+    )
+
+
+def _pub_id_of(item: dict[str, Any], pubid_field: str) -> str | None:
+    value = (item.get("fields") or {}).get(pubid_field)
+    return None if value is None else str(value)
+
+
 def get_recent_events(conn: sqlite3.Connection, since: str) -> list[dict[str, Any]]:
     """Return events since a given ISO timestamp."""
     rows = conn.execute(
@@ -286,6 +503,148 @@ def get_recent_events(conn: sqlite3.Connection, since: str) -> list[dict[str, An
     return [dict(r) for r in rows]
 
 
+def get_upload_parts(
+    conn: sqlite3.Connection, record_id: str, file_key: str
+) -> list[dict[str, Any]]:
+    """Parts of an interrupted multipart upload already confirmed by the
+    server, in part order (empty when nothing is recorded)."""
+    rows = conn.execute(
+        "SELECT * FROM upload_parts WHERE record_id = ? AND file_key = ? "
+        "ORDER BY part_number",
+        (record_id, file_key),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+# ── Report queries ────────────────────────────────────────────────────
+#
+# One targeted query per weekly-report section, so the report reads what
+# it prints rather than the whole registry. Row order is publication_id,
+# as get_all_archives.
+
+def _archives(conn: sqlite3.Connection, where: str, params: tuple = ()) -> list[dict[str, Any]]:
+    rows = conn.execute(
+        f"SELECT * FROM archives WHERE {where} ORDER BY publication_id", params
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_archives_first_seen_since(conn: sqlite3.Connection, since: str) -> list[dict[str, Any]]:
+    """Archives first seen at or after ``since``."""
+    return _archives(conn, "first_seen_at >= ?", (since,))
+
+
+def get_archives_active_since(conn: sqlite3.Connection, since: str) -> list[dict[str, Any]]:
+    """Archives that became active at or after ``since``."""
+    return _archives(conn, "became_active_at >= ?", (since,))
+
+
+def get_archives_active_before(conn: sqlite3.Connection, before: str) -> list[dict[str, Any]]:
+    """OPEN_ACTIVE archives active since before ``before`` (stuck ones)."""
+    return _archives(
+        conn, "status = 'OPEN_ACTIVE' AND became_active_at != '' AND became_active_at < ?",
+        (before,),
+    )
+
+
+def get_open_missing_folder(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """OPEN archives whose folder disappeared unexpectedly."""
+    return _archives(conn, "status LIKE 'OPEN_%' AND unexpected_missing_folder != 0")
+
+
+def get_open_mandate_missing(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """OPEN archives whose pub-DB classification found no mandate."""
+    return _archives(conn, "status LIKE 'OPEN_%' AND oa_mandate_missing = 1")
+
+
+def get_archives_closed_since(conn: sqlite3.Connection, since: str) -> list[dict[str, Any]]:
+    """CLOSED archives with a closing event at or after ``since``."""
+    return _archives(
+        conn,
+        "status LIKE 'CLOSED_%' AND publication_id IN ("
+        "SELECT publication_id FROM events WHERE ts >= ? AND new_status LIKE 'CLOSED_%')",
+        (since,),
+    )
+
+
+def count_archives_by_status(conn: sqlite3.Connection) -> dict[str, int]:
+    """Archive count per status."""
+    rows = conn.execute("SELECT status, COUNT(*) AS n FROM archives GROUP BY status").fetchall()
+    return {r["status"]: r["n"] for r in rows}
+
+
+# ── Pipeline analytics ────────────────────────────────────────────────
+
+def iter_status_events(conn: sqlite3.Connection, after_event_id: int) -> Iterable[sqlite3.Row]:
+    """Status-changing events after ``after_event_id``, in event order —
+    streamed from the cursor, not loaded as a list."""
+    return conn.execute(
+        "SELECT event_id, ts, publication_id, old_status, new_status FROM events "
+        "WHERE event_id > ? AND new_status IS NOT NULL ORDER BY event_id",
+        (after_event_id,),
+    )
+
+
+def get_open_stage_intervals(conn: sqlite3.Connection) -> dict[str, dict[str, Any]]:
+    """The current (not yet left) interval per archive."""
+    rows = conn.execute("SELECT * FROM stage_intervals WHERE left_at IS NULL").fetchall()
+    return {r["publication_id"]: dict(r) for r in rows}
+
+
+def save_stage_intervals(
+    conn: sqlite3.Connection,
+    opened: Iterable[dict[str, Any]],
+    left: Iterable[tuple[str, int]],
+) -> None:
+    """Insert new intervals and close ``(left_at, enter_event_id)`` ones."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO stage_intervals "
+        "(enter_event_id, publication_id, stage, entered_at, left_at) "
+        "VALUES (:enter_event_id, :publication_id, :stage, :entered_at, :left_at)",
+        list(opened),
+    )
+    conn.executemany(
+        "UPDATE stage_intervals SET left_at = ? WHERE enter_event_id = ?", list(left)
+    )
+
+
+def get_stage_intervals(conn: sqlite3.Connection, stages: Iterable[str]) -> list[dict[str, Any]]:
+    """Intervals in any of ``stages``, in entry order."""
+    stages = list(stages)
+    marks = ", ".join("?" for _ in stages)
+    rows = conn.execute(
+        f"SELECT * FROM stage_intervals WHERE stage IN ({marks}) "
+        "ORDER BY entered_at, enter_event_id", stages,
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_first_stage_entries(
+    conn: sqlite3.Connection, stages: Iterable[str], entered_since: str | None = None,
+) -> dict[str, str]:
+    """Publication id → when it first entered any of ``stages``, for the
+    archives whose first entry is at or after ``entered_since``."""
+    stages = list(stages)
+    marks = ", ".join("?" for _ in stages)
+    sql = (f"SELECT publication_id, MIN(entered_at) AS entered_at FROM stage_intervals "
+           f"WHERE stage IN ({marks}) GROUP BY publication_id")
+    params: list[Any] = list(stages)
+    if entered_since is not None:
+        sql += " HAVING MIN(entered_at) >= ?"
+        params.append(entered_since)
+    return {r["publication_id"]: r["entered_at"] for r in conn.execute(sql, params)}
+
+
+def count_stage_wip(conn: sqlite3.Connection, at: str) -> dict[str, int]:
+    """Archives per stage at the instant ``at``."""
+    rows = conn.execute(
+        "SELECT stage, COUNT(*) AS n FROM stage_intervals "
+        "WHERE entered_at <= ? AND (left_at IS NULL OR left_at > ?) GROUP BY stage",
+        (at, at),
+    ).fetchall()
+    return {r["stage"]: r["n"] for r in rows}
+
+
 # ── Mutation helpers ──────────────────────────────────────────────────
 
 def upsert_archive(conn: sqlite3.Connection, **kwargs: Any) -> None:
@@ -329,6 +688,77 @@ def update_archive_status(
     )
 
 
+def record_upload_part(
+    conn: sqlite3.Connection,
+    record_id: str,
+    file_key: str,
+    file_size: int,
+    file_md5: str,
+    part_size: int,
+    part_number: int,
+) -> None:
+    """Remember one multipart part as uploaded (idempotent per part)."""
+    conn.execute(
+        "INSERT OR REPLACE INTO upload_parts (record_id, file_key, file_size, file_md5, "
+        "part_size, part_number, completed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (record_id, file_key, file_size, file_md5, part_size, part_number, _now()),
+    )
+
+
+def clear_upload_parts(conn: sqlite3.Connection, record_id: str, file_key: str) -> None:
+    """Forget the recorded parts of one file (committed, or restarting clean)."""
+    conn.execute(
+        "DELETE FROM upload_parts WHERE record_id = ? AND file_key = ?",
+        (record_id, file_key),
+    )
+
+
+def set_sync_state(conn: sqlite3.Connection, key: str, value: str | None) -> None:
+    """Set (or clear, with ``None``) a sync bookkeeping value."""
+    if value is None:
+        conn.execute("DELETE FROM sync_state WHERE key = ?", (key,))
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO sync_state (key, value, updated_at) VALUES (?, ?, ?)",
+        (key, value, _now()),
+    )
+
+
+def apply_sharepoint_delta(
+    conn: sqlite3.Connection,
+    list_id: str,
+    changed: list[dict[str, Any]],
+    removed: list[str],
+    pubid_field: str,
+    full: bool = False,
+) -> None:
+    """Fold one Graph delta round into the mirror. ``full`` (an initial or
+    resync round) replaces the list's rows instead of patching them. A
+    row's ``pushed_hash``/``pulled_sig`` survive its updates."""
+    if full:
+        keep = {str(it["id"]) for it in changed}
+        gone = [r[0] for r in conn.execute(
+            "SELECT item_id FROM sharepoint_items WHERE list_id = ?", (list_id,)
+        ) if r[0] not in keep]
+        removed = [*removed, *gone]
+    now = _now()
+    conn.executemany(
+        "INSERT INTO sharepoint_items (list_id, item_id, pub_id, fields, synced_at) "
+        "VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT (list_id, item_id) DO UPDATE SET pub_id = excluded.pub_id, "
+        "fields = excluded.fields, synced_at = excluded.synced_at",
+        [
+            (list_id, str(it["id"]), _pub_id_of(it, pubid_field),
+             json.dumps(it.get("fields") or {}, sort_keys=True), now)
+            for it in changed
+        ],
+    )
+    conn.executemany(
+        "DELETE FROM sharepoint_items WHERE list_id = ? AND item_id = ?",
+        [(list_id, str(iid)) for iid in removed],
+    )
+
+
 def insert_event(
     conn: sqlite3.Connection,
     publication_id: str,
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from email.message import EmailMessage
-from email.parser import Parser
 from pathlib import Path
 from string import Template
-from typing import Any
+from typing import Any, Callable
 
 from oa_tracker import db, status as st
 from oa_tracker.config import Config
+from oa_tracker.fileio import write_atomic
 
 
 # Window for re-generating completion drafts after closure. This catches
@@ -72,8 +76,93 @@ _TRACKER_URL = (
 )
 
 
-def _load_template(template_dir: Path, name: str) -> Template:
-    return Template((template_dir / name).read_text())
+@dataclass
+class _Draft:
+    """A rendered draft as parts: the header lines ahead of the first
+    blank line, the body, and the full text (the .txt draft)."""
+
+    headers: list[tuple[str, str]]
+    body: str
+    text: str
+
+    def header(self, name: str) -> str:
+        key = name.lower()
+        return next((v for n, v in self.headers if n.lower() == key), "")
+
+
+# One line of a template's header block: the header name (None for a line
+# that is not a header), the literal text ahead of the value, and the value.
+_HeaderSlot = tuple[str | None, str, Template]
+
+
+def _compile_head(head: str) -> list[_HeaderSlot]:
+    """Split a header block into ``Name: value`` slots, folded continuation
+    lines joined to their header's value."""
+    slots: list[_HeaderSlot] = []
+    for line in head.split("\n"):
+        if line[:1] in (" ", "\t") and slots and slots[-1][0] is not None:
+            name, prefix, value = slots[-1]
+            slots[-1] = (name, prefix, Template(f"{value.template}\n{line}"))
+        elif ":" in line:
+            name, _, value = line.partition(":")
+            gap = value[:len(value) - len(value.lstrip())]
+            slots.append((name.strip(), f"{name}:{gap}", Template(value.lstrip())))
+        else:
+            slots.append((None, "", Template(line)))
+    return slots
+
+
+class _CompiledTemplate:
+    """A draft template split once into its header lines and body, so a
+    render yields the headers and body directly — nothing is parsed after
+    substitution. A header whose value renders empty (the completion
+    notice's ``Cc:`` when there is no one to copy) is left out."""
+
+    def __init__(self, source: str):
+        self.full = Template(source)
+        head, sep, body = source.partition("\n\n")
+        self._head = _compile_head(head) if sep else None
+        self._body = Template(body) if sep else self.full
+
+    def safe_substitute(self, **vars_: str) -> str:
+        return self.full.safe_substitute(**vars_)
+
+    def render(self, **vars_: str) -> _Draft:
+        body = self._body.safe_substitute(**vars_)
+        if self._head is None:
+            return _Draft([], body, body)
+        headers: list[tuple[str, str]] = []
+        lines: list[str] = []
+        for name, prefix, value in self._head:
+            text = value.safe_substitute(**vars_)
+            if name is not None:
+                if not text.strip():
+                    continue
+                headers.append((name, text.strip()))
+            lines.append(prefix + text)
+        return _Draft(headers, body, "\n".join(lines) + "\n\n" + body)
+
+
+# Compiled templates by path, reused while the file's mtime and size hold.
+_TEMPLATES: dict[Path, tuple[tuple[int, int], _CompiledTemplate]] = {}
+
+
+def _load_template(
+    template_dir: Path, name: str, optional: bool = False,
+) -> _CompiledTemplate | None:
+    """The compiled template ``name``; ``None`` for a missing ``optional`` one."""
+    path = template_dir / name
+    try:
+        info = path.stat()
+    except FileNotFoundError:
+        if optional:
+            return None
+        raise
+    stamp = (info.st_mtime_ns, info.st_size)
+    hit = _TEMPLATES.get(path)
+    if hit is None or hit[0] != stamp:
+        hit = _TEMPLATES[path] = (stamp, _CompiledTemplate(path.read_text()))
+    return hit[1]
 
 
 def _friendly_status(status: str) -> str:
@@ -256,14 +345,14 @@ def _common_template_vars(archive: dict[str, Any], config: Config) -> dict[str,
     }
 
 
-def _cc_line(archive: dict[str, Any], data_contact_email: str) -> str:
-    """A ``Cc:`` header line for the corresponding author on completion
-    notices, or '' when there is no distinct CA to copy."""
+def _cc(archive: dict[str, Any], data_contact_email: str) -> str:
+    """The corresponding author to copy on completion notices, or '' when
+    there is no distinct CA to copy (the template's ``Cc:`` is then left out)."""
     email = (archive.get("corresponding_author_email") or "").strip()
     if not email or email.lower() == (data_contact_email or "").strip().lower():
         return ""
     name = archive.get("corresponding_author_name")
-    return f"Cc: {name} <{email}>\n" if name else f"Cc: {email}\n"
+    return f"{name} <{email}>" if name else email
 
 
 def pending_response_pubs(config: Config) -> set[str]:
@@ -285,13 +374,12 @@ def pending_response_pubs(config: Config) -> set[str]:
     return pubs
 
 
-def _render_eml(rendered: str, config: Config) -> bytes:
+def _render_eml(draft: _Draft, config: Config) -> bytes:
     """Turn a rendered draft (To/Cc/Subject headers, blank line, body) into a
     valid .eml so a double-click opens a pre-addressed draft in Outlook."""
-    parsed = Parser().parsestr(rendered)
     msg = EmailMessage()
     for header in ("To", "Cc", "Subject"):
-        value = parsed[header]
+        value = draft.header(header)
         if value:
             msg[header] = value
     if config.email.sender_email:
@@ -299,178 +387,305 @@ def _render_eml(rendered: str, config: Config) -> bytes:
             f"{config.email.sender_name} <{config.email.sender_email}>"
             if config.email.sender_name else config.email.sender_email
         )
-    msg.set_content(parsed.get_payload())
+    msg.set_content(draft.body)
     return msg.as_bytes()
 
 
-def _write_draft(base: Path, rendered: str, config: Config) -> list[Path]:
-    """Write a rendered draft per ``config.email.draft_format`` ("txt" | "eml"
-    | "both") and return the file(s) written. Unknown values fall back to txt."""
+@dataclass
+class EmailResult:
+    """Outcome of a ``generate_emails`` run. ``paths`` lists every current
+    draft and cheat sheet; each is either ``written`` (new or changed) or
+    ``unchanged`` (left untouched on disk). ``removed`` are stale files
+    pruned from the output directories."""
+
+    paths: list[Path] = field(default_factory=list)
+    written: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+
+    @property
+    def summary(self) -> str:
+        return (f"{len(self.written)} written, {len(self.unchanged)} unchanged, "
+                f"{len(self.removed)} removed")
+
+
+# (path, content, content to compare instead) — see _Outputs.write.
+_File = tuple[Path, bytes, "bytes | None"]
+
+# Below this many drafts a run renders inline; a thread pool only pays
+# off for the big reminder waves.
+_PARALLEL_MIN = 32
+
+# Generated file names, per output directory, that a run owns and may prune.
+_DRAFT_PREFIXES = ("reminder_", "completion_", "handover_")
+_DRAFT_SUFFIXES = (".txt", ".eml")
+
+
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+class _Outputs:
+    """Content-addressed writer for the generated files.
+
+    A file is rewritten only when its content changed: the output
+    directory is OneDrive-synced, and every rewrite is an upload. The
+    sidecar (``output/email_drafts.state.json``) records each file's
+    content hash with the size and mtime it was written at, so an
+    unchanged file is recognised without reading it back. Writes go
+    through ``write_atomic``, so a reader (or the sync client) never
+    sees half a draft.
+    """
+
+    def __init__(self, state_path: Path | None = None):
+        self.state_path = state_path
+        self.known: dict[str, dict] = {}
+        if state_path is not None:
+            try:
+                self.known = dict(json.loads(state_path.read_text()))
+            except (OSError, ValueError, TypeError):
+                self.known = {}
+        self.seen: dict[str, dict] = {}
+        self.result = EmailResult()
+
+    def write(self, path: Path, data: bytes, stable: bytes | None = None) -> None:
+        """Write ``data`` to ``path`` unless it already holds it. ``stable``
+        is the content to compare instead, for files that embed a
+        generation timestamp (the cheat sheet's ``Generated:`` line)."""
+        self._record(path, *self._put(path, data, stable))
+
+    def run(self, jobs: list[Callable[[], list[_File]]], workers: int = 1) -> None:
+        """Render and write ``jobs`` (each returns the files for one
+        draft), on up to ``workers`` threads once there are at least
+        ``_PARALLEL_MIN`` of them. Results are recorded in job order."""
+        def task(job: Callable[[], list[_File]]):
+            return [(f[0], *self._put(*f)) for f in job()]
+
+        if workers > 1 and len(jobs) >= _PARALLEL_MIN:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                done = list(pool.map(task, jobs))
+        else:
+            done = [task(job) for job in jobs]
+        for outcomes in done:
+            for outcome in outcomes:
+                self._record(*outcome)
+
+    def _put(self, path: Path, data: bytes, stable: bytes | None = None) -> tuple[bool, dict]:
+        digest = _sha1(stable if stable is not None else data)
+        written = not self._holds(path, digest, data if stable is None else None)
+        if written:
+            write_atomic(path, data)
+        info = path.stat()
+        return written, {"sha1": digest, "size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+    def _record(self, path: Path, written: bool, rec: dict) -> None:
+        self.result.paths.append(path)
+        (self.result.written if written else self.result.unchanged).append(path)
+        self.seen[str(path)] = rec
+
+    def _holds(self, path: Path, digest: str, data: bytes | None) -> bool:
+        try:
+            info = path.stat()
+        except OSError:
+            return False
+        rec = self.known.get(str(path))
+        if rec and (rec.get("size"), rec.get("mtime_ns")) == (info.st_size, info.st_mtime_ns):
+            return rec.get("sha1") == digest
+        # Unknown or touched since: only a byte-for-byte match counts.
+        return data is not None and info.st_size == len(data) and path.read_bytes() == data
+
+    def prune(self, directory: Path, keep) -> None:
+        """Remove generated files in ``directory`` (those ``keep`` accepts
+        by name) that this run did not produce."""
+        for path in sorted(directory.iterdir()):
+            if path.is_file() and keep(path.name) and str(path) not in self.seen:
+                path.unlink()
+                self.result.removed.append(path)
+
+    def save(self) -> None:
+        if self.state_path is None:
+            return
+        write_atomic(self.state_path, json.dumps(self.seen, indent=1, sort_keys=True))
+
+
+def _draft_files(base: Path, draft: _Draft, config: Config) -> list[_File]:
+    """The file(s) a draft is written to per ``config.email.draft_format``
+    ("txt" | "eml" | "both"). Unknown values fall back to txt."""
     fmt = (config.email.draft_format or "txt").lower()
-    written: list[Path] = []
+    if fmt not in ("txt", "eml", "both"):  # unrecognised format → safe fallback
+        fmt = "txt"
+    files: list[_File] = []
     if fmt in ("txt", "both"):
-        p = base.with_suffix(".txt")
-        p.write_text(rendered)
-        written.append(p)
+        files.append((base.with_suffix(".txt"), draft.text.encode("utf-8"), None))
     if fmt in ("eml", "both"):
-        p = base.with_suffix(".eml")
-        p.write_bytes(_render_eml(rendered, config))
-        written.append(p)
-    if not written:  # unrecognised format → safe fallback
-        p = base.with_suffix(".txt")
-        p.write_text(rendered)
-        written.append(p)
-    return written
-
-
-def generate_emails(config: Config) -> list[Path]:
-    """Generate reminder/completion drafts and Zenodo cheat sheets."""
+        files.append((base.with_suffix(".eml"), _render_eml(draft, config), None))
+    return files
+
+
+def _write_draft(
+    base: Path, draft: _Draft, config: Config, out: _Outputs | None = None,
+) -> list[Path]:
+    """Write a rendered draft per ``config.email.draft_format`` and return
+    the file(s) it now lives in. Unchanged files are left alone (see
+    ``_Outputs``)."""
+    out = out or _Outputs()
+    files = _draft_files(base, draft, config)
+    for f in files:
+        out.write(*f)
+    return [f[0] for f in files]
+
+
+def generate_emails(config: Config) -> EmailResult:
+    """Generate reminder/completion/handover drafts and Zenodo cheat sheets.
+
+    Only files whose content changed are written; drafts and cheat sheets
+    for archives that left the relevant state are removed."""
     drafts_dir = config.email_drafts_dir
     drafts_dir.mkdir(parents=True, exist_ok=True)
     cheat_dir = config.output_dir / "zenodo_cheat"
     cheat_dir.mkdir(parents=True, exist_ok=True)
-    generated: list[Path] = []
+    out = _Outputs(config.output_dir / "email_drafts.state.json")
     now_str = datetime.now().isoformat(timespec="seconds")
 
     reminder_tpl = _load_template(config.template_dir, "reminder.txt")
     completion_tpl = _load_template(config.template_dir, "completion.txt")
-    cheat_tpl_path = config.template_dir / "zenodo_cheat.txt"
-    cheat_tpl = Template(cheat_tpl_path.read_text()) if cheat_tpl_path.exists() else None
-    handover_tpl_path = config.template_dir / "handover.txt"
-    handover_tpl = (
-        Template(handover_tpl_path.read_text()) if handover_tpl_path.exists() else None
-    )
+    cheat_tpl = _load_template(config.template_dir, "zenodo_cheat.txt", optional=True)
+    handover_tpl = _load_template(config.template_dir, "handover.txt", optional=True)
+
+    # Variables are gathered here; rendering and writing each file is a
+    # job for _Outputs.run, which fans big batches out over threads.
+    jobs: list[Callable[[], list[_File]]] = []
+
+    def draft_job(tpl: _CompiledTemplate, stem: str, vars_: dict[str, str]) -> None:
+        jobs.append(lambda: _draft_files(drafts_dir / stem, tpl.render(**vars_), config))
 
     # Publications where the data contact already responded on the Tracker and
     # we haven't applied it yet — hold their reminders so we don't nag someone
     # who is waiting on us.
     pending = pending_response_pubs(config)
 
+    # The recent-closure window for completion drafts (step 2 below).
+    cutoff = (datetime.now() - timedelta(days=_RECENT_CLOSURE_DAYS)).isoformat(
+        timespec="seconds"
+    )
     with db.get_connection(config.database) as conn:
-        reminders_due = db.get_reminders_due(conn)
-        max_rem = config.reminders.max_reminders
-        for archive in reminders_due:
-            # Only author-owned phases get reminders. Once QA passes
-            # (OPEN_READY_FOR_ZENODO_DRAFT+) the remaining work is the
-            # operator's manual Zenodo/DB steps, not the author's, so we
-            # stop nagging the data contact even though it's still OPEN_*.
-            if archive["status"] not in _REMINDER_STATUSES:
-                continue
-            # Suppress reminders when the central mandate says data isn't
-            # actually required — same suppression rule the action sheet
-            # uses. The operator still sees the archive on the sheet.
-            if not _data_required(archive):
+        ctx = db.load_sheet_context(conn, now_str, closed_since=cutoff)
+
+    max_rem = config.reminders.max_reminders
+    for archive in ctx.reminders_due:
+        # Only author-owned phases get reminders. Once QA passes
+        # (OPEN_READY_FOR_ZENODO_DRAFT+) the remaining work is the
+        # operator's manual Zenodo/DB steps, not the author's, so we
+        # stop nagging the data contact even though it's still OPEN_*.
+        if archive["status"] not in _REMINDER_STATUSES:
+            continue
+        # Suppress reminders when the central mandate says data isn't
+        # actually required — same suppression rule the action sheet
+        # uses. The operator still sees the archive on the sheet.
+        if not _data_required(archive):
+            continue
+        pub_id = archive["publication_id"]
+        # Hold the reminder if a Tracker response for this publication is
+        # still awaiting operator review (see pending_response_pubs).
+        if pub_id in pending:
+            continue
+        # Manual-contact stage (reminder_count at/past max): the action
+        # sheet emits a contact_pi_manual row, and the draft here is the
+        # PAST-DUE variant — same template, marked past due — so the
+        # operator has a ready skeleton for the personal follow-up.
+        past_due = (archive.get("reminder_count") or 0) >= max_rem - 1
+        n = archive["reminder_count"] + 1
+        vars_ = _common_template_vars(archive, config)
+        vars_["reminder_number"] = str(n)
+        vars_["past_due_marker"] = "PAST DUE - " if past_due else ""
+        status_note = _reminder_status_note(archive)
+        if past_due:
+            status_note = (
+                "Please note: this request is now PAST DUE — the maximum "
+                f"number of scheduled reminders ({max_rem}) has been "
+                "reached without the deposit being completed. "
+            ) + status_note
+        vars_["status_note"] = status_note
+        stem = f"reminder_{pub_id}_{n}" + ("_PASTDUE" if past_due else "")
+        draft_job(reminder_tpl, stem, vars_)
+
+    def _write_completion_draft(archive: dict[str, Any]) -> None:
+        pub_id = archive["publication_id"]
+        vars_ = _common_template_vars(archive, config)
+        vars_["final_pid"] = archive.get("final_pid") or "(pending)"
+        vars_["final_url"] = archive.get("final_url") or "(pending)"
+        vars_["cc"] = _cc(archive, vars_["data_contact_email"])
+        draft_job(completion_tpl, f"completion_{pub_id}", vars_)
+
+    # 1) Archives published on Zenodo but not yet closed (either the
+    # published or the db-updated step) — operator is mid-flow and needs
+    # the email to send out. Skip any the operator already marked sent
+    # (completion_sent event): the sheet row and this draft clear
+    # together, mirroring handover_sent.
+    for status in (st.OPEN_ZENODO_PUBLISHED, st.OPEN_DB_UPDATED):
+        for archive in ctx.with_status(status):
+            if archive["publication_id"] in ctx.completion_sent:
                 continue
-            pub_id = archive["publication_id"]
-            # Hold the reminder if a Tracker response for this publication is
-            # still awaiting operator review (see pending_response_pubs).
-            if pub_id in pending:
-                continue
-            # Manual-contact stage (reminder_count at/past max): the action
-            # sheet emits a contact_pi_manual row, and the draft here is the
-            # PAST-DUE variant — same template, marked past due — so the
-            # operator has a ready skeleton for the personal follow-up.
-            past_due = (archive.get("reminder_count") or 0) >= max_rem - 1
-            n = archive["reminder_count"] + 1
-            vars_ = _common_template_vars(archive, config)
-            vars_["reminder_number"] = str(n)
-            vars_["past_due_marker"] = "PAST DUE - " if past_due else ""
-            status_note = _reminder_status_note(archive)
-            if past_due:
-                status_note = (
-                    "Please note: this request is now PAST DUE — the maximum "
-                    f"number of scheduled reminders ({max_rem}) has been "
-                    "reached without the deposit being completed. "
-                ) + status_note
-            vars_["status_note"] = status_note
-            stem = f"reminder_{pub_id}_{n}" + ("_PASTDUE" if past_due else "")
-            content = reminder_tpl.safe_substitute(**vars_)
-            generated.extend(
-                _write_draft(drafts_dir / stem, content, config)
-            )
+            _write_completion_draft(archive)
 
-        def _write_completion_draft(archive: dict[str, Any]) -> None:
+    # 2) Archives that were fully closed (CLOSED_DATA_ARCHIVED) in the
+    # recent window. Covers the done=2 shortcut path where the
+    # archive jumps straight to closed without going through
+    # OPEN_ZENODO_PUBLISHED. We use the events log to find the
+    # closure timestamp because `last_changed_at` isn't always
+    # updated on closure events (full_closure / folder_removed don't
+    # touch it). After _RECENT_CLOSURE_DAYS the draft stops
+    # regenerating; if the operator still needs it later they can
+    # craft the email by hand from the archive's recorded
+    # final_pid/final_url.
+    for archive in ctx.recently_closed:
+        if not archive.get("final_pid"):
+            continue  # nothing to communicate to the data contact
+        _write_completion_draft(archive)
+
+    # Handover notices — one per OPEN archive with a pending
+    # data-contact handover (auto-applied reassignment not yet
+    # announced). Regenerates every run until the operator applies
+    # the sheet's handover_sent row, so the draft always reflects
+    # the current archive state and contact.
+    if handover_tpl is not None:
+        for archive in ctx.open_archives:
             pub_id = archive["publication_id"]
+            handover = ctx.pending_handovers.get(pub_id)
+            if handover is None:
+                continue
+            previous = (handover.get("note") or "").strip()
             vars_ = _common_template_vars(archive, config)
-            vars_["final_pid"] = archive.get("final_pid") or "(pending)"
-            vars_["final_url"] = archive.get("final_url") or "(pending)"
-            vars_["cc_line"] = _cc_line(archive, vars_["data_contact_email"])
-            content = completion_tpl.safe_substitute(**vars_)
-            generated.extend(
-                _write_draft(drafts_dir / f"completion_{pub_id}", content, config)
+            vars_["handover_line"] = (
+                f"The previous data contact, {previous}, has handed this "
+                "responsibility over to you."
+                if previous else
+                "You are the first assigned data contact for this "
+                "publication."
             )
-
-        # 1) Archives published on Zenodo but not yet closed (either the
-        # published or the db-updated step) — operator is mid-flow and needs
-        # the email to send out. Skip any the operator already marked sent
-        # (completion_sent event): the sheet row and this draft clear
-        # together, mirroring handover_sent.
-        for status in (st.OPEN_ZENODO_PUBLISHED, st.OPEN_DB_UPDATED):
-            for archive in db.get_all_archives(conn, status_filter=status):
-                if db.get_last_event(conn, archive["publication_id"], "completion_sent") is not None:
-                    continue
-                _write_completion_draft(archive)
-
-        # 2) Archives that were fully closed (CLOSED_DATA_ARCHIVED) in the
-        # recent window. Covers the done=2 shortcut path where the
-        # archive jumps straight to closed without going through
-        # OPEN_ZENODO_PUBLISHED. We use the events log to find the
-        # closure timestamp because `last_changed_at` isn't always
-        # updated on closure events (full_closure / folder_removed don't
-        # touch it). After _RECENT_CLOSURE_DAYS the draft stops
-        # regenerating; if the operator still needs it later they can
-        # craft the email by hand from the archive's recorded
-        # final_pid/final_url.
-        cutoff = (datetime.now() - timedelta(days=_RECENT_CLOSURE_DAYS)).isoformat(
-            timespec="seconds"
-        )
-        recent_close_events = db.get_recent_events(conn, cutoff)
-        recently_closed_pubs = {
-            e["publication_id"] for e in recent_close_events
-            if e["new_status"] == st.CLOSED_DATA_ARCHIVED
-        }
-        for archive in db.get_all_archives(conn, status_filter=st.CLOSED_DATA_ARCHIVED):
-            if archive["publication_id"] not in recently_closed_pubs:
-                continue
-            if not archive.get("final_pid"):
-                continue  # nothing to communicate to the data contact
-            _write_completion_draft(archive)
-
-        # Handover notices — one per OPEN archive with a pending
-        # data-contact handover (auto-applied reassignment not yet
-        # announced). Regenerates every run until the operator applies
-        # the sheet's handover_sent row, so the draft always reflects
-        # the current archive state and contact.
-        if handover_tpl is not None:
-            for archive in db.get_open_archives(conn):
-                pub_id = archive["publication_id"]
-                handover = db.get_pending_handover(conn, pub_id)
-                if handover is None:
-                    continue
-                previous = (handover.get("note") or "").strip()
-                vars_ = _common_template_vars(archive, config)
-                vars_["handover_line"] = (
-                    f"The previous data contact, {previous}, has handed this "
-                    "responsibility over to you."
-                    if previous else
-                    "You are the first assigned data contact for this "
-                    "publication."
-                )
-                content = handover_tpl.safe_substitute(**vars_)
-                generated.extend(
-                    _write_draft(drafts_dir / f"handover_{pub_id}", content, config)
-                )
-
-        # Zenodo cheat sheets — one per archive in any draft-stage status.
-        if cheat_tpl is not None:
-            for status in _CHEAT_STATUSES:
-                for archive in db.get_all_archives(conn, status_filter=status):
-                    pub_id = archive["publication_id"]
-                    cheat_path = cheat_dir / f"{pub_id}.txt"
-                    content = cheat_tpl.safe_substitute(
-                        **_cheat_template_vars(archive, now_str, config)
-                    )
-                    cheat_path.write_text(content)
-                    generated.append(cheat_path)
-
-    return generated
+            draft_job(handover_tpl, f"handover_{pub_id}", vars_)
+
+    # Zenodo cheat sheets — one per archive in any draft-stage status.
+    if cheat_tpl is not None:
+        for status in _CHEAT_STATUSES:
+            for archive in ctx.with_status(status):
+                path = cheat_dir / f"{archive['publication_id']}.txt"
+                vars_ = _cheat_template_vars(archive, now_str, config)
+                # Compared without its Generated: stamp, so the stamp
+                # dates the last real change.
+                jobs.append(lambda path=path, vars_=vars_: [(
+                    path, cheat_tpl.safe_substitute(**vars_).encode("utf-8"),
+                    cheat_tpl.safe_substitute(**{**vars_, "generated_at": ""}).encode("utf-8"),
+                )])
+
+    out.run(jobs, config.email.render_workers)
+
+    # Prune what this run no longer produces. A missing optional template
+    # is not a reason to delete that kind of file.
+    prefixes = _DRAFT_PREFIXES if handover_tpl is not None else _DRAFT_PREFIXES[:2]
+    out.prune(drafts_dir, lambda name: name.startswith(prefixes)
+              and name.endswith(_DRAFT_SUFFIXES))
+    if cheat_tpl is not None:
+        out.prune(cheat_dir, lambda name: name.endswith(".txt") and not name.startswith("."))
+    out.save()
+    return out.result
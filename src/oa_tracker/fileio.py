@@ -0,0 +1,20 @@
+"""Small file helpers shared by the writers of generated files and caches."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes | str) -> None:
+    """Replace ``path`` with ``data`` in one step: write a temp file beside
+    it, then ``os.replace``. A reader (or the OneDrive sync client) never
+    sees half a file. The temp name carries the process and thread, so
+    concurrent writers never share one. Text is written as UTF-8, with no
+    newline translation."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
@@ -0,0 +1,334 @@
+"""Adaptive per-host rate limiting shared by the Zenodo and Graph clients.
+
+One ``HostLimiter`` per API host, process-wide — every client object and
+every worker thread talking to the same host draws on one budget:
+
+  * a token bucket paces requests under the host's documented limit
+    (Zenodo: 100 req/min for authenticated users);
+  * a ``Retry-After`` (429/503) or an exhausted ``X-RateLimit-Remaining``
+    blocks *every* caller until the reset — not just the request that
+    was throttled, which is what made concurrent callers hammer and stall;
+  * concurrency adapts AIMD-style: halved on each 429, grown back by one
+    after a run of clean responses, never above the host's ceiling.
+    Streamed upload bodies take a token but no concurrency slot — a
+    transfer can run for hours, and API calls must not queue behind it.
+
+The clients keep their own retry policy for 5xx/connection errors; this
+module only decides *when* a request may go out. Upload bodies also draw
+on a process-wide byte budget (``upload_bandwidth``). Time spent waiting
+is accumulated and reported in the ``oa auto`` digest.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterator
+
+# A throttled request is retried after the limiter's pause; this caps how
+# many 429s one request absorbs before the client gives up (separate from
+# the 3-attempt budget for 5xx/connection errors).
+MAX_THROTTLE_RETRIES = 8
+
+# Clean responses needed before concurrency grows back by one.
+_GROW_AFTER = 20
+
+
+@dataclass(frozen=True)
+class _Budget:
+    rate: float              # sustained requests per second
+    burst: int               # bucket size
+    max_concurrency: int     # in-flight ceiling
+    default_pause: float     # seconds to back off on a 429 without Retry-After
+
+
+_HOST_BUDGETS = {
+    # Zenodo's stated authenticated limits: 100 req/min, 5000 req/hour.
+    "zenodo.org": _Budget(100 / 60, 10, 4, 10.0),
+    "sandbox.zenodo.org": _Budget(100 / 60, 10, 4, 10.0),
+    # Graph publishes no fixed number for SharePoint; stay well below the
+    # per-app ceiling and let 429s shape the rest.
+    "graph.microsoft.com": _Budget(10.0, 20, 4, 5.0),
+}
+_DEFAULT_BUDGET = _Budget(10.0, 20, 4, 5.0)
+
+
+def _header(headers: Any, name: str) -> str | None:
+    if headers is None:
+        return None
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    return str(value).strip() if value is not None else None
+
+
+def _retry_after(headers: Any, wall: Callable[[], float]) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP-date)."""
+    raw = _header(headers, "Retry-After")
+    if not raw:
+        return None
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(raw).timestamp() - wall(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _exhausted_reset(headers: Any, wall: Callable[[], float]) -> float | None:
+    """Seconds until the window resets, when the response says the
+    remaining budget is zero. ``X-RateLimit-Reset`` is an epoch timestamp
+    (Zenodo); the IETF ``RateLimit-Reset`` is a delta."""
+    for remaining_h, reset_h in (("X-RateLimit-Remaining", "X-RateLimit-Reset"),
+                                 ("RateLimit-Remaining", "RateLimit-Reset")):
+        remaining = _header(headers, remaining_h)
+        if remaining is None:
+            continue
+        try:
+            if int(float(remaining)) > 0:
+                return None
+            reset = float(_header(headers, reset_h) or "")
+        except ValueError:
+            return None
+        # Large values are epoch seconds, small ones already a delta.
+        return max(reset - wall(), 0.0) if reset > 10**9 else max(reset, 0.0)
+    return None
+
+
+class _Seen:
+    """What the request saw — filled in by the caller, read on release."""
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.headers: Any = None
+
+    def record(self, status: int | None, headers: Any) -> None:
+        self.status, self.headers = status, headers
+
+
+class HostLimiter:
+    """Token bucket + shared pause + adaptive concurrency for one host."""
+
+    def __init__(
+        self,
+        host: str,
+        budget: _Budget = _DEFAULT_BUDGET,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        wall: Callable[[], float] = time.time,
+    ):
+        self.host = host
+        self.budget = budget
+        self.concurrency = budget.max_concurrency
+        self._clock = clock
+        self._sleep = sleep
+        self._wall = wall
+        self._tokens = float(budget.burst)
+        self._refilled_at = clock()
+        self._blocked_until = 0.0
+        self._in_flight = 0
+        self._clean = 0
+        self._cond = threading.Condition()
+        self.waited = 0.0
+        self.requests = 0
+        self.throttles = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(self.budget.burst, self._tokens + elapsed * self.budget.rate)
+            self._refilled_at = now
+
+    def acquire(self, hold: bool = True) -> None:
+        """Block until a request may go out: a free concurrency slot, no
+        host-wide pause in force, and a token in the bucket. With
+        ``hold=False`` no slot is needed or taken (see ``slot``)."""
+        started: float | None = None
+        with self._cond:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                delay: float | None = None
+                if not hold or self._in_flight < self.concurrency:
+                    delay = max(self._blocked_until - now, 0.0)
+                    if self._tokens < 1:
+                        delay = max(delay, (1 - self._tokens) / self.budget.rate)
+                    if delay <= 0:
+                        self._tokens -= 1
+                        if hold:
+                            self._in_flight += 1
+                        self.requests += 1
+                        break
+                if started is None:
+                    started = now
+                if delay is None:
+                    self._cond.wait(timeout=1.0)   # release() notifies
+                else:
+                    self._cond.release()
+                    try:
+                        self._sleep(delay)
+                    finally:
+                        self._cond.acquire()
+            if started is not None:
+                self.waited += self._clock() - started
+
+    def release(self, status: int | None, headers: Any = None) -> None:
+        """Free the slot and learn from the response."""
+        with self._cond:
+            self._in_flight = max(self._in_flight - 1, 0)
+            self._learn(status, headers)
+
+    def observe(self, status: int | None, headers: Any = None) -> None:
+        """Learn from a response that did not hold its own slot — a
+        sub-response inside a JSON batch."""
+        with self._cond:
+            self._learn(status, headers)
+
+    def _learn(self, status: int | None, headers: Any) -> None:
+        # Caller holds self._cond.
+        pause: float | None = None
+        if status in (429, 503):
+            pause = _retry_after(headers, self._wall)
+        if status == 429:
+            self.throttles += 1
+            self.concurrency = max(1, self.concurrency // 2)
+            self._clean = 0
+            if pause is None:
+                pause = self.budget.default_pause
+        elif status is not None and status < 400:
+            self._clean += 1
+            if self._clean >= _GROW_AFTER and self.concurrency < self.budget.max_concurrency:
+                self.concurrency += 1
+                self._clean = 0
+        reset = _exhausted_reset(headers, self._wall)
+        if reset is not None:
+            pause = max(pause or 0.0, reset)
+        if pause:
+            self._blocked_until = max(self._blocked_until, self._clock() + pause)
+        self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, hold: bool = True) -> Iterator[_Seen]:
+        """``acquire`` … ``release`` around one request; the caller records
+        the status + headers it got on the yielded object.
+
+        ``hold=False`` is for streamed upload bodies: the request is paced
+        (token, host-wide pause) and its response still teaches the
+        limiter, but it occupies no concurrency slot while the body
+        streams — bandwidth is ``BandwidthLimiter``'s job."""
+        self.acquire(hold)
+        seen = _Seen()
+        try:
+            yield seen
+        finally:
+            if hold:
+                self.release(seen.status, seen.headers)
+            else:
+                self.observe(seen.status, seen.headers)
+
+
+class BandwidthLimiter:
+    """Token bucket in bytes, shared by every upload body in the process.
+
+    Callers reserve bytes as they read them and sleep off their share of
+    any debt, so N concurrent uploads together stay at ``bytes_per_sec``
+    (one second's worth may go out as a burst).
+    """
+
+    def __init__(
+        self,
+        bytes_per_sec: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = float(bytes_per_sec)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.rate
+        self._refilled_at = clock()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def consume(self, n: int) -> None:
+        """Account for ``n`` bytes about to be sent; block to stay in budget."""
+        if n <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.rate, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            self._tokens -= n
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += delay
+        if delay > 0:
+            self._sleep(delay)
+
+
+_LIMITERS: dict[str, HostLimiter] = {}
+_BANDWIDTH: dict[int, BandwidthLimiter] = {}
+_LOCK = threading.Lock()
+
+
+def upload_bandwidth(bytes_per_sec: int) -> BandwidthLimiter | None:
+    """The process-wide upload budget for a configured cap (``None`` when
+    uncapped). Concurrent uploads with the same cap share one bucket."""
+    if not bytes_per_sec or bytes_per_sec <= 0:
+        return None
+    with _LOCK:
+        limiter = _BANDWIDTH.get(bytes_per_sec)
+        if limiter is None:
+            limiter = _BANDWIDTH[bytes_per_sec] = BandwidthLimiter(bytes_per_sec)
+        return limiter
+
+
+def limiter_for(url: str) -> HostLimiter:
+    """The process-wide limiter for the URL's host."""
+    host = (urllib.parse.urlsplit(url).hostname or "").lower()
+    with _LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = HostLimiter(host, _HOST_BUDGETS.get(host, _DEFAULT_BUDGET))
+            _LIMITERS[host] = limiter
+        return limiter
+
+
+def reset_stats() -> None:
+    """Zero the per-host counters (start of an ``oa auto`` run)."""
+    with _LOCK:
+        for limiter in _LIMITERS.values():
+            with limiter._cond:
+                limiter.waited = 0.0
+                limiter.requests = 0
+                limiter.throttles = 0
+        for bw in _BANDWIDTH.values():
+            with bw._lock:
+                bw.waited = 0.0
+
+
+def wait_report() -> str:
+    """One line for the digest: wait time per host, or ``no waits``."""
+    with _LOCK:
+        limiters = sorted(_LIMITERS.values(), key=lambda lim: lim.host)
+        bandwidth = sorted(_BANDWIDTH.values(), key=lambda bw: bw.rate)
+    parts = [
+        f"{lim.host} {lim.waited:.1f} s over {lim.requests} request(s)"
+        + (f", {lim.throttles} throttled (concurrency now {lim.concurrency})"
+           if lim.throttles else "")
+        for lim in limiters
+        if lim.waited >= 0.05 or lim.throttles
+    ]
+    parts += [
+        f"upload cap {bw.rate / 1024**2:.1f} MB/s {bw.waited:.1f} s"
+        for bw in bandwidth
+        if bw.waited >= 0.05
+    ]
+    return "; ".join(parts) if parts else "no waits"
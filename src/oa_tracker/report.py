@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -39,55 +38,33 @@ def generate_report(config: Config) -> Path:
     week_ago = (now - timedelta(days=7)).isoformat(timespec="seconds")
     report_path = config.output_dir / "weekly_report.md"
 
+    # One query per section: the report's cost follows what it prints,
+    # not the size of the registry (closed archives accumulate for years).
     with db.get_connection(config.database) as conn:
-        all_archives = db.get_all_archives(conn)
-        open_archives = [a for a in all_archives if a["status"].startswith("OPEN_")]
-        closed_archives = [a for a in all_archives if a["status"].startswith("CLOSED_")]
-
-        # New this week
-        new_this_week = [
-            a for a in all_archives
-            if a["first_seen_at"] and a["first_seen_at"] >= week_ago
-        ]
-
-        # Newly active this week
-        newly_active = [
-            a for a in all_archives
-            if a["became_active_at"] and a["became_active_at"] >= week_ago
-        ]
+        new_this_week = db.get_archives_first_seen_since(conn, week_ago)
+        newly_active = db.get_archives_active_since(conn, week_ago)
 
         # Stuck / long-idle (OPEN_ACTIVE for > 30 days with no change)
         stuck_threshold = (now - timedelta(days=30)).isoformat(timespec="seconds")
-        stuck = [
-            a for a in open_archives
-            if a["status"] == st.OPEN_ACTIVE
-            and a.get("became_active_at")
-            and a["became_active_at"] < stuck_threshold
-        ]
-
-        # Reminders due
+        stuck = db.get_archives_active_before(conn, stuck_threshold)
+
         reminders_due = db.get_reminders_due(conn, now.isoformat(timespec="seconds"))
 
-        # Pipeline view (by status)
-        status_counts = Counter(a["status"] for a in open_archives)
+        # Pipeline view (by status) and the summary totals
+        status_counts = db.count_archives_by_status(conn)
 
         # Integrity warnings
-        missing_folder = [a for a in open_archives if a["unexpected_missing_folder"]]
+        missing_folder = db.get_open_missing_folder(conn)
 
         # Mandate issues: every OPEN archive whose pub-DB classification
         # came back missing. The operator should confirm with PO/IT
         # before closing or pursuing.
-        mandate_issues = [
-            a for a in open_archives if a.get("oa_mandate_missing") == 1
-        ]
-
-        # Recently closed
-        recent_events = db.get_recent_events(conn, week_ago)
-        recently_closed_ids = {
-            e["publication_id"] for e in recent_events
-            if e["new_status"] and e["new_status"].startswith("CLOSED_")
-        }
-        recently_closed = [a for a in closed_archives if a["publication_id"] in recently_closed_ids]
+        mandate_issues = db.get_open_mandate_missing(conn)
+
+        recently_closed = db.get_archives_closed_since(conn, week_ago)
+
+    total_open = sum(n for s, n in status_counts.items() if s.startswith("OPEN_"))
+    total_closed = sum(n for s, n in status_counts.items() if s.startswith("CLOSED_"))
 
     # Build report
     lines: list[str] = []
@@ -186,9 +163,9 @@ def generate_report(config: Config) -> Path:
 
     # 8. Summary stats
     lines.append("## Summary")
-    lines.append(f"- Total open: {len(open_archives)}")
-    lines.append(f"- Total closed: {len(closed_archives)}")
-    lines.append(f"- Total tracked: {len(all_archives)}")
+    lines.append(f"- Total open: {total_open}")
+    lines.append(f"- Total closed: {total_closed}")
+    lines.append(f"- Total tracked: {sum(status_counts.values())}")
     lines.append("")
 
     report_path.write_text("\n".join(lines))
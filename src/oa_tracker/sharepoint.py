@@ -19,12 +19,15 @@ field type not yet live-verified is Hyperlink — the push is resilient
 (per-row errors are collected, not fatal) so an unexpected payload shape
 surfaces as a warning rather than aborting the sync.
 
-Inbound (pull → ``propose_*`` action rows) is the next increment and is
-intentionally not implemented here yet.
+Inbound (pull → ``propose_*`` action rows) is ``pull_proposals``. The
+unattended run reads the list through ``fetch_delta`` (Graph
+``/items/delta``): only rows changed since the stored delta link come
+back, and the caller keeps a local mirror (``db.sharepoint_items``).
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
@@ -33,10 +36,13 @@ import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from oa_tracker import ratelimit
 from oa_tracker.config import Config, SharePointSettings
 
 GRAPH = "https://graph.microsoft.com/v1.0"
@@ -144,6 +150,47 @@ COLUMNS: list[dict[str, Any]] = [
 ]
 
 
+# Fetch modes: the registry columns each read actually needs, so list
+# reads ``$select`` those instead of every column of every row (long
+# multi-line text and SharePoint's own hidden columns included).
+def _group(*groups: str) -> tuple[str, ...]:
+    return tuple(c["display"] for c in COLUMNS if c["group"] in groups)
+
+
+# SharePoint's built-in Title column: written by the push, not in COLUMNS.
+_TITLE = "Title"
+
+FETCH_MODES: dict[str, tuple[str, ...]] = {
+    "push": (_TITLE, *_group("system")),                # diff-only push
+    "pull": (D_PUBID, *_group("user"), D_INGESTED),     # pull_proposals
+    "reconcile": (D_PUBID, D_STATUS),                   # reconcile_closed_rows
+    "diff": (D_PUBID,),                                 # diff_against_list
+}
+FETCH_MODES["sync"] = (_TITLE, *_group("system", "user", "internal"))   # the local mirror
+
+_PERSON = {c["display"] for c in COLUMNS if "personOrGroup" in c["spec"]}
+
+
+def select_fields(name_for: dict[str, str], *modes: str) -> list[str]:
+    """Internal field names to ``$select`` for the union of ``modes``.
+    Person columns read back as ``<name>LookupId``; columns missing from
+    ``name_for`` are skipped (the caller's resolve reports those)."""
+    out: list[str] = []
+    for mode in modes:
+        for display in FETCH_MODES[mode]:
+            name = _TITLE if display == _TITLE else name_for.get(display)
+            if name is None:
+                continue
+            name = name + "LookupId" if display in _PERSON else name
+            if name not in out:
+                out.append(name)
+    return out
+
+
+def _expand(select: list[str] | None) -> str:
+    return f"$expand=fields($select={','.join(select)})" if select else "$expand=fields"
+
+
 # ── Pure mappers (no I/O) ────────────────────────────────────────────
 
 def status_label(status: str) -> str:
@@ -266,19 +313,55 @@ def _natural(pub_id: str):
     return (0, int(pub_id)) if pub_id.isdigit() else (1, pub_id)
 
 
+def _same(want: Any, have: Any) -> bool:
+    """Field equality across Graph's representations: numbers may come
+    back as floats (``6`` → ``6.0``) and LookupIds as strings."""
+    if have is None:
+        return want is None
+    if isinstance(want, (int, float)) and not isinstance(want, bool):
+        try:
+            return float(want) == float(have)
+        except (TypeError, ValueError):
+            return False
+    return str(want) == str(have)
+
+
+def fields_changed(desired: dict[str, Any], current: dict[str, Any], ignore: str | None = None) -> bool:
+    """Whether writing ``desired`` would change the row's ``current``
+    fields. ``ignore`` is the sync-timestamp column, which differs on
+    every run and is only written along with a real change."""
+    return any(
+        k != ignore and not _same(v, current.get(k)) for k, v in desired.items()
+    )
+
+
+def push_hash(desired: dict[str, Any], ignore: str | None = None) -> str:
+    """Stable hash of the system fields a push writes (``ignore`` as in
+    :func:`fields_changed`). Kept per row in the local mirror, so the
+    next push can skip a row whose desired fields have not moved."""
+    body = json.dumps({k: v for k, v in desired.items() if k != ignore},
+                      sort_keys=True, default=str)
+    return hashlib.sha1(body.encode()).hexdigest()[:16]
+
+
 # ── Result types ─────────────────────────────────────────────────────
 
 @dataclass
 class PushResult:
     created: int = 0
     updated: int = 0
+    skipped_unchanged: int = 0   # rows already showing what we'd write
     person_set: int = 0
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    # PubIds whose ``existing`` entry changed (written, or newly hashed) —
+    # what a caller keeping a local mirror needs to save.
+    touched: list[str] = field(default_factory=list)
 
     @property
     def summary(self) -> str:
         parts = [f"Created: {self.created}", f"Updated: {self.updated}",
+                 f"Unchanged (skipped): {self.skipped_unchanged}",
                  f"Person columns set: {self.person_set}"]
         if self.warnings:
             parts.append(f"Warnings: {len(self.warnings)}")
@@ -312,7 +395,7 @@ class GraphClient:
 
     def __init__(
         self, sp: SharePointSettings, scopes=("Sites.Selected",), timeout: int = 30,
-        interactive: bool = True,
+        interactive: bool = True, base_url: str = GRAPH, token: str | None = None,
     ):
         if not sp.client_id:
             raise ValueError("sharepoint.client_id is not configured")
@@ -321,7 +404,10 @@ class GraphClient:
         self._cache_path = Path(sp.token_cache).expanduser()
         self._scopes = list(scopes)
         self._timeout = timeout
-        self._token: str | None = None
+        # base_url/token point the client elsewhere with a ready bearer
+        # token (the local fake Graph server in benchmarks/sharepoint_sync).
+        self.base_url = base_url.rstrip("/")
+        self._token: str | None = token
         # interactive=False (scheduled/cron runs): never start a device-code
         # prompt — a headless run would block on it forever. Silent refresh
         # from the token cache only; failure raises with the fix named.
@@ -373,30 +459,45 @@ class GraphClient:
         self._token = result["access_token"]
         return self._token
 
-    # -- request with light retry on 429/5xx --
-    def request(self, method: str, path: str, json_body: Any = None) -> tuple[int, dict]:
+    # -- request with retry on 429/5xx, paced by the shared host limiter --
+    def request(
+        self, method: str, path: str, json_body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, dict]:
         if self._token is None:
             self.authenticate()
-        url = path if path.startswith("http") else f"{GRAPH}{path}"
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
         data = json.dumps(json_body).encode() if json_body is not None else None
-        for attempt in range(3):
+        limiter = ratelimit.limiter_for(url)
+        attempt = 0
+        throttled = 0
+        while True:
             req = urllib.request.Request(url, data=data, method=method)
             req.add_header("Authorization", f"Bearer {self._token}")
             if data is not None:
                 req.add_header("Content-Type", "application/json")
+            for name, value in (headers or {}).items():
+                req.add_header(name, value)
             try:
-                with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                    txt = resp.read().decode("utf-8")
-                    return resp.status, (json.loads(txt) if txt.strip() else {})
+                with limiter.slot() as seen:
+                    try:
+                        with urllib.request.urlopen(req, timeout=self._timeout) as resp:
+                            seen.record(resp.status, getattr(resp, "headers", None))
+                            txt = resp.read().decode("utf-8")
+                            return resp.status, (json.loads(txt) if txt.strip() else {})
+                    except urllib.error.HTTPError as e:
+                        seen.record(e.code, e.headers)
+                        raise
             except urllib.error.HTTPError as e:
-                if e.code == 429 and attempt < 2:
-                    time.sleep(int(e.headers.get("Retry-After", "5")))
+                # 429: the limiter has paused every caller for Retry-After.
+                if e.code == 429 and throttled < ratelimit.MAX_THROTTLE_RETRIES:
+                    throttled += 1
                     continue
                 if 500 <= e.code < 600 and attempt < 2:
                     time.sleep(2 ** attempt)
+                    attempt += 1
                     continue
                 raise
-        raise RuntimeError("unreachable")  # pragma: no cover
 
     # -- convenience reads used by the orchestration --
     def get_site_id(self, site: str) -> str:
@@ -404,29 +505,14 @@ class GraphClient:
         return body["id"]
 
     def _read_user_info(self, site_id: str) -> list[dict]:
-        """Raw User Information List rows as ``{id, email, name}``.
+        """Raw User Information List rows as ``{id, email, name, modified}``.
 
         Returns ``[]`` if the list can't be read with this token. Only users
         who've signed into the site appear — unresolved people stay unmapped
         by design.
         """
-        uil_id = self._find_user_info_list(site_id)
-        if not uil_id:
-            return []
-        rows: list[dict] = []
-        url = (f"/sites/{site_id}/lists/{uil_id}/items"
-               f"?$expand=fields($select=EMail,Title,UserName)&$top=200")
-        while url:
-            _, page = self.request("GET", url)
-            for it in page.get("value", []):
-                fields = it.get("fields") or {}
-                email = (fields.get("EMail") or fields.get("UserName") or "").strip()
-                rows.append({
-                    "id": it["id"], "email": email,
-                    "name": (fields.get("Title") or "").strip(),
-                })
-            url = page.get("@odata.nextLink")
-        return rows
+        uil_id = find_user_info_list(self, site_id)
+        return read_user_rows(self, site_id, uil_id) if uil_id else []
 
     def resolve_users(self, site_id: str) -> dict[str, str]:
         """email(lower) → site user LookupId (for *writing* Person columns)."""
@@ -437,23 +523,126 @@ class GraphClient:
         in a Person column, e.g. a suggested new data contact)."""
         return {r["id"]: {"name": r["name"], "email": r["email"]} for r in self._read_user_info(site_id)}
 
-    def _find_user_info_list(self, site_id: str) -> str | None:
-        flt = urllib.parse.quote("displayName eq 'User Information List'")
+
+# ── Site users (User Information List) ───────────────────────────────
+
+def find_user_info_list(client, site_id: str) -> str | None:
+    """The id of the site's hidden User Information List, or ``None``."""
+    flt = urllib.parse.quote("displayName eq 'User Information List'")
+    try:
+        _, page = client.request("GET", f"/sites/{site_id}/lists?$filter={flt}")
+        vals = page.get("value", [])
+        if vals:
+            return vals[0]["id"]
+    except urllib.error.HTTPError:
+        pass
+    for name in ("User%20Information%20List", "users"):
         try:
-            _, page = self.request("GET", f"/sites/{site_id}/lists?$filter={flt}")
-            vals = page.get("value", [])
-            if vals:
-                return vals[0]["id"]
+            _, lst = client.request("GET", f"/sites/{site_id}/lists/{name}")
+            if lst.get("id"):
+                return lst["id"]
         except urllib.error.HTTPError:
-            pass
-        for name in ("User%20Information%20List", "users"):
+            continue
+    return None
+
+
+def read_user_rows(client, site_id: str, uil_id: str, since: str = "") -> list[dict]:
+    """User Information List rows as ``{id, email, name, modified}`` —
+    only those modified after ``since`` (an ISO timestamp) when given.
+
+    ``Modified`` is not indexed on that list, so the filtered read asks
+    Graph to run it anyway (the list is small)."""
+    url = (f"/sites/{site_id}/lists/{uil_id}/items"
+           f"?$expand=fields($select=EMail,Title,UserName,Modified)&$top=200")
+    kwargs: dict[str, Any] = {}
+    if since:
+        url += "&$filter=" + urllib.parse.quote(f"fields/Modified gt '{since}'")
+        kwargs["headers"] = {"Prefer": "HonorNonIndexedQueriesWarningMayFailRandomly"}
+    rows: list[dict] = []
+    while url:
+        _, page = client.request("GET", url, **kwargs)
+        for it in page.get("value", []):
+            fields = it.get("fields") or {}
+            email = (fields.get("EMail") or fields.get("UserName") or "").strip()
+            rows.append({
+                "id": it["id"], "email": email,
+                "name": (fields.get("Title") or "").strip(),
+                "modified": fields.get("Modified") or "",
+            })
+        url = page.get("@odata.nextLink")
+    return rows
+
+
+@dataclass
+class UserDirectory:
+    """The site's users as one cached snapshot: serves both Person-column
+    directions (pull: LookupId → who; push: email → LookupId).
+
+    ``refreshed_at`` is when the list was last read in full; ``modified``
+    is the newest ``Modified`` seen, the high-water mark for incremental
+    reads. Persisted between runs as JSON (``to_json`` / ``from_json``).
+    """
+    list_id: str = ""
+    users: dict[str, dict] = field(default_factory=dict)   # LookupId → {name, email}
+    modified: str = ""
+    refreshed_at: str = ""
+
+    def by_email(self) -> dict[str, str]:
+        """email(lower) → LookupId (what ``resolve_users`` returns)."""
+        return {u["email"].lower(): uid for uid, u in self.users.items() if u["email"]}
+
+    def details(self) -> dict[str, dict]:
+        """LookupId → ``{"name", "email"}`` (what ``resolve_user_details`` returns)."""
+        return {uid: dict(u) for uid, u in self.users.items()}
+
+    def _absorb(self, rows: list[dict]) -> None:
+        for r in rows:
+            self.users[str(r["id"])] = {"name": r["name"], "email": r["email"]}
+            self.modified = max(self.modified, r["modified"])
+
+    def to_json(self) -> str:
+        return json.dumps({"list_id": self.list_id, "users": self.users,
+                           "modified": self.modified, "refreshed_at": self.refreshed_at})
+
+    @classmethod
+    def from_json(cls, raw: str | None) -> "UserDirectory | None":
+        if not raw:
+            return None
+        try:
+            d = json.loads(raw)
+            return cls(d["list_id"], d["users"], d.get("modified", ""), d.get("refreshed_at", ""))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+
+def load_user_directory(
+    client, site_id: str, cached: UserDirectory | None, now: datetime, ttl_hours: int,
+) -> UserDirectory:
+    """The site users, reading as little as possible.
+
+    A cache younger than ``ttl_hours`` is topped up with the entries
+    modified since its high-water mark (usually none). An older or absent
+    cache, or a failed incremental read, means one full read — which
+    also drops users removed from the site. The list id is cached too,
+    so discovery runs only on a full read.
+    """
+    if cached is not None and cached.list_id and cached.refreshed_at:
+        try:
+            age = now - datetime.fromisoformat(cached.refreshed_at)
+        except ValueError:
+            age = None
+        if age is not None and age < timedelta(hours=ttl_hours):
             try:
-                _, lst = self.request("GET", f"/sites/{site_id}/lists/{name}")
-                if lst.get("id"):
-                    return lst["id"]
+                cached._absorb(read_user_rows(client, site_id, cached.list_id, cached.modified))
+                return cached
             except urllib.error.HTTPError:
-                continue
-        return None
+                pass
+    directory = UserDirectory(refreshed_at=now.isoformat(timespec="seconds"))
+    uil_id = find_user_info_list(client, site_id)
+    if uil_id:
+        directory.list_id = uil_id
+        directory._absorb(read_user_rows(client, site_id, uil_id))
+    return directory
 
 
 # ── Orchestration (client-injected; unit-tested with a fake client) ──
@@ -482,11 +671,60 @@ def resolve_names(client, site_id: str, list_id: str) -> dict[str, str]:
     doesn't return (e.g. hidden ones), and still picks up any Graph name
     munging for the columns it does return.
     """
+    return _with_registry(column_names(client, site_id, list_id))
+
+
+def _with_registry(live: dict[str, str]) -> dict[str, str]:
     names = {c["display"]: c["name"] for c in COLUMNS}
-    names.update(column_names(client, site_id, list_id))
+    names.update(live)
     return names
 
 
+@dataclass
+class ListHandle:
+    """The identifiers a sync needs — site id, list id, column map. They
+    practically never change, so ``oa auto`` persists them between runs
+    (``to_json`` / ``from_json``) instead of rediscovering them each time.
+
+    ``missing`` lists the registry columns the live list did not report
+    when the handle was discovered; it is not persisted."""
+    site_id: str
+    list_id: str
+    name_for: dict[str, str]
+    missing: list[str] = field(default_factory=list)
+
+    def covers_registry(self) -> bool:
+        """False when a registry column is missing from the cached map
+        (a column added since it was cached) — time to rediscover."""
+        return all(c["display"] in self.name_for for c in COLUMNS)
+
+    def to_json(self) -> str:
+        return json.dumps({"site_id": self.site_id, "list_id": self.list_id,
+                           "name_for": self.name_for})
+
+    @classmethod
+    def from_json(cls, raw: str | None) -> "ListHandle | None":
+        if not raw:
+            return None
+        try:
+            d = json.loads(raw)
+            return cls(d["site_id"], d["list_id"], dict(d["name_for"]))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+
+def discover_list(client, sp: SharePointSettings) -> ListHandle | None:
+    """Look the list up from scratch (three Graph reads); ``None`` when it
+    has not been provisioned."""
+    site_id = client.get_site_id(sp.site)
+    lst = get_list(client, site_id, sp.list_name)
+    if lst is None:
+        return None
+    live = column_names(client, site_id, lst["id"])
+    missing = [c["display"] for c in COLUMNS if c["display"] not in live]
+    return ListHandle(site_id, lst["id"], _with_registry(live), missing)
+
+
 def ensure_list(client, site_id: str, sp: SharePointSettings) -> tuple[str, str, dict[str, str]]:
     """Idempotent provisioning. Returns (list_id, web_url, name_for).
 
@@ -535,17 +773,175 @@ def ensure_list(client, site_id: str, sp: SharePointSettings) -> tuple[str, str,
     return list_id, lst.get("webUrl", ""), name_for
 
 
-def fetch_items(client, site_id: str, list_id: str, pubid_internal: str) -> dict[str, dict]:
-    """PubId → item (with id and expanded fields) for rows already on the list."""
-    out: dict[str, dict] = {}
-    url = f"/sites/{site_id}/lists/{list_id}/items?$expand=fields&$top=200"
+def fetch_items(
+    client, site_id: str, list_id: str, pubid_internal: str,
+    select: list[str] | None = None,
+) -> dict[str, dict]:
+    """PubId → item (with id and expanded fields) for rows already on the list.
+    ``select`` (see :func:`select_fields`) narrows the fields read back;
+    ``None`` reads every column."""
+    items: list[dict] = []
+    url = f"/sites/{site_id}/lists/{list_id}/items?{_expand(select)}&$top=200"
     while url:
         _, page = client.request("GET", url)
-        for it in page.get("value", []):
-            pv = (it.get("fields") or {}).get(pubid_internal)
-            if pv is not None:
-                out[str(pv)] = it
+        items.extend(page.get("value", []))
         url = page.get("@odata.nextLink")
+    return items_by_pubid(items, pubid_internal)
+
+
+def carry_pulled_sigs(items, mirror: dict[str, dict]) -> None:
+    """Copy onto freshly fetched ``items`` the ``pulled_sig`` the local
+    mirror holds for them. ``oa auto`` takes in rows with nothing to show
+    the user (an un-tick, our own create) by that mark alone, without an
+    ``IngestedSig`` stamp — a full fetch must honour it too, or those rows
+    are pulled again."""
+    for it in items:
+        sig = (mirror.get(str(it["id"])) or {}).get("pulled_sig")
+        if sig:
+            it["pulled_sig"] = sig
+
+
+def items_by_pubid(items, pubid_internal: str) -> dict[str, dict]:
+    """PubId → item for items carrying a PubId (later duplicates win)."""
+    out: dict[str, dict] = {}
+    for it in items:
+        pv = (it.get("fields") or {}).get(pubid_internal)
+        if pv is not None:
+            out[str(pv)] = it
+    return out
+
+
+@dataclass
+class DeltaResult:
+    """One round of ``/items/delta``. ``full`` means the round started
+    without a usable delta link (first run, or Graph answered 410): the
+    caller's mirror must be *replaced* by ``changed``, not patched."""
+    changed: list[dict] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    delta_link: str = ""
+    full: bool = False
+
+
+def _is_removed(item: dict) -> bool:
+    return "@removed" in item or "deleted" in item
+
+
+def fetch_delta(
+    client, site_id: str, list_id: str, delta_link: str | None = None,
+    select: list[str] | None = None,
+) -> DeltaResult:
+    """Rows changed since ``delta_link`` (every row when it is empty).
+
+    Follows ``@odata.nextLink`` to the final page's ``@odata.deltaLink``,
+    which the caller persists for the next run. An expired or rejected
+    link (HTTP 410 ``resyncRequired``) restarts as a full round. ``select``
+    applies to a fresh round; a delta link carries its own query.
+    """
+    start = f"/sites/{site_id}/lists/{list_id}/items/delta?{_expand(select)}"
+    result = DeltaResult(full=not delta_link)
+    url = delta_link or start
+    while True:
+        try:
+            _, page = client.request("GET", url)
+        except urllib.error.HTTPError as e:
+            if e.code != 410 or (result.full and url == start):
+                raise
+            result = DeltaResult(full=True)
+            url = start
+            continue
+        for it in page.get("value", []):
+            if _is_removed(it):
+                result.removed.append(str(it["id"]))
+            else:
+                result.changed.append(it)
+        if page.get("@odata.nextLink"):
+            url = page["@odata.nextLink"]
+            continue
+        result.delta_link = page.get("@odata.deltaLink", "")
+        return result
+
+
+# Graph's JSON batching accepts at most 20 sub-requests per call.
+BATCH_MAX = 20
+
+
+def _error_text(body: Any) -> str:
+    return (body if isinstance(body, str) else json.dumps(body))[:200]
+
+
+class GraphExecutor:
+    """Bounded concurrency for independent Graph calls.
+
+    ``run`` executes zero-argument callables on up to ``max_workers``
+    threads and returns their results in submission order, so callers
+    build warnings exactly as a serial loop would. Throttling needs
+    nothing here: every call goes through ``GraphClient.request``, and
+    the shared ``ratelimit`` limiter pauses all threads on a 429's
+    ``Retry-After``. ``max_workers=1`` runs inline.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+
+    def run(self, calls: list[Callable[[], Any]]) -> list[Any]:
+        if self.max_workers == 1 or len(calls) <= 1:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as pool:
+            futures = [pool.submit(call) for call in calls]
+            return [f.result() for f in futures]
+
+
+def batch_requests(
+    client,
+    requests: list[tuple[str, str, dict | None]],
+    executor: GraphExecutor | None = None,
+) -> list[tuple[int, Any]]:
+    """Send ``(method, path, body)`` writes as JSON ``$batch`` calls of up
+    to ``BATCH_MAX``; ``(status, body)`` per request, in order.
+
+    Sub-request failures are returned, not raised (callers turn them into
+    warnings). A throttled sub-request (429/503) is reported to the shared
+    Graph limiter and retried on its own through ``client.request``,
+    which waits out the pause. A failure of the batch call itself is
+    returned for each of its sub-requests. With an ``executor`` the batch
+    calls go out concurrently; the result order is unchanged.
+    """
+    chunks = [requests[i:i + BATCH_MAX] for i in range(0, len(requests), BATCH_MAX)]
+    calls = [functools.partial(_send_batch, client, chunk) for chunk in chunks]
+    replies = (executor or GraphExecutor(1)).run(calls)
+    return [reply for chunk_replies in replies for reply in chunk_replies]
+
+
+def _send_batch(client, chunk: list[tuple[str, str, dict | None]]) -> list[tuple[int, Any]]:
+    """One ``$batch`` call (``batch_requests`` does the chunking)."""
+    subs = []
+    for i, (method, path, body) in enumerate(chunk):
+        sub: dict[str, Any] = {"id": str(i), "method": method, "url": path}
+        if body is not None:
+            sub["headers"] = {"Content-Type": "application/json"}
+            sub["body"] = body
+        subs.append(sub)
+    try:
+        _, reply = client.request("POST", "/$batch", {"requests": subs})
+    except urllib.error.HTTPError as e:
+        text = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
+        return [(e.code, text) for _ in chunk]
+    by_id = {str(r.get("id")): r for r in reply.get("responses", [])}
+    out: list[tuple[int, Any]] = []
+    for i, (method, path, body) in enumerate(chunk):
+        r = by_id.get(str(i)) or {"status": 500, "body": "missing from $batch response"}
+        status = int(r.get("status") or 500)
+        if status in (429, 503):
+            ratelimit.limiter_for(getattr(client, "base_url", GRAPH)).observe(
+                status, r.get("headers") or {})
+            try:
+                status, sub_body = client.request(method, path, body)
+            except urllib.error.HTTPError as e:
+                status = e.code
+                sub_body = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
+            out.append((status, sub_body))
+            continue
+        out.append((status, r.get("body") or {}))
     return out
 
 
@@ -558,15 +954,31 @@ def push_archives(
     email_to_lookup: dict[str, str],
     archives: list[dict],
     now: str,
+    existing: dict[str, dict] | None = None,
+    executor: GraphExecutor | None = None,
+    full: bool = False,
 ) -> PushResult:
     """Create/patch one row per archive (system-owned columns). Idempotent
-    on PubId. Per-row failures are collected as warnings, not fatal."""
+    on PubId. Per-row failures are collected as warnings, not fatal.
+    A row whose fields already match is not written at all (counted in
+    ``skipped_unchanged``), so ``Last updated`` moves only on real changes.
+
+    ``existing`` (PubId → item, e.g. the delta-synced mirror) saves the
+    full list fetch; it is updated in place with what was written, so a
+    later ``reconcile_closed_rows`` sees the rows as they now are. An item
+    carrying a ``pushed_hash`` equal to the desired fields' hash is
+    skipped without comparing fields; ``full`` (periodic reconciliation)
+    ignores the hashes and compares every row."""
     result = PushResult()
     pubid_internal = name_for[D_PUBID]
-    existing = fetch_items(client, site_id, list_id, pubid_internal)
+    if existing is None:
+        existing = fetch_items(client, site_id, list_id, pubid_internal,
+                               select_fields(name_for, "push"))
     contact_key = name_for[D_CONTACT] + "LookupId"
     corr_key = name_for[D_CORR] + "LookupId"
 
+    synced = name_for.get(D_SYNCED)
+    writes: list[tuple[str, dict, dict | None, str]] = []     # (pub_id, fields, item, hash)
     for archive in archives:
         pub_id = archive["publication_id"]
         try:
@@ -574,23 +986,41 @@ def push_archives(
         except KeyError as e:
             result.errors.append(f"{pub_id}: column {e} missing from list — re-provision")
             continue
+        item = existing.get(pub_id)
+        digest = push_hash(fields, synced)
+        if item is not None and not full and item.get("pushed_hash") == digest:
+            result.skipped_unchanged += 1
+            continue
+        if item is not None and not fields_changed(fields, item.get("fields") or {}, synced):
+            if item.get("pushed_hash") != digest:
+                item["pushed_hash"] = digest
+                result.touched.append(pub_id)
+            result.skipped_unchanged += 1
+            continue
         if contact_key in fields or corr_key in fields:
             result.person_set += 1
-        try:
-            if pub_id in existing:
-                item_id = existing[pub_id]["id"]
-                client.request(
-                    "PATCH", f"/sites/{site_id}/lists/{list_id}/items/{item_id}/fields", fields,
-                )
-                result.updated += 1
-            else:
-                client.request(
-                    "POST", f"/sites/{site_id}/lists/{list_id}/items", {"fields": fields},
-                )
-                result.created += 1
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")[:200] if hasattr(e, "read") else ""
-            result.warnings.append(f"{pub_id}: HTTP {e.code} on push ({body})")
+        writes.append((pub_id, fields, item, digest))
+
+    base = f"/sites/{site_id}/lists/{list_id}/items"
+    replies = batch_requests(client, [
+        ("PATCH", f"{base}/{item['id']}/fields", fields) if item is not None
+        else ("POST", base, {"fields": fields})
+        for _, fields, item, _ in writes
+    ], executor)
+    for (pub_id, fields, item, digest), (status, body) in zip(writes, replies):
+        if status >= 400:
+            result.warnings.append(f"{pub_id}: HTTP {status} on push ({_error_text(body)})")
+            continue
+        if item is not None:
+            item.setdefault("fields", {}).update(fields)
+            item["pushed_hash"] = digest
+            result.updated += 1
+        else:
+            if isinstance(body, dict) and body.get("id") is not None:
+                existing[pub_id] = {"id": body["id"], "fields": body.get("fields") or dict(fields),
+                                    "pushed_hash": digest}
+            result.created += 1
+        result.touched.append(pub_id)
     return result
 
 
@@ -603,6 +1033,7 @@ def reconcile_closed_rows(
     existing: dict[str, dict],
     archive_by_id: dict[str, dict | None],
     now: str,
+    executor: GraphExecutor | None = None,
 ) -> ReconcileResult:
     """Handle list rows whose archive is no longer OPEN (closed since last sync).
 
@@ -624,29 +1055,30 @@ def reconcile_closed_rows(
     result = ReconcileResult()
     status_col = name_for[D_STATUS]
     synced_col = name_for.get(D_SYNCED)
+    base = f"/sites/{site_id}/lists/{list_id}/items"
+    writes: list[tuple[str, bool, tuple[str, str, dict | None]]] = []
     for pub_id, item in existing.items():
         arch = archive_by_id.get(pub_id)
         if arch is None or not str(arch.get("status", "")).startswith("CLOSED_"):
             continue
         desired = status_label(arch["status"])
         current = (item.get("fields") or {}).get(status_col)
-        try:
-            if current != desired:
-                body: dict[str, Any] = {status_col: desired}
-                if synced_col:
-                    body[synced_col] = now
-                client.request(
-                    "PATCH", f"/sites/{site_id}/lists/{list_id}/items/{item['id']}/fields", body,
-                )
-                result.relabeled += 1
-            elif not sp.sync_closed:
-                client.request(
-                    "DELETE", f"/sites/{site_id}/lists/{list_id}/items/{item['id']}",
-                )
-                result.removed += 1
-        except urllib.error.HTTPError as e:
-            body_txt = e.read().decode("utf-8", errors="replace")[:200] if hasattr(e, "read") else ""
-            result.warnings.append(f"{pub_id}: HTTP {e.code} on reconcile ({body_txt})")
+        if current != desired:
+            body: dict[str, Any] = {status_col: desired}
+            if synced_col:
+                body[synced_col] = now
+            writes.append((pub_id, True, ("PATCH", f"{base}/{item['id']}/fields", body)))
+        elif not sp.sync_closed:
+            writes.append((pub_id, False, ("DELETE", f"{base}/{item['id']}", None)))
+
+    replies = batch_requests(client, [req for _, _, req in writes], executor)
+    for (pub_id, relabel, _), (status, body) in zip(writes, replies):
+        if status >= 400:
+            result.warnings.append(f"{pub_id}: HTTP {status} on reconcile ({_error_text(body)})")
+        elif relabel:
+            result.relabeled += 1
+        else:
+            result.removed += 1
     return result
 
 
@@ -733,8 +1165,8 @@ def pull_proposals(
     """Turn changed user edits into reviewable proposals (pure; no I/O).
 
     Each item is a fetched list item (``{"id", "fields"}``). Returns only
-    items whose user fields changed since their stored ``IngestedSig`` and
-    that carry an actionable signal or a note. ``user_details`` (LookupId →
+    items whose user fields changed since their stored ``IngestedSig`` (or
+    the ``pulled_sig`` a local mirror recorded for the item). ``user_details`` (LookupId →
     ``{"name", "email"}``, from ``GraphClient.resolve_user_details``) lets a
     "suggest a new data contact" proposal name the person and pre-fill the
     ``set_data_contact`` command; without it, it falls back to "open the row".
@@ -744,7 +1176,7 @@ def pull_proposals(
         fields = it.get("fields") or {}
         pub_id = str(fields.get(name_for[D_PUBID], "") or "")
         sig = user_signature(fields, name_for)
-        if sig == (fields.get(name_for[D_INGESTED]) or ""):
+        if sig in ((fields.get(name_for[D_INGESTED]) or ""), it.get("pulled_sig")):
             continue
         detail = (fields.get(name_for[D_DETAIL]) or "").strip()
         proposals: list[Proposal] = []
@@ -820,12 +1252,50 @@ def write_proposal_feedback(
     are actionable proposals, set the user-visible RequestStatus.
     ``request_status`` overrides the default pending label — the automation
     engine passes REQUEST_STATUS_PROCESSED when it auto-applied the signal."""
+    client.request(
+        "PATCH", f"/sites/{site_id}/lists/{list_id}/items/{item.item_id}/fields",
+        _feedback_fields(name_for, item, request_status),
+    )
+
+
+def _feedback_fields(name_for: dict[str, str], item: PulledItem, request_status: str | None) -> dict:
     body: dict[str, Any] = {name_for[D_INGESTED]: item.new_sig}
     if request_status is not None:
         body[name_for[D_REQSTATUS]] = request_status
     elif item.proposals:
         body[name_for[D_REQSTATUS]] = REQUEST_STATUS_PENDING
-    client.request("PATCH", f"/sites/{site_id}/lists/{list_id}/items/{item.item_id}/fields", body)
+    return body
+
+
+@dataclass
+class FeedbackResult:
+    """Outcome of :func:`write_feedback_batch`."""
+    stamped: list[PulledItem] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+def write_feedback_batch(
+    client, site_id: str, list_id: str, name_for: dict[str, str],
+    stamps: list[tuple[PulledItem, str | None]],
+    executor: GraphExecutor | None = None,
+) -> FeedbackResult:
+    """``write_proposal_feedback`` for many rows at once — ``$batch``ed
+    and, with an ``executor``, concurrent. ``stamps`` pairs each item with
+    its ``request_status`` override; one warning per failed stamp, in
+    ``stamps`` order."""
+    base = f"/sites/{site_id}/lists/{list_id}/items"
+    replies = batch_requests(client, [
+        ("PATCH", f"{base}/{item.item_id}/fields", _feedback_fields(name_for, item, status))
+        for item, status in stamps
+    ], executor)
+    result = FeedbackResult()
+    for (item, _), (status, body) in zip(stamps, replies):
+        if status >= 400:
+            result.warnings.append(
+                f"{item.pub_id}: feedback stamp failed: HTTP {status} ({_error_text(body)})")
+        else:
+            result.stamped.append(item)
+    return result
 
 
 def load_settings(cfg: Config) -> SharePointSettings:
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from oa_tracker import db, status as st
 from oa_tracker.config import Config
+from oa_tracker.fileio import write_atomic
 
 SHEET_COLUMNS = [
     "publication_id",
@@ -196,185 +200,326 @@ def _row(archive: dict[str, Any], task_code: str, task_text: str, note: str = ""
     }
 
 
+def _archive_rows(
+    ctx: db.SheetContext, config: Config, archive: dict[str, Any],
+) -> list[dict[str, str]]:
+    """The sheet rows one open archive contributes, in sheet order."""
+    rows: list[dict[str, str]] = []
+    pub_id = archive["publication_id"]
+    cur_status = archive["status"]
+    category, auto_note = _mandate_classification(archive)
+
+    # A pending data-contact handover (auto-applied reassignment)
+    # gets its row FIRST, whatever the mandate category — the new
+    # contact should be welcomed before being asked to act. The
+    # row recurs until done=1 records handover_sent.
+    if pub_id in ctx.pending_handovers:
+        rows.append(_row(
+            archive, "handover_sent",
+            st.TASK_CODES["handover_sent"]["description"],
+            note=(
+                f"New data contact auto-assigned — send "
+                f"email_drafts/handover_{pub_id}.eml (regenerates "
+                "until sent); done=1 records it as sent."
+            ),
+        ))
+
+    # Mandate-missing and explicit no-OA archives produce a single
+    # actionable row each — nothing else (no pipeline progression,
+    # no reminders) until the operator addresses the situation.
+    if category == "mandate_missing":
+        rows.append(_row(
+            archive,
+            "mandate_missing",
+            st.TASK_CODES["mandate_missing"]["description"],
+            note=auto_note,
+        ))
+        return rows
+
+    if category == "close_no_oa":
+        rows.append(_row(
+            archive,
+            "close_publication_only",
+            st.TASK_CODES["close_publication_only"]["description"],
+            note=auto_note,
+        ))
+        return rows
+
+    # Paper-only archives that sit empty (OPEN_INACTIVE) have no
+    # natural next action — reminders are suppressed because the
+    # mandate doesn't require data, and there's no pipeline row
+    # to emit. Surface a close_publication_only row so the
+    # operator can choose to close (or leave done=0 to wait).
+    # Once the folder activates (OPEN_ACTIVE), we fall through
+    # to the normal pipeline path with the paper-only side note.
+    if category == "paper_only" and cur_status == st.OPEN_INACTIVE:
+        rows.append(_row(
+            archive,
+            "close_publication_only",
+            st.TASK_CODES["close_publication_only"]["description"],
+            note=(
+                "PAPER ONLY mandate: data not required and folder still empty — "
+                "consider closing as publication-only."
+            ),
+        ))
+        return rows
+
+    # Pipeline task goes FIRST so the operator (or eventual
+    # automation) considers it before a reminder. For OPEN_ACTIVE
+    # this means QA is decided first: if QA passes, status
+    # advances and any reminder row that follows is moot
+    # (apply_actions will skip it with a warning). If QA fails
+    # (operator switches task_code to qa_hold + done=1), status
+    # stays OPEN_ACTIVE and the reminder row is the right next
+    # step — exactly the "QA must precede reminder" rule.
+    next_task = st.next_task_for_status(cur_status)
+    if next_task:
+        task = next_task
+        note = auto_note
+
+        if cur_status == st.OPEN_ACTIVE:
+            note = _join_notes(note, _package_note(archive))
+
+        # Zenodo-aware rows: when the API integration is on, the
+        # sheet offers the API-backed codes so done=1 performs the
+        # step (create draft / publish) instead of just recording
+        # hand-done work. Env-mismatched or hand-managed drafts
+        # keep the manual codes.
+        zen = config.zenodo
+        env_ok = archive.get("zenodo_env") in (None, zen.environment)
+        if zen.enabled and cur_status == st.OPEN_READY_FOR_ZENODO_DRAFT \
+                and not archive.get("zenodo_code") and pub_id.isdigit():
+            task = "zenodo_create_draft"
+            note = _join_notes(
+                note,
+                f"done=1 creates the draft via the API on {zen.environment} "
+                "(metadata + reserved DOI + package upload happen automatically "
+                "when `oa auto` runs).",
+            )
+        elif cur_status == st.OPEN_ZENODO_DRAFT_CREATED and archive.get("zenodo_code"):
+            from oa_tracker import zenodo as z
+            note = _join_notes(
+                note,
+                f"Review the draft: {z.record_ui_url(zen, archive['zenodo_code'])}",
+            )
+        elif zen.enabled and cur_status == st.OPEN_ZENODO_DRAFT_VALIDATED \
+                and archive.get("zenodo_code") and env_ok:
+            task = "zenodo_publish"
+            note = _join_notes(
+                note,
+                f"done=1 publishes record {archive['zenodo_code']} on "
+                f"{zen.environment} via the API and mints the DOI — this is "
+                "the permanent step.",
+            )
+
+        meta = st.TASK_CODES[task]
+        rows.append(_row(
+            archive, task, meta["description"], note=note,
+        ))
+
+    # Completion email: once the dataset is published on Zenodo the
+    # operator owes the data contact a "your data is archived" note.
+    # oa emails writes completion_<pub>.eml; this row recurs until
+    # done=1 logs a completion_sent event — mirrors remind_sent /
+    # handover_sent so a generated email always has a matching
+    # "send it" action item.
+    if cur_status in (st.OPEN_ZENODO_PUBLISHED, st.OPEN_DB_UPDATED) \
+            and archive.get("final_pid") \
+            and pub_id not in ctx.completion_sent:
+        rows.append(_row(
+            archive, "completion_sent",
+            st.TASK_CODES["completion_sent"]["description"],
+            note=(
+                f"Draft ready: email_drafts/completion_{pub_id}.eml — "
+                "send it, then done=1 records it as sent (this row "
+                "recurs until then)."
+            ),
+        ))
+
+    # Reminders fire only when data is actually required by mandate
+    # (or when we don't have classification info — legacy rows
+    # behave as before so existing flows aren't broken) AND only
+    # while the work is still author-owned (OPEN_INACTIVE / OPEN_ACTIVE).
+    # Once QA passes the remaining steps are the operator's, so a
+    # reminder row would be noise — mirrors emails._REMINDER_STATUSES.
+    allow_reminders = (
+        category in ("data_required", "unclassified")
+        and cur_status in (st.OPEN_INACTIVE, st.OPEN_ACTIVE)
+    )
+    if pub_id in ctx.due_ids and allow_reminders:
+        reached_max = (
+            archive.get("reminder_count") or 0
+        ) >= config.reminders.max_reminders - 1
+        task = "contact_pi_manual" if reached_max else "remind_sent"
+        reminder_note = ""
+        if reached_max:
+            n = (archive.get("reminder_count") or 0) + 1
+            reminder_note = (
+                f"Past-due draft: email_drafts/reminder_{pub_id}_{n}"
+                "_PASTDUE.eml (skeleton for the personal follow-up). "
+                "done=1 logs the contact and re-queues this item at the "
+                "next interval; to abandon instead, change the task to "
+                "close_exception with a note."
+            )
+        rows.append(_row(
+            archive, task, st.TASK_CODES[task]["description"],
+            note=reminder_note,
+        ))
+    return rows
+
+
+# ── Incremental regeneration ─────────────────────────────────────────
+#
+# A row's identity is (publication_id, task_code). The sync_state row
+# STATE_KEY keeps, per archive, a signature of everything _archive_rows
+# reads plus the rows it produced last time. Archives whose
+# signature is unchanged reuse those rows; the rest are recomputed. The merge then carries the operator's
+# cells over from the sheet on disk wherever they differ from what we
+# generated last time, so a cron run no longer discards in-progress edits.
+
+OPERATOR_COLUMNS = ("done", "pid", "url", "note")
+
+# The archive columns _archive_rows reads. last_seen_at and friends
+# change on every scan and must not invalidate a row.
+_INPUT_COLUMNS = (
+    "status", "first_seen_at", "next_reminder_at", "reminder_count",
+    "pub_db_last_refreshed_at", "oa_mandate_missing", "oa_data_required",
+    "oa_paper_required", "user_done_flag", "package_has_zip",
+    "package_has_readme", "package_has_manuscript", "final_pid", "final_url",
+    "zenodo_code", "zenodo_env",
+)
+
+# Bump when _archive_rows changes what it emits, to drop cached rows.
+_STATE_VERSION = 1
+
+RowKey = tuple[str, str]
+
+STATE_KEY = "action_sheet.state"
+
+
+def _key(row: dict[str, str]) -> RowKey:
+    return (row.get("publication_id") or "", row.get("task_code") or "")
+
+
+def _settings_sig(config: Config) -> str:
+    zen = config.zenodo
+    return json.dumps([_STATE_VERSION, SHEET_COLUMNS, zen.enabled, zen.environment,
+                       zen.base_url, config.reminders.max_reminders])
+
+
+def _archive_sig(archive: dict[str, Any], due: bool, last_event: int | None) -> str:
+    inputs = [archive.get(c) for c in _INPUT_COLUMNS] + [due, last_event]
+    return hashlib.sha1(json.dumps(inputs, default=str).encode()).hexdigest()[:16]
+
+
+def _load_state(value: str | None) -> tuple[str | None, dict[str, dict]]:
+    """``(settings, archives)`` from the stored state; empty when unset or
+    unreadable."""
+    try:
+        state = json.loads(value or "{}")
+        return state.get("settings"), dict(state.get("archives") or {})
+    except (ValueError, AttributeError, TypeError):
+        return None, {}
+
+
+def _read_existing(sheet_path: Path) -> list[dict[str, str]]:
+    try:
+        with open(sheet_path, newline="") as f:
+            return list(csv.DictReader(f, delimiter="\t"))
+    except OSError:
+        return []
+
+
+def merge_rows(
+    generated: list[dict[str, str]],
+    existing: list[dict[str, str]],
+    previous: dict[RowKey, dict[str, str]],
+    open_ids: set[str],
+) -> list[dict[str, str]]:
+    """Fold the operator's edits in ``existing`` (the sheet on disk) into
+    the freshly ``generated`` rows.
+
+    An operator cell is one of ``OPERATOR_COLUMNS`` whose value differs
+    from what we generated for that key last run (``previous``); it wins
+    over the new value. Without a ``previous`` entry a row counts as
+    edited only if done/pid/url were filled in.
+
+    A row the operator re-keyed (a changed task_code, e.g. qa_pass →
+    qa_hold) has operator input but no generated twin: it is kept while
+    its archive is open, in place of the row it was renamed from.
+    Everything else follows ``generated``, in its order.
+    """
+    on_disk = {_key(r): r for r in existing}
+    wanted = {_key(r) for r in generated}
+
+    def edited(row: dict[str, str], base: dict[str, str] | None) -> dict[str, str]:
+        cells = {c: row.get(c) or "" for c in OPERATOR_COLUMNS}
+        if base is None:
+            # No record of what we wrote (first run, lost sidecar): the
+            # note may be ours, so it only counts alongside other input.
+            if cells["done"] in ("", "0") and not cells["pid"] and not cells["url"]:
+                return {}
+            return cells
+        return {c: v for c, v in cells.items() if v != (base.get(c) or "")}
+
+    renamed: dict[str, list[dict[str, str]]] = {}
+    for key, row in on_disk.items():
+        if key not in wanted and key[0] in open_ids and edited(row, previous.get(key)):
+            renamed.setdefault(key[0], []).append(row)
+
+    out: list[dict[str, str]] = []
+    for row in generated:
+        key = _key(row)
+        pub_id = key[0]
+        if key in on_disk:
+            out.append({**row, **edited(on_disk[key], previous.get(key))})
+        elif key in previous and renamed.get(pub_id):
+            out.extend(renamed.pop(pub_id))
+        else:
+            out.append(row)
+    for rows in renamed.values():
+        out.extend(rows)
+    return out
+
+
 def generate_sheet(config: Config) -> Path:
-    """Generate action_sheet.tsv for all OPEN archives and return the file path."""
+    """Regenerate action_sheet.tsv for all OPEN archives and return the
+    file path. Only archives whose inputs changed are recomputed, and the
+    operator's unapplied edits on the current sheet are kept (``merge_rows``)."""
     config.output_dir.mkdir(parents=True, exist_ok=True)
     sheet_path = config.output_dir / "action_sheet.tsv"
     now_str = datetime.now().isoformat(timespec="seconds")
+    settings = _settings_sig(config)
 
-    rows: list[dict[str, str]] = []
+    generated: list[dict[str, str]] = []
+    state: dict[str, dict] = {}
 
     with db.get_connection(config.database) as conn:
-        open_archives = db.get_open_archives(conn)
-        reminders_due = {
-            a["publication_id"] for a in db.get_reminders_due(conn, now_str)
-        }
-
-        for archive in open_archives:
-            pub_id = archive["publication_id"]
-            cur_status = archive["status"]
-            category, auto_note = _mandate_classification(archive)
-
-            # A pending data-contact handover (auto-applied reassignment)
-            # gets its row FIRST, whatever the mandate category — the new
-            # contact should be welcomed before being asked to act. The
-            # row recurs until done=1 records handover_sent.
-            if db.get_pending_handover(conn, pub_id) is not None:
-                rows.append(_row(
-                    archive, "handover_sent",
-                    st.TASK_CODES["handover_sent"]["description"],
-                    note=(
-                        f"New data contact auto-assigned — send "
-                        f"email_drafts/handover_{pub_id}.eml (regenerates "
-                        "until sent); done=1 records it as sent."
-                    ),
-                ))
-
-            # Mandate-missing and explicit no-OA archives produce a single
-            # actionable row each — nothing else (no pipeline progression,
-            # no reminders) until the operator addresses the situation.
-            if category == "mandate_missing":
-                rows.append(_row(
-                    archive,
-                    "mandate_missing",
-                    st.TASK_CODES["mandate_missing"]["description"],
-                    note=auto_note,
-                ))
-                continue
-
-            if category == "close_no_oa":
-                rows.append(_row(
-                    archive,
-                    "close_publication_only",
-                    st.TASK_CODES["close_publication_only"]["description"],
-                    note=auto_note,
-                ))
-                continue
-
-            # Paper-only archives that sit empty (OPEN_INACTIVE) have no
-            # natural next action — reminders are suppressed because the
-            # mandate doesn't require data, and there's no pipeline row
-            # to emit. Surface a close_publication_only row so the
-            # operator can choose to close (or leave done=0 to wait).
-            # Once the folder activates (OPEN_ACTIVE), we fall through
-            # to the normal pipeline path with the paper-only side note.
-            if category == "paper_only" and cur_status == st.OPEN_INACTIVE:
-                rows.append(_row(
-                    archive,
-                    "close_publication_only",
-                    st.TASK_CODES["close_publication_only"]["description"],
-                    note=(
-                        "PAPER ONLY mandate: data not required and folder still empty — "
-                        "consider closing as publication-only."
-                    ),
-                ))
-                continue
-
-            # Pipeline task goes FIRST so the operator (or eventual
-            # automation) considers it before a reminder. For OPEN_ACTIVE
-            # this means QA is decided first: if QA passes, status
-            # advances and any reminder row that follows is moot
-            # (apply_actions will skip it with a warning). If QA fails
-            # (operator switches task_code to qa_hold + done=1), status
-            # stays OPEN_ACTIVE and the reminder row is the right next
-            # step — exactly the "QA must precede reminder" rule.
-            next_task = st.next_task_for_status(cur_status)
-            if next_task:
-                task = next_task
-                note = auto_note
-
-                if cur_status == st.OPEN_ACTIVE:
-                    note = _join_notes(note, _package_note(archive))
-
-                # Zenodo-aware rows: when the API integration is on, the
-                # sheet offers the API-backed codes so done=1 performs the
-                # step (create draft / publish) instead of just recording
-                # hand-done work. Env-mismatched or hand-managed drafts
-                # keep the manual codes.
-                zen = config.zenodo
-                env_ok = archive.get("zenodo_env") in (None, zen.environment)
-                if zen.enabled and cur_status == st.OPEN_READY_FOR_ZENODO_DRAFT \
-                        and not archive.get("zenodo_code") and pub_id.isdigit():
-                    task = "zenodo_create_draft"
-                    note = _join_notes(
-                        note,
-                        f"done=1 creates the draft via the API on {zen.environment} "
-                        "(metadata + reserved DOI + package upload happen automatically "
-                        "when `oa auto` runs).",
-                    )
-                elif cur_status == st.OPEN_ZENODO_DRAFT_CREATED and archive.get("zenodo_code"):
-                    from oa_tracker import zenodo as z
-                    note = _join_notes(
-                        note,
-                        f"Review the draft: {z.record_ui_url(zen, archive['zenodo_code'])}",
-                    )
-                elif zen.enabled and cur_status == st.OPEN_ZENODO_DRAFT_VALIDATED \
-                        and archive.get("zenodo_code") and env_ok:
-                    task = "zenodo_publish"
-                    note = _join_notes(
-                        note,
-                        f"done=1 publishes record {archive['zenodo_code']} on "
-                        f"{zen.environment} via the API and mints the DOI — this is "
-                        "the permanent step.",
-                    )
-
-                meta = st.TASK_CODES[task]
-                rows.append(_row(
-                    archive, task, meta["description"], note=note,
-                ))
-
-            # Completion email: once the dataset is published on Zenodo the
-            # operator owes the data contact a "your data is archived" note.
-            # oa emails writes completion_<pub>.eml; this row recurs until
-            # done=1 logs a completion_sent event — mirrors remind_sent /
-            # handover_sent so a generated email always has a matching
-            # "send it" action item.
-            if cur_status in (st.OPEN_ZENODO_PUBLISHED, st.OPEN_DB_UPDATED) \
-                    and archive.get("final_pid") \
-                    and db.get_last_event(conn, pub_id, "completion_sent") is None:
-                rows.append(_row(
-                    archive, "completion_sent",
-                    st.TASK_CODES["completion_sent"]["description"],
-                    note=(
-                        f"Draft ready: email_drafts/completion_{pub_id}.eml — "
-                        "send it, then done=1 records it as sent (this row "
-                        "recurs until then)."
-                    ),
-                ))
-
-            # Reminders fire only when data is actually required by mandate
-            # (or when we don't have classification info — legacy rows
-            # behave as before so existing flows aren't broken) AND only
-            # while the work is still author-owned (OPEN_INACTIVE / OPEN_ACTIVE).
-            # Once QA passes the remaining steps are the operator's, so a
-            # reminder row would be noise — mirrors emails._REMINDER_STATUSES.
-            allow_reminders = (
-                category in ("data_required", "unclassified")
-                and cur_status in (st.OPEN_INACTIVE, st.OPEN_ACTIVE)
-            )
-            if pub_id in reminders_due and allow_reminders:
-                reached_max = (
-                    archive.get("reminder_count") or 0
-                ) >= config.reminders.max_reminders - 1
-                task = "contact_pi_manual" if reached_max else "remind_sent"
-                reminder_note = ""
-                if reached_max:
-                    n = (archive.get("reminder_count") or 0) + 1
-                    reminder_note = (
-                        f"Past-due draft: email_drafts/reminder_{pub_id}_{n}"
-                        "_PASTDUE.eml (skeleton for the personal follow-up). "
-                        "done=1 logs the contact and re-queues this item at the "
-                        "next interval; to abandon instead, change the task to "
-                        "close_exception with a note."
-                    )
-                rows.append(_row(
-                    archive, task, st.TASK_CODES[task]["description"],
-                    note=reminder_note,
-                ))
-
-    with open(sheet_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=SHEET_COLUMNS, delimiter="\t")
-        writer.writeheader()
-        writer.writerows(rows)
-
+        ctx = db.load_sheet_context(conn, now_str)
+        cached_settings, cached = _load_state(db.get_sync_state(conn, STATE_KEY))
+    reuse = cached_settings == settings
+
+    for archive in ctx.open_archives:
+        pub_id = archive["publication_id"]
+        sig = _archive_sig(archive, pub_id in ctx.due_ids, ctx.last_event_ids.get(pub_id))
+        hit = cached.get(pub_id) if reuse else None
+        if hit and hit.get("sig") == sig:
+            rows = hit["rows"]
+        else:
+            rows = _archive_rows(ctx, config, archive)
+        state[pub_id] = {"sig": sig, "rows": rows}
+        generated.extend(rows)
+
+    previous = {_key(r): r for entry in cached.values() for r in entry.get("rows", [])}
+    rows = merge_rows(generated, _read_existing(sheet_path), previous, set(state))
+
+    buf = io.StringIO(newline="")
+    writer = csv.DictWriter(buf, fieldnames=SHEET_COLUMNS, delimiter="\t",
+                            extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    write_atomic(sheet_path, buf.getvalue())
+    with db.get_connection(config.database) as conn:
+        db.set_sync_state(conn, STATE_KEY, json.dumps(
+            {"settings": settings, "archives": state}, sort_keys=True))
     return sheet_path
@@ -36,19 +36,29 @@ Token storage — ``~/.zenodorc`` (mode 600, never in the repo):
 from __future__ import annotations
 
 import configparser
+import functools
 import hashlib
+import http.client
+import io
 import json
+import os
 import re
+import socket
+import ssl
+import threading
 import time
 import unicodedata
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
 from pathlib import Path
 from typing import Any, Callable
 
+from oa_tracker import preflight, ratelimit
 from oa_tracker.config import Config, ZenodoSettings
 
 # Zenodo per-file and per-record limit (50 GB).
@@ -100,12 +110,129 @@ def load_token(settings: ZenodoSettings) -> str:
 # ── Client (the only I/O) ────────────────────────────────────────────
 
 class ZenodoClient:
-    """Thin JSON client with retry on 429/5xx/connection errors."""
+    """Thin JSON client with retry on 429/5xx/connection errors.
+
+    Every request goes through the shared per-host limiter
+    (``ratelimit``): 429s pause all callers until ``Retry-After`` /
+    ``X-RateLimit-Reset`` and are retried up to
+    ``ratelimit.MAX_THROTTLE_RETRIES`` times; 5xx and connection errors
+    keep their own 3-attempt exponential backoff.
+
+    Upload bodies (``_PartReader``) skip urllib: they go over a
+    keep-alive ``http.client`` connection owned by the calling thread and
+    are written with ``_PartReader.send_to`` (sendfile / reused buffer),
+    so a multi-GB file is not chopped into 8 KiB ``bytes`` objects and
+    consecutive part PUTs don't pay a TLS handshake each. Failures are
+    surfaced as the same ``HTTPError`` / ``OSError`` the urllib path
+    raises, so retry and classification are shared.
+
+    GETs under ``/api/records/<id>`` are cached for the client's lifetime
+    (one ``oa auto`` run — see ``get_client``). Any mutation of a record
+    by this client marks that record's entries stale; a stale entry is
+    revalidated with ``If-None-Match`` when the server sent an ETag
+    (``304`` → the cached body), otherwise fetched again. ``stats``
+    counts what went over the wire and what the cache saved.
+    """
 
     def __init__(self, base_url: str, token: str, timeout: int = 60):
         self.base_url = base_url.rstrip("/")
         self._token = token
         self._timeout = timeout
+        self._local = threading.local()     # per-thread keep-alive connections
+        self._cache: dict[str, _Cached] = {}
+        self._lock = threading.Lock()
+        self.stats: Counter = Counter()     # requests / cache_hits / revalidated
+        self.records: set[str] = set()      # record ids this client has touched
+
+    def remember(self, path: str, body: dict) -> None:
+        """Seed the cache with state we know without asking (e.g. the
+        empty file list of a draft we just created)."""
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        with self._lock:
+            self._cache[url] = _Cached(None, json.dumps(body))
+
+    def _invalidate(self, record_id: str) -> None:
+        with self._lock:
+            for url, entry in self._cache.items():
+                if _record_of(url) == record_id:
+                    entry.stale = True
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _connection(self, parts: urllib.parse.SplitResult) -> tuple[http.client.HTTPConnection, bool]:
+        """This thread's connection to the URL's origin, and whether it was reused."""
+        conns = self._local.__dict__.setdefault("conns", {})
+        key = (parts.scheme, parts.netloc)
+        conn = conns.get(key)
+        if conn is not None:
+            return conn, True
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(
+                parts.hostname, parts.port, timeout=self._timeout,
+                context=ssl.create_default_context(),
+            )
+        else:
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self._timeout)
+        conns[key] = conn
+        return conn, False
+
+    def _drop(self, parts: urllib.parse.SplitResult) -> None:
+        conn = self._local.__dict__.get("conns", {}).pop((parts.scheme, parts.netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        """Close the calling thread's keep-alive connections."""
+        for conn in self._local.__dict__.pop("conns", {}).values():
+            conn.close()
+
+    def _stream(
+        self, method: str, url: str, body: "_PartReader",
+        content_type: str | None, content_length: int | None,
+    ) -> tuple[int, Any, bytes]:
+        """Send a streamed body on this thread's keep-alive connection.
+
+        Returns ``(status, headers, raw body)``; error statuses raise
+        ``urllib.error.HTTPError`` exactly like ``urlopen`` would. A
+        reused connection the server already closed is retried once on a
+        fresh one before the caller's backoff sees anything.
+        """
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        retried_stale = False
+        while True:
+            conn, reused = self._connection(parts)
+            try:
+                conn.putrequest(method, target, skip_accept_encoding=True)
+                conn.putheader("Authorization", f"Bearer {self._token}")
+                if content_type:
+                    conn.putheader("Content-Type", content_type)
+                if content_length is not None:
+                    conn.putheader("Content-Length", str(content_length))
+                conn.endheaders()
+                body.send_to(conn.sock)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (OSError, http.client.HTTPException) as e:
+                self._drop(parts)
+                stale = isinstance(e, (http.client.RemoteDisconnected,
+                                       BrokenPipeError, ConnectionResetError))
+                if reused and stale and not retried_stale:
+                    retried_stale = True
+                    body.seek(0)
+                    continue
+                if isinstance(e, OSError):
+                    raise
+                raise ConnectionError(f"{type(e).__name__}: {e}") from e
+            if resp.will_close:
+                self._drop(parts)
+            if resp.status >= 400:
+                raise urllib.error.HTTPError(
+                    url, resp.status, resp.reason, resp.headers, io.BytesIO(raw)
+                )
+            return resp.status, resp.headers, raw
 
     def request(
         self,
@@ -121,11 +248,56 @@ class ZenodoClient:
         if json_body is not None:
             body = json.dumps(json_body).encode()
             content_type = "application/json"
-        last_exc: Exception | None = None
-        for attempt in range(3):
+        record_id = _record_of(url)
+        if record_id is not None:
+            with self._lock:
+                self.records.add(record_id)
+        if record_id is None:
+            status, _, txt = self._send(method, url, body, content_type, content_length)
+            return status, _parse(txt)
+        if method != "GET":
+            try:
+                status, _, txt = self._send(method, url, body, content_type, content_length)
+            finally:
+                self._invalidate(record_id)
+            return status, _parse(txt)
+
+        with self._lock:
+            hit = self._cache.get(url)
+            if hit is not None and not hit.stale:
+                self.stats["cache_hits"] += 1
+                return 200, _parse(hit.text)
+        extra = {"If-None-Match": hit.etag} if hit is not None and hit.etag else {}
+        status, headers, txt = self._send(
+            method, url, body, content_type, content_length, extra,
+        )
+        with self._lock:
+            if status == 304 and hit is not None:
+                self.stats["revalidated"] += 1
+                hit.stale = False
+                return 200, _parse(hit.text)
+            etag = headers.get("ETag") if headers is not None else None
+            self._cache[url] = _Cached(etag, txt)
+        return status, _parse(txt)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Any,
+        content_type: str | None,
+        content_length: int | None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> tuple[int, Any, str]:
+        """One logical request with retries; ``(status, headers, text)``.
+        A ``304`` comes back as a status, not an error."""
+        limiter = ratelimit.limiter_for(url)
+        attempt = 0
+        throttled = 0
+        while True:
             # A streamed body (open file / _PartReader) is spent by a
             # failed attempt — rewind it or the retry sends zero bytes.
-            if attempt and hasattr(body, "seek"):
+            if (attempt or throttled) and hasattr(body, "seek"):
                 body.seek(0)
             req = urllib.request.Request(url, data=body, method=method)
             req.add_header("Authorization", f"Bearer {self._token}")
@@ -133,23 +305,43 @@ class ZenodoClient:
                 req.add_header("Content-Type", content_type)
             if content_length is not None:
                 req.add_header("Content-Length", str(content_length))
+            for name, value in (extra_headers or {}).items():
+                req.add_header(name, value)
             try:
-                with urllib.request.urlopen(req, timeout=self._timeout) as resp:
-                    txt = resp.read().decode("utf-8")
-                    return resp.status, (json.loads(txt) if txt.strip() else {})
+                # An upload body (file / _PartReader) may stream for hours;
+                # it must not hold one of the host's concurrency slots.
+                with limiter.slot(hold=not hasattr(body, "read")) as seen:
+                    self._count("requests")
+                    try:
+                        if hasattr(body, "send_to") and not _proxied(url):
+                            status, headers, raw = self._stream(
+                                method, url, body, content_type, content_length,
+                            )
+                            seen.record(status, headers)
+                            return status, headers, raw.decode("utf-8")
+                        with urllib.request.urlopen(req, timeout=self._timeout) as resp:
+                            headers = getattr(resp, "headers", None)
+                            seen.record(resp.status, headers)
+                            return resp.status, headers, resp.read().decode("utf-8")
+                    except urllib.error.HTTPError as e:
+                        seen.record(e.code, e.headers)
+                        raise
             except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    return 304, e.headers, ""
                 detail = ""
                 try:
                     detail = e.read().decode("utf-8", errors="replace")[:500]
                 except Exception:
                     pass
-                if e.code == 429 and attempt < 2:
-                    time.sleep(int(e.headers.get("Retry-After", "10")))
-                    last_exc = e
+                if e.code == 429 and throttled < ratelimit.MAX_THROTTLE_RETRIES:
+                    # The limiter already holds every caller until the
+                    # reset; just go round again.
+                    throttled += 1
                     continue
                 if 500 <= e.code < 600 and attempt < 2:
-                    time.sleep(2 ** (attempt + 1))
-                    last_exc = e
+                    attempt += 1
+                    time.sleep(2 ** attempt)
                     continue
                 if e.code in (401, 403):
                     raise ZenodoError(
@@ -158,6 +350,10 @@ class ZenodoClient:
                         f"lacking deposit scope ({detail})",
                         e.code,
                     ) from e
+                if e.code == 429:
+                    raise ZenodoError(
+                        "transient", f"HTTP 429 from Zenodo after retries: {detail}", e.code
+                    ) from e
                 if 400 <= e.code < 500:
                     raise ZenodoError(
                         "data", f"HTTP {e.code} from Zenodo: {detail}", e.code
@@ -167,15 +363,78 @@ class ZenodoClient:
                 ) from e
             except OSError as e:  # DNS/conn/timeouts
                 if attempt < 2:
-                    time.sleep(2 ** (attempt + 1))
-                    last_exc = e
+                    attempt += 1
+                    time.sleep(2 ** attempt)
                     continue
                 raise ZenodoError("transient", f"connection to Zenodo failed: {e}") from e
-        raise ZenodoError("transient", f"Zenodo retries exhausted: {last_exc}")
+
+
+@dataclass
+class _Cached:
+    etag: str | None
+    text: str
+    stale: bool = False
+
+
+_RECORD_URL = re.compile(r"/api/records/(\d+)(?:/|$)")
+
+
+def _record_of(url: str) -> str | None:
+    """The record id a URL belongs to (``None`` outside ``/api/records/<id>``)."""
+    m = _RECORD_URL.search(urllib.parse.urlsplit(url).path)
+    return m.group(1) if m else None
+
+
+def _parse(txt: str) -> dict:
+    return json.loads(txt) if txt.strip() else {}
+
+
+def _proxied(url: str) -> bool:
+    """Does the environment route this URL through a proxy? Then the
+    keep-alive path (which talks to the origin directly) is skipped and
+    urllib's proxy handling is used."""
+    parts = urllib.parse.urlsplit(url)
+    return bool(urllib.request.getproxies().get(parts.scheme)) and not \
+        urllib.request.proxy_bypass(parts.hostname or "")
+
+
+_CLIENTS: dict[tuple[str, str], ZenodoClient] = {}
+_CLIENTS_LOCK = threading.Lock()
 
 
 def get_client(settings: ZenodoSettings) -> ZenodoClient:
-    return ZenodoClient(settings.base_url, load_token(settings))
+    """The shared client for the configured environment — memoized, so
+    every step of a run shares one state cache and one set of
+    keep-alive connections (``reset_clients`` starts a new run)."""
+    token = load_token(settings)
+    with _CLIENTS_LOCK:
+        key = (settings.base_url, token)
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = ZenodoClient(settings.base_url, token)
+        return client
+
+
+def reset_clients() -> None:
+    """Forget memoized clients (and their caches) — start of an ``oa auto`` run."""
+    with _CLIENTS_LOCK:
+        _CLIENTS.clear()
+
+
+def request_report() -> str:
+    """One digest line: Zenodo requests sent, per record touched, and
+    what the state cache saved. Empty when no client was used."""
+    with _CLIENTS_LOCK:
+        stats = sum((c.stats for c in _CLIENTS.values()), Counter())
+        records = len(set().union(*(c.records for c in _CLIENTS.values())))
+    sent = stats["requests"]
+    if not sent and not stats["cache_hits"]:
+        return ""
+    per = f" (~{sent / records:.1f} per archive over {records})" if records else ""
+    return (
+        f"{sent} request(s){per}; {stats['cache_hits']} answered from the "
+        f"state cache, {stats['revalidated']} revalidated (304)"
+    )
 
 
 # ── Author parsing (pure) ────────────────────────────────────────────
@@ -184,8 +443,12 @@ _WOS_PAREN = re.compile(r"\(([^)]+)\)")
 _WOS_BRACKETS = re.compile(r"\[[^\]]*\]")
 
 
+@functools.lru_cache(maxsize=8192)
 def _normalize(s: str) -> str:
-    """Casefold + strip accents so 'Rodríguez' matches 'Rodriguez'."""
+    """Casefold + strip accents so 'Rodríguez' matches 'Rodriguez'.
+
+    Cached: consortium papers repeat the same few hundred names across
+    every (author, known person) comparison and across a batch."""
     nfkd = unicodedata.normalize("NFD", s)
     return "".join(c for c in nfkd if not unicodedata.combining(c)).casefold()
 
@@ -236,20 +499,42 @@ def parse_plain_authors(author: str) -> list[tuple[str, str]]:
     return out
 
 
+@dataclass(frozen=True)
+class _KnownName:
+    """A biomaGUNE display name, normalized once per payload."""
+    text: str
+    tokens: tuple[str, ...]
+
+
+def _known_names(names: list[str]) -> list[_KnownName]:
+    out = []
+    for name in names:
+        text = _normalize(name or "")
+        if text:
+            out.append(_KnownName(text, tuple(text.split())))
+    return out
+
+
+def _matches_known(fam_tokens: list[str], initial: str, known: _KnownName) -> bool:
+    if not fam_tokens or not all(t in known.text for t in fam_tokens):
+        return False
+    if initial:
+        return any(tok.startswith(initial) for tok in known.tokens)
+    return True
+
+
+def _author_key(family: str, given: str) -> tuple[list[str], str]:
+    """Surname tokens + given-name initial, normalized, for matching."""
+    fam_tokens = [t for t in _normalize(family).replace("-", " ").split() if t]
+    return fam_tokens, (_normalize(given)[:1] if given else "")
+
+
 def _matches_person(family: str, given: str, known_name: str) -> bool:
     """True when a parsed author matches a biomaGUNE person's display name
     (``center_user.name``, e.g. 'Susana Carregal Romero') by surname +
     first-initial, accent- and case-insensitive."""
-    known = _normalize(known_name)
-    if not known:
-        return False
-    fam_tokens = [t for t in _normalize(family).replace("-", " ").split() if t]
-    if not fam_tokens or not all(t in known for t in fam_tokens):
-        return False
-    if given:
-        initial = _normalize(given)[0]
-        return any(tok.startswith(initial) for tok in known.split())
-    return True
+    known = _known_names([known_name])
+    return bool(known) and _matches_known(*_author_key(family, given), known[0])
 
 
 def build_creators(
@@ -270,6 +555,7 @@ def build_creators(
     if not parsed:
         parsed = parse_plain_authors(author_fallback or "")
         used_fallback = True
+    known = _known_names(biomagune_names)
     creators: list[dict] = []
     for family, given in parsed:
         entry: dict[str, Any] = {
@@ -279,7 +565,8 @@ def build_creators(
                 **({"given_name": given} if given else {}),
             }
         }
-        if any(_matches_person(family, given, n) for n in biomagune_names if n):
+        fam_tokens, initial = _author_key(family, given)
+        if any(_matches_known(fam_tokens, initial, k) for k in known):
             entry["affiliations"] = [{"name": affiliation}]
         creators.append(entry)
     return creators, used_fallback
@@ -420,6 +707,38 @@ def build_record_payload(
     return {"access": access, "files": {"enabled": True}, "metadata": metadata}
 
 
+def build_record_payloads(
+    archives: list[dict[str, Any]],
+    settings: ZenodoSettings,
+    extras: dict[str, dict[str, Any]] | None = None,
+    *,
+    today: date | None = None,
+) -> dict[str, dict[str, Any]]:
+    """``build_record_payload`` for a batch: publication id → payload.
+
+    ``extras`` maps publication id → the live central-DB fields
+    (``fetch_publication_extras`` shape); a missing entry degrades like
+    an unreachable central DB. One ``today`` for the whole batch.
+    """
+    today = today or date.today()
+    extras = extras or {}
+    out: dict[str, dict[str, Any]] = {}
+    for archive in archives:
+        pub_id = archive["publication_id"]
+        ex = extras.get(pub_id) or {}
+        out[pub_id] = build_record_payload(
+            archive, settings,
+            abstract=ex.get("abstract"),
+            author_with_affiliation=ex.get("author_with_affiliation"),
+            author_fallback=ex.get("author"),
+            extra_biomagune_names=(
+                [ex["first_author_name"]] if ex.get("first_author_name") else []
+            ),
+            today=today,
+        )
+    return out
+
+
 def summarize_payload(payload: dict[str, Any]) -> str:
     """One-line operator summary for sheet notes / the digest."""
     md = payload.get("metadata", {})
@@ -492,6 +811,11 @@ def create_draft(client: ZenodoClient, payload: dict[str, Any]) -> DraftInfo:
         doi = _extract_doi(with_doi, record_id)
     except ZenodoError:
         pass
+    # A new draft has no files: the first ``upload_files`` listing need
+    # not ask.
+    remember = getattr(client, "remember", None)
+    if remember is not None:
+        remember(f"/api/records/{record_id}/draft/files", {"entries": []})
     links = body.get("links") or {}
     html_url = links.get("self_html") or ""
     return DraftInfo(record_id=record_id, doi=doi, html_url=html_url)
@@ -541,6 +865,9 @@ def publish(client: ZenodoClient, record_id: str) -> dict:
     ``final_pid`` for the permanent record; read all known locations and
     fall back to the deterministic Zenodo form so the DOI is never lost."""
     _, body = client.request("POST", f"/api/records/{record_id}/draft/actions/publish")
+    remember = getattr(client, "remember", None)
+    if remember is not None:
+        remember(f"/api/records/{record_id}", body)     # the published record
     doi = _extract_doi(body, record_id)
     links = body.get("links") or {}
     return {"doi": doi, "html_url": links.get("self_html") or ""}
@@ -599,21 +926,36 @@ def _md5(path: Path) -> str:
     return h.hexdigest()
 
 
+# Block size for streamed upload bodies: one preallocated buffer per
+# body, reused for every block (urllib's file path reads 8 KiB ``bytes``).
+_SEND_BLOCK = 1024 * 1024
+
+
 class _PartReader:
     """File-like view of one slice of a file, for streaming a multipart
     part without reading it into memory.
 
     ``seek(0)`` rewinds to the *slice start* — that is what the client's
     retry loop calls, so a failed part PUT restarts cleanly at the part
-    boundary, never at byte 0 of the whole file.
+    boundary, never at byte 0 of the whole file. With a ``throttle``
+    (``ratelimit.BandwidthLimiter``) every read is paced against the
+    shared upload budget. A whole-file single PUT is the slice
+    ``(0, size)``.
+
+    ``ZenodoClient`` sends it with ``send_to`` (kernel ``sendfile`` on a
+    plain socket, a reused ``readinto`` buffer over TLS); ``read`` stays
+    for everything else that wants a file object. Nothing is hashed on
+    the way out: the preflight md5 of the whole file is what resume and
+    the remote checksum comparison rely on.
     """
 
-    def __init__(self, path: Path, offset: int, length: int):
+    def __init__(self, path: Path, offset: int, length: int, throttle: Any = None):
         self._f = open(path, "rb")
         self._offset = offset
         self._length = length
         self._f.seek(offset)
         self._remaining = length
+        self._throttle = throttle
 
     def read(self, n: int = -1) -> bytes:
         if self._remaining <= 0:
@@ -622,8 +964,42 @@ class _PartReader:
             n = self._remaining
         chunk = self._f.read(n)
         self._remaining -= len(chunk)
+        if self._throttle is not None:
+            self._throttle.consume(len(chunk))
         return chunk
 
+    def send_to(self, sock: Any) -> None:
+        """Write the (remaining) slice to a connected socket.
+
+        Plain TCP goes through ``socket.sendfile`` — the bytes never enter
+        the interpreter. TLS sockets can't do that (``SSLSocket.sendfile`` degrades to
+        small ``read()`` calls), so we fill one preallocated buffer with
+        ``readinto`` and send memoryview slices of it.
+        """
+        if (isinstance(sock, socket.socket) and not isinstance(sock, ssl.SSLSocket)
+                and hasattr(os, "sendfile")):
+            pos = self._offset + self._length - self._remaining
+            while self._remaining > 0:
+                count = min(_SEND_BLOCK, self._remaining)
+                if self._throttle is not None:
+                    self._throttle.consume(count)
+                sent = sock.sendfile(self._f, pos, count)
+                if not sent:
+                    raise ConnectionError("sendfile sent 0 bytes (peer closed?)")
+                pos += sent
+                self._remaining -= sent
+            return
+        buf = memoryview(bytearray(min(_SEND_BLOCK, max(self._remaining, 1))))
+        while self._remaining > 0:
+            n = self._f.readinto(buf[:min(len(buf), self._remaining)])
+            if not n:
+                raise OSError(f"{self._f.name} shrank while uploading")
+            view = buf[:n]
+            self._remaining -= n
+            if self._throttle is not None:
+                self._throttle.consume(n)
+            sock.sendall(view)
+
     def seek(self, pos: int) -> None:
         if pos != 0:
             raise ValueError("_PartReader only supports seek(0)")
@@ -640,6 +1016,83 @@ class _PartReader:
         self.close()
 
 
+class UploadProgress:
+    """Where multipart progress is remembered between runs.
+
+    This base class remembers nothing, so every interrupted upload
+    restarts clean. actions.py passes a subclass backed by the tracker
+    DB (``upload_parts``) — no SQLite in here — so a run that dies
+    mid-file resumes at the first missing part on the next run.
+    Part rows are dicts with ``file_size``, ``file_md5``, ``part_size``
+    and ``part_number``.
+    """
+
+    def completed_parts(self, record_id: str, key: str) -> list[dict]:
+        return []
+
+    def part_done(
+        self, record_id: str, key: str, *, file_size: int, file_md5: str,
+        part_size: int, part_number: int,
+    ) -> None:
+        pass
+
+    def clear(self, record_id: str, key: str) -> None:
+        pass
+
+
+def _recorded_parts(
+    progress: UploadProgress, record_id: str, key: str,
+    size: int, md5: str, part_size: int,
+) -> set[int]:
+    """Numbers of the parts already sent for THIS local file.
+
+    Every recorded row must have been cut from a file of the same size,
+    md5 and part size — otherwise the file changed (or the part size was
+    reconfigured) since the interrupted run and nothing is reusable. The
+    whole-file md5 pins every slice, so parts need no hash of their own;
+    without it nothing is trusted.
+    """
+    rows = progress.completed_parts(record_id, key)
+    if not md5 or not rows or any(
+        r["file_size"] != size or r["file_md5"] != md5 or r["part_size"] != part_size
+        for r in rows
+    ):
+        return set()
+    return {r["part_number"] for r in rows}
+
+
+def _part_links(entry: dict | None) -> dict[int, str]:
+    return {
+        p["part"]: p["url"]
+        for p in ((entry or {}).get("links") or {}).get("parts", [])
+    }
+
+
+def _pending_part_urls(
+    client: ZenodoClient, record_id: str, key: str, entry: dict, parts: int,
+) -> dict[int, str]:
+    """The part URLs of a pending multipart entry, or ``{}`` when the
+    server does not hand them out again (resume unsupported → restart).
+
+    The draft files listing may omit per-part links; the single-entry
+    GET is asked as well before giving up.
+    """
+    if entry.get("status") == "completed":
+        return {}
+    urls = _part_links(entry)
+    if len(urls) < parts:
+        try:
+            _, body = client.request(
+                "GET", f"/api/records/{record_id}/draft/files/{urllib.parse.quote(key)}",
+            )
+        except ZenodoError as e:
+            if e.kind == "data":
+                return {}
+            raise
+        urls = _part_links(body)
+    return urls if len(urls) >= parts else {}
+
+
 def _upload_multipart(
     client: ZenodoClient,
     record_id: str,
@@ -647,6 +1100,12 @@ def _upload_multipart(
     path: Path,
     part_size: int,
     on_progress: Callable[[str], None] | None = None,
+    *,
+    file_md5: str = "",
+    progress: UploadProgress | None = None,
+    resume_urls: dict[int, str] | None = None,
+    done_parts: set[int] | None = None,
+    throttle: Any = None,
 ) -> bool:
     """Upload one large file via the InvenioRDM multipart transfer
     (type ``M``): init returns one URL per part; each part is an
@@ -658,57 +1117,48 @@ def _upload_multipart(
     sandbox accepts a type-M init (and issues part URLs) but then denies
     the part uploads with 403 — the scaffolding is deployed, the feature
     isn't enabled for API users yet. Transient failures still raise.
+
+    Each confirmed part is reported to ``progress``. With ``resume_urls``
+    (the part URLs of the interrupted upload's pending entry) the init is
+    skipped and only parts missing from ``done_parts`` are sent; a
+    refused part (e.g. the URLs expired) cleans up and returns False
+    like any other 4xx, so the caller can restart clean.
     """
+    progress = progress or UploadProgress()
     size = path.stat().st_size
     parts = max(1, (size + part_size - 1) // part_size)
-    try:
-        _, resp = client.request(
-            "POST", f"/api/records/{record_id}/draft/files",
-            json_body=[{
-                "key": key,
-                "size": size,
-                "transfer": {"type": "M", "parts": parts, "part_size": part_size},
-            }],
-        )
-    except ZenodoError as e:
-        if e.kind == "data":
-            # Environment without multipart support — feature-detect
-            # fallback. Clear any half-created entry, then let the
-            # caller single-PUT.
-            try:
-                delete_draft_file(client, record_id, key)
-            except ZenodoError:
-                pass
+    if resume_urls:
+        part_urls = resume_urls
+        done = set(done_parts or ())
+    else:
+        part_urls = {}
+        done = set()
+        progress.clear(record_id, key)
+    if not part_urls:
+        part_urls = _init_multipart(client, record_id, key, size, parts, part_size)
+        if not part_urls:
             return False
-        raise
-
-    entry = next((e for e in resp.get("entries", []) if e.get("key") == key), None)
-    part_urls = {
-        p["part"]: p["url"]
-        for p in ((entry or {}).get("links") or {}).get("parts", [])
-    }
-    if len(part_urls) < parts:
-        # Accepted the init but gave no usable part links — treat like
-        # an unsupported environment rather than guessing URLs.
-        try:
-            delete_draft_file(client, record_id, key)
-        except ZenodoError:
-            pass
-        return False
-
     try:
         for i in range(1, parts + 1):
             offset = (i - 1) * part_size
             length = min(part_size, size - offset)
+            if i in done:
+                if on_progress:
+                    on_progress(f"{key} part {i}/{parts} already uploaded — skipped")
+                continue
             if on_progress:
                 on_progress(f"uploading {key} part {i}/{parts} ({length} bytes)")
-            with _PartReader(path, offset, length) as reader:
+            with _PartReader(path, offset, length, throttle) as reader:
                 client.request(
                     "PUT", part_urls[i],
                     data=reader,
                     content_type="application/octet-stream",
                     content_length=length,
                 )
+                progress.part_done(
+                    record_id, key, file_size=size, file_md5=file_md5,
+                    part_size=part_size, part_number=i,
+                )
         client.request(
             "POST",
             f"/api/records/{record_id}/draft/files/{urllib.parse.quote(key)}/commit",
@@ -722,24 +1172,73 @@ def _upload_multipart(
                 delete_draft_file(client, record_id, key)
             except ZenodoError:
                 pass
+            progress.clear(record_id, key)
             return False
         raise
+    progress.clear(record_id, key)
     return True
 
 
+def _init_multipart(
+    client: ZenodoClient, record_id: str, key: str, size: int, parts: int, part_size: int,
+) -> dict[int, str]:
+    """Register a type-M draft file; part number → URL, or ``{}`` when
+    the environment does not support multipart (entry cleaned up)."""
+    try:
+        _, resp = client.request(
+            "POST", f"/api/records/{record_id}/draft/files",
+            json_body=[{
+                "key": key,
+                "size": size,
+                "transfer": {"type": "M", "parts": parts, "part_size": part_size},
+            }],
+        )
+    except ZenodoError as e:
+        if e.kind == "data":
+            # Environment without multipart support — feature-detect
+            # fallback. Clear any half-created entry, then let the
+            # caller single-PUT.
+            try:
+                delete_draft_file(client, record_id, key)
+            except ZenodoError:
+                pass
+            return {}
+        raise
+
+    entry = next((e for e in resp.get("entries", []) if e.get("key") == key), None)
+    part_urls = _part_links(entry)
+    if len(part_urls) < parts:
+        # Accepted the init but gave no usable part links — treat like
+        # an unsupported environment rather than guessing URLs.
+        try:
+            delete_draft_file(client, record_id, key)
+        except ZenodoError:
+            pass
+        return {}
+    return part_urls
+
+
 @dataclass
 class UploadResult:
     uploaded: list[str] = field(default_factory=list)
     already_present: list[str] = field(default_factory=list)
     replaced: list[str] = field(default_factory=list)
+    resumed: list[str] = field(default_factory=list)          # multipart, missing parts only
     skipped_local: list[str] = field(default_factory=list)   # not in upload mode
     manual_required: list[str] = field(default_factory=list)  # too big for unattended
+    deferred: list[str] = field(default_factory=list)         # waiting for the upload window
+    window: str = ""
     errors: list[str] = field(default_factory=list)
 
     @property
     def ok(self) -> bool:
         return not self.errors
 
+    @property
+    def complete(self) -> bool:
+        """Nothing failed AND nothing is left for a later window."""
+        return self.ok and not self.deferred
+
     @property
     def summary(self) -> str:
         parts = [
@@ -748,8 +1247,14 @@ class UploadResult:
         ]
         if self.replaced:
             parts.append(f"replaced {len(self.replaced)}")
+        if self.resumed:
+            parts.append(f"resumed {len(self.resumed)}")
         if self.manual_required:
             parts.append(f"MANUAL UPLOAD NEEDED: {', '.join(self.manual_required)}")
+        if self.deferred:
+            parts.append(
+                f"deferred to the upload window {self.window}: {', '.join(self.deferred)}"
+            )
         if self.skipped_local:
             parts.append(f"not uploaded (outside package): {', '.join(self.skipped_local)}")
         if self.errors:
@@ -757,6 +1262,29 @@ class UploadResult:
         return "; ".join(parts)
 
 
+def in_upload_window(window: str, now: datetime) -> bool:
+    """Is ``now`` inside a ``"HH:MM-HH:MM"`` window (local time)?
+
+    The window may wrap midnight (``"22:00-06:00"``); an empty window is
+    always open. Only the *start* of a transfer is gated — a file begun
+    inside the window is allowed to finish after it closes.
+    """
+    if not window.strip():
+        return True
+    try:
+        start_s, end_s = (part.strip() for part in window.split("-", 1))
+        start = dt_time.fromisoformat(start_s)
+        end = dt_time.fromisoformat(end_s)
+    except ValueError as e:
+        raise ZenodoError(
+            "config", f"[zenodo] large_upload_window {window!r} is not 'HH:MM-HH:MM'"
+        ) from e
+    t = now.time()
+    if start <= end:
+        return start <= t < end
+    return t >= start or t < end
+
+
 def _entry_matches(entry: dict | None, local_md5: str, local_size: int) -> bool:
     """Is the remote draft entry the same file we have locally?
 
@@ -765,7 +1293,8 @@ def _entry_matches(entry: dict | None, local_md5: str, local_size: int) -> bool:
     checksum (or none), so fall back to completed-status + byte size.
     Without the fallback a completed large upload would look changed and
     be deleted + re-sent on every run. Stale ``pending`` entries (an
-    interrupted upload) never match — status isn't ``completed``.
+    interrupted upload) never match — status isn't ``completed``; the
+    caller resumes them when it can, else restarts them clean.
     """
     if not entry:
         return False
@@ -781,17 +1310,33 @@ def upload_files(
     folder: Path,
     settings: ZenodoSettings,
     on_progress: Callable[[str], None] | None = None,
+    progress: UploadProgress | None = None,
+    now: datetime | None = None,
 ) -> UploadResult:
     """Upload the archive folder's files to the draft, idempotently.
 
     Convergent: files already on the draft with a matching md5 are left
     alone; a local file whose checksum changed is deleted and re-uploaded;
-    missing files are uploaded. A manifest is written next to the upload
+    missing files are uploaded. A multipart upload interrupted by an
+    earlier run is resumed — only the parts missing from ``progress`` are
+    sent — when the pending entry still hands out its part URLs;
+    otherwise it restarts clean. A manifest is written next to the upload
     (``manifest_dir/<record_id>/manifest.json``) for the audit trail.
     Flattening: nested files upload under ``subdir_name`` keys (collision
-    → error, never overwrite).
+    → error, never overwrite). Before anything is sent each file passes
+    ``preflight.check_files`` (md5 + zip CRCs in one read, cached by size
+    and mtime); a corrupt zip is reported and skipped.
+
+    Every body is paced by the shared ``upload_bytes_per_sec`` budget.
+    With ``large_upload_window`` set, files above ``single_put_max_mb``
+    start only inside the window (``now``, default the local clock) and
+    are sent unattended there; outside it they are ``deferred`` for a
+    later run instead of becoming ``manual_required``.
     """
-    result = UploadResult()
+    result = UploadResult(window=settings.large_upload_window)
+    progress = progress or UploadProgress()
+    throttle = ratelimit.upload_bandwidth(settings.upload_bytes_per_sec)
+    window_open = in_upload_window(settings.large_upload_window, now or datetime.now())
     to_upload, skipped = discover_files(folder, settings.upload_files)
     result.skipped_local = [p.name for p in skipped]
     if not to_upload:
@@ -822,31 +1367,76 @@ def upload_files(
     part_size = settings.multipart_part_size_mb * 1024**2
     single_put_max = settings.single_put_max_mb * 1024**2
 
+    # One local read pass per (changed) file: md5 + zip CRCs, cached.
+    checks = preflight.check_files(
+        list(keyed.values()), Path(settings.manifest_dir) / "preflight_cache.json",
+    )
     remote = list_draft_files(client, record_id)
     manifest_entries = []
     for key, path in keyed.items():
-        local_md5 = _md5(path)
-        local_size = path.stat().st_size
+        check = checks[path]
+        if not check.ok:
+            # Never publish a broken archive; the operator re-creates it.
+            result.errors.append(
+                f"{key}: zip integrity check failed — {check.error}; not uploaded "
+                "(re-create the archive, then re-run zenodo_upload_files)"
+            )
+            continue
+        local_md5 = check.md5
+        local_size = check.size
         entry = remote.get(key)
         used_multipart = False
         try:
             if _entry_matches(entry, local_md5, local_size):
                 result.already_present.append(key)
+            elif local_size > single_put_max and not window_open:
+                # A big transfer outside its window: leave any pending
+                # entry (and its recorded parts) for the in-window run.
+                result.deferred.append(key)
+                continue
             else:
-                if entry:
+                done_parts: set[int] = set()
+                resume_urls: dict[int, str] = {}
+                if entry and local_size > threshold:
+                    done_parts = _recorded_parts(
+                        progress, record_id, key, local_size, local_md5, part_size,
+                    )
+                    if done_parts:
+                        parts = max(1, (local_size + part_size - 1) // part_size)
+                        resume_urls = _pending_part_urls(
+                            client, record_id, key, entry, parts,
+                        )
+                if entry and not resume_urls:
                     # Covers changed files AND stale "pending" entries
-                    # left by an interrupted upload — both restart clean.
+                    # that cannot be resumed — both restart clean.
                     delete_draft_file(client, record_id, key)
+                    progress.clear(record_id, key)
                     result.replaced.append(key)
                 if local_size > threshold:
                     used_multipart = _upload_multipart(
                         client, record_id, key, path, part_size, on_progress,
+                        file_md5=local_md5, progress=progress,
+                        resume_urls=resume_urls, done_parts=done_parts,
+                        throttle=throttle,
                     )
-                if not used_multipart and local_size > single_put_max:
+                    if resume_urls and used_multipart:
+                        result.resumed.append(key)
+                    elif resume_urls:
+                        # The pending entry could not be continued (and
+                        # has been removed) — one clean multipart start.
+                        result.replaced.append(key)
+                        used_multipart = _upload_multipart(
+                            client, record_id, key, path, part_size, on_progress,
+                            file_md5=local_md5, progress=progress, throttle=throttle,
+                        )
+                if (not used_multipart and local_size > single_put_max
+                        and not settings.large_upload_window):
                     # Multipart unavailable and the file is too big to
                     # single-PUT unattended — a mid-stream drop would
                     # re-send everything. Defer to the operator; a hand
                     # upload is recognised by checksum on the next run.
+                    # (With an upload window configured, big files are
+                    # sent unattended inside it instead.)
                     result.manual_required.append(key)
                     result.errors.append(
                         f"{key} ({local_size / 1024**3:.1f} GB): too large for an "
@@ -865,11 +1455,11 @@ def upload_files(
                         "POST", f"/api/records/{record_id}/draft/files",
                         json_body=[{"key": key}],
                     )
-                    with open(path, "rb") as f:
+                    with _PartReader(path, 0, local_size, throttle) as body:
                         client.request(
                             "PUT",
                             f"/api/records/{record_id}/draft/files/{urllib.parse.quote(key)}/content",
-                            data=f,
+                            data=body,
                             content_type="application/octet-stream",
                             content_length=local_size,
                         )
@@ -895,6 +1485,7 @@ def upload_files(
                 "key": key, "path": str(path), "md5": local_md5,
                 "size": local_size,
                 "multipart": used_multipart,
+                "zip_verified": check.zip_ok,
             })
         except ZenodoError as e:
             result.errors.append(f"{key}: {e}")
@@ -917,35 +1508,54 @@ def fetch_publication_extras(pub_id: str) -> dict[str, Any]:
     the payload builder degrades gracefully (no-abstract template,
     data-contact-only creator fallback).
     """
-    out = {"abstract": "", "author_with_affiliation": "", "author": "",
-           "first_author_name": ""}
+    return fetch_publication_extras_bulk([pub_id])[pub_id]
+
+
+def fetch_publication_extras_bulk(pub_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """``fetch_publication_extras`` for many publications: one connection,
+    two ``IN`` queries. Every requested id gets an entry; all empty
+    strings when the central DB is unreachable."""
+    import html
+
+    out = {
+        pid: {"abstract": "", "author_with_affiliation": "", "author": "",
+              "first_author_name": ""}
+        for pid in pub_ids
+    }
+    if not out:
+        return out
+    ids = list(out)
+    placeholders = ", ".join("%s" for _ in ids)
     try:
         from oa_tracker import pub_db
         conn = pub_db.get_connection()
         try:
             with conn.cursor() as cur:
                 cur.execute(
-                    "SELECT abstract, author, author_with_affiliation "
-                    "FROM publication WHERE id = %s",
-                    (pub_id,),
+                    "SELECT id, abstract, author, author_with_affiliation "
+                    f"FROM publication WHERE id IN ({placeholders})",
+                    ids,
                 )
-                row = cur.fetchone()
-                if row:
-                    out["abstract"] = row.get("abstract") or ""
-                    out["author"] = row.get("author") or ""
-                    out["author_with_affiliation"] = row.get("author_with_affiliation") or ""
+                for row in cur.fetchall():
+                    extras = out.get(str(row.get("id")))
+                    if extras is None:
+                        continue
+                    extras["abstract"] = row.get("abstract") or ""
+                    extras["author"] = row.get("author") or ""
+                    extras["author_with_affiliation"] = row.get("author_with_affiliation") or ""
                 # First author (for biomaGUNE affiliation tagging) — same
                 # center_user join as the corresponding author.
                 cur.execute(
-                    "SELECT cu.name AS name FROM publi_first_auth pfa "
+                    "SELECT pfa.id_publi AS id_publi, cu.name AS name "
+                    "FROM publi_first_auth pfa "
                     "JOIN center_user cu ON cu.id_user = pfa.id_user "
-                    "WHERE pfa.id_publi = %s AND pfa.id_user > 0",
-                    (pub_id,),
+                    f"WHERE pfa.id_publi IN ({placeholders}) AND pfa.id_user > 0",
+                    ids,
                 )
-                fa = cur.fetchone()
-                if fa and fa.get("name"):
-                    import html
-                    out["first_author_name"] = html.unescape(fa["name"])
+                for fa in cur.fetchall():
+                    extras = out.get(str(fa.get("id_publi")))
+                    if extras is not None and fa.get("name") and not extras["first_author_name"]:
+                        extras["first_author_name"] = html.unescape(fa["name"])
         finally:
             conn.close()
     except Exception:
@@ -112,3 +112,12 @@ def test_config(tmp_path, tmp_db, tmp_sharepoint, tmp_templates):
             max_reminders=5,
         ),
     )
+
+
+@pytest.fixture
+def fresh_limiters(monkeypatch):
+    """A fresh per-host rate-limit budget for the test — the process-wide
+    limiters otherwise carry tokens and throttle state across tests."""
+    from oa_tracker import ratelimit
+
+    monkeypatch.setattr(ratelimit, "_LIMITERS", {})
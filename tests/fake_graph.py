@@ -0,0 +1,490 @@
+"""Standard-library HTTP stand-in for the Microsoft Graph SharePoint API.
+
+``test_sharepoint.py``'s ``FakeGraph`` replaces the *client*, so
+paging, ``$batch``, delta tokens, 429 handling and payload sizes in
+``GraphClient`` never meet a socket there. This server implements the
+endpoints ``sharepoint.py`` calls, over real HTTP/1.1, under ``/v1.0``:
+
+    GET    /sites/{host}:/sites/{path}                  site id
+    GET    /sites/{site}/lists                          ($filter, $select, $top, paging)
+    POST   /sites/{site}/lists                          create list
+    GET    /sites/{site}/lists/{list}                   list by id or display name
+    GET    /sites/{site}/lists/{list}/columns           columns
+    POST   /sites/{site}/lists/{list}/columns           create column (409 if present)
+    GET    /sites/{site}/lists/{list}/items             ($expand=fields($select=…), $filter, paging)
+    POST   /sites/{site}/lists/{list}/items             create item
+    PATCH  /sites/{site}/lists/{list}/items/{id}/fields update fields
+    DELETE /sites/{site}/lists/{list}/items/{id}        delete item
+    GET    /sites/{site}/lists/{list}/items/delta       delta rounds (token links, 410 on a bad one)
+    POST   /$batch                                      JSON batching, ≤ 20 sub-requests
+
+The site's hidden User Information List exists from the start
+(``add_users``). Items come back the way Graph sends them: with the
+item envelope, SharePoint's own hidden fields unless ``$select``ed away,
+numbers as floats and LookupIds as strings. ``$filter`` on the
+unindexed ``Modified`` column needs the ``Prefer`` header, as on Graph.
+Paging links are absolute, and a delta link keeps its round's
+``$expand``. Behaviour knobs live on ``Faults`` and can be changed while
+the server runs; ``Stats`` counts requests, sub-requests and bytes.
+
+    with FakeGraphServer(token="tok") as server:
+        client = sharepoint.GraphClient(sp, base_url=server.graph_url, token="tok")
+        ...
+"""
+
+from __future__ import annotations
+
+import http.server
+import json
+import re
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+SITE_ID = "fake.sharepoint.com,00000000-0000-0000-0000-000000000001,00000000-0000-0000-0000-000000000002"
+UIL_NAME = "User Information List"
+BATCH_MAX = 20
+_PREFER = "HonorNonIndexedQueriesWarningMayFailRandomly"
+_LABEL = re.compile(r"/(sites|lists|items)/(?!delta\b)[^/]+")
+
+
+@dataclass
+class Faults:
+    """Injected behaviour. ``*_every=n`` fires on every n-th matching
+    request (counted per knob); 0 disables it."""
+    latency: float = 0.0            # seconds added before every response
+    throttle_every: int = 0         # top-level request → 429 with ``Retry-After``
+    sub_throttle_every: int = 0     # ``$batch`` sub-request → 429 in the batch reply
+    retry_after: float = 0.0
+    max_page: int = 200             # items per page, whatever ``$top`` asks for
+
+
+@dataclass
+class Stats:
+    requests: Counter = field(default_factory=Counter)       # "METHOD route" → n
+    sub_requests: Counter = field(default_factory=Counter)   # inside ``$batch``
+    status: Counter = field(default_factory=Counter)         # status code → n
+    sub_throttled: int = 0                                   # sub-requests answered 429
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.requests.values())
+
+    @property
+    def sub_total(self) -> int:
+        return sum(self.sub_requests.values())
+
+
+class _Error(Exception):
+    def __init__(self, status: int, code: str, message: str = ""):
+        super().__init__(message or code)
+        self.status = status
+        self.body = {"error": {"code": code, "message": message or code}}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _label(method: str, path: str) -> str:
+    return f"{method} {_LABEL.sub(lambda m: f'/{m[1]}/{{{m[1][:-1]}}}', path)}"
+
+
+class _List:
+    def __init__(self, list_id: str, name: str, hidden: bool = False):
+        self.id = list_id
+        self.name = name
+        self.hidden = hidden
+        self.columns: dict[str, dict] = {"Title": {"name": "Title", "displayName": "Title", "text": {}}}
+        self.items: dict[str, dict] = {}
+        self.changes: list[tuple[int, str]] = []     # (seq, item id)
+        self.next_item = 1
+
+
+class _State:
+    def __init__(self, token: str, site: str):
+        self.token = token
+        self.site = site
+        self.lock = threading.RLock()
+        self.faults = Faults()
+        self.stats = Stats()
+        self.lists: dict[str, _List] = {}
+        self.seq = 0
+        self.next_list = 1
+        self._ticks: Counter = Counter()
+        self.uil = self.new_list(UIL_NAME, hidden=True)
+
+    def tick(self, knob: str, every: int) -> bool:
+        if every <= 0:
+            return False
+        with self.lock:
+            self._ticks[knob] += 1
+            return self._ticks[knob] % every == 0
+
+    def new_list(self, name: str, hidden: bool = False) -> _List:
+        lst = _List(f"{self.next_list:08d}-0000-0000-0000-00000000b0b0", name, hidden)
+        self.next_list += 1
+        self.lists[lst.id] = lst
+        return lst
+
+    def find_list(self, ref: str) -> _List:
+        ref = urllib.parse.unquote(ref)
+        lst = self.lists.get(ref) or next(
+            (l for l in self.lists.values() if l.name == ref or (l.hidden and ref == "users")), None)
+        if lst is None:
+            raise _Error(404, "itemNotFound", f"list {ref!r} not found")
+        return lst
+
+    def write(self, lst: _List, item_id: str, fields: dict | None) -> dict | None:
+        """Create/update (``fields``) or delete (``None``) an item and log
+        the change for delta rounds."""
+        self.seq += 1
+        lst.changes.append((self.seq, item_id))
+        if fields is None:
+            lst.items.pop(item_id, None)
+            return None
+        now = _now()
+        item = lst.items.get(item_id)
+        if item is None:
+            item = lst.items[item_id] = {"id": item_id, "created": now, "version": 0, "fields": {}}
+        for name, value in fields.items():
+            col = lst.columns.get(name[:-8] if name.endswith("LookupId") else name, {})
+            if name.endswith("LookupId") and value is not None:
+                value = str(value)
+            elif "number" in col and isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = float(value)
+            item["fields"][name] = value
+        item["modified"] = now
+        item["version"] += 1
+        return item
+
+    # ── rendering ────────────────────────────────────────────────────
+
+    def render(self, lst: _List, item: dict, expand: str | None) -> dict:
+        etag = f'"{lst.id[:8]}-{item["id"]},{item["version"]}"'
+        out = {
+            "@odata.etag": etag,
+            "createdDateTime": item["created"],
+            "eTag": etag,
+            "id": item["id"],
+            "lastModifiedDateTime": item["modified"],
+            "webUrl": f"https://{self.site.split(':')[0]}/Lists/{lst.id}/{item['id']}_.000",
+            "createdBy": {"user": {"email": "operator@example.org", "displayName": "Operator"}},
+            "lastModifiedBy": {"user": {"email": "operator@example.org", "displayName": "Operator"}},
+            "parentReference": {"id": lst.id, "siteId": SITE_ID},
+            "contentType": {"id": "0x0100BENCH", "name": "Item"},
+        }
+        if expand is None:
+            return out
+        title = item["fields"].get("Title", "")
+        fields = {
+            "@odata.etag": etag,
+            **item["fields"],
+            "id": item["id"],
+            "ContentType": "Item",
+            "Modified": item["fields"].get("Modified", item["modified"]),
+            "Created": item["created"],
+            "AuthorLookupId": "6",
+            "EditorLookupId": "6",
+            "_UIVersionString": f"{item['version']}.0",
+            "Attachments": False,
+            "Edit": "",
+            "LinkTitleNoMenu": title,
+            "LinkTitle": title,
+            "ItemChildCount": "0",
+            "FolderChildCount": "0",
+            "_ComplianceFlags": "",
+            "_ComplianceTag": "",
+            "_ComplianceTagWrittenTime": "",
+            "_ComplianceTagUserId": "",
+        }
+        m = re.fullmatch(r"fields\(\$select=([^)]*)\)", expand)
+        if m:
+            keep = set(m[1].split(",")) | {"@odata.etag"}
+            fields = {k: v for k, v in fields.items() if k in keep}
+        out["fields"] = fields
+        return out
+
+
+def _page(rows: list, query: dict, base: str, state: _State, graph_url: str) -> dict:
+    """One page of ``rows`` with an absolute ``@odata.nextLink``."""
+    size = min(int(query.get("$top", state.faults.max_page)), state.faults.max_page)
+    skip = int(query.get("$skiptoken", 0))
+    body: dict = {"value": rows[skip:skip + size]}
+    if skip + size < len(rows):
+        nxt = {**query, "$skiptoken": str(skip + size)}
+        body["@odata.nextLink"] = f"{graph_url}{base}?{urllib.parse.urlencode(nxt, safe='$(),=')}"
+    return body
+
+
+def _call(state: _State, graph_url: str, method: str, target: str,
+         body: dict | None, headers) -> tuple[int, dict]:
+    """Route one Graph request (top-level or ``$batch`` sub-request)."""
+    split = urllib.parse.urlsplit(target)
+    path = split.path
+    if path.startswith("/v1.0"):
+        path = path[5:]
+    query = dict(urllib.parse.parse_qsl(split.query, keep_blank_values=True))
+    parts = path.strip("/").split("/")
+
+    if parts[0] != "sites" or len(parts) < 2:
+        raise _Error(400, "invalidRequest", f"unsupported path {path}")
+    site_ref = urllib.parse.unquote(parts[1])
+    if len(parts) == 2 or site_ref.endswith(":"):
+        if urllib.parse.unquote(path[len("/sites/"):]) not in (state.site, SITE_ID) or method != "GET":
+            raise _Error(404, "itemNotFound", "site not found")
+        return 200, {"id": SITE_ID, "displayName": state.site.rsplit("/", 1)[-1],
+                     "webUrl": f"https://{state.site.replace(':', '')}"}
+    if site_ref != SITE_ID or parts[2] != "lists":
+        raise _Error(404, "itemNotFound", "site not found")
+    rest = parts[3:]
+
+    with state.lock:
+        if not rest:
+            if method == "POST":
+                lst = state.new_list(body["displayName"])
+                return 201, {"id": lst.id, "displayName": lst.name,
+                             "webUrl": f"https://{state.site.replace(':', '')}/Lists/{lst.id}"}
+            flt = re.fullmatch(r"displayName eq '([^']*)'", query.get("$filter", ""))
+            rows = [{"id": l.id, "displayName": l.name, "name": l.name.replace(" ", ""),
+                     "webUrl": f"https://{state.site.replace(':', '')}/Lists/{l.id}",
+                     "createdDateTime": "2026-01-01T00:00:00Z",
+                     "list": {"template": "genericList", "hidden": l.hidden}}
+                    for l in state.lists.values()
+                    if (l.name == flt[1] if flt else not l.hidden)]
+            if "$select" in query:
+                keep = set(query["$select"].split(","))
+                rows = [{k: v for k, v in r.items() if k in keep} for r in rows]
+            return 200, _page(rows, query, path, state, graph_url)
+
+        lst = state.find_list(rest[0])
+        sub = rest[1:]
+        if not sub and method == "GET":
+            return 200, {"id": lst.id, "displayName": lst.name}
+        if sub == ["columns"]:
+            if method == "GET":
+                return 200, {"value": [{"name": c["name"], "displayName": c["displayName"]}
+                                       for c in lst.columns.values()]}
+            if method == "POST":
+                if body["name"] in lst.columns or any(
+                        c["displayName"] == body["displayName"] for c in lst.columns.values()):
+                    raise _Error(409, "nameAlreadyExists", "A column with this name already exists")
+                lst.columns[body["name"]] = dict(body)
+                return 201, dict(body)
+        if sub == ["items", "delta"] and method == "GET":
+            return 200, _delta(state, graph_url, lst, path, query)
+        if sub == ["items"]:
+            if method == "POST":
+                iid = str(lst.next_item)
+                lst.next_item += 1
+                item = state.write(lst, iid, body.get("fields") or {})
+                return 201, state.render(lst, item, "fields")
+            rows = list(lst.items.values())
+            flt = query.get("$filter", "")
+            if flt:
+                m = re.fullmatch(r"fields/Modified gt '([^']*)'", flt)
+                if not m:
+                    raise _Error(400, "invalidRequest", f"unsupported $filter {flt}")
+                if (headers or {}).get("Prefer") != _PREFER:
+                    raise _Error(400, "invalidRequest",
+                                 "Field 'Modified' cannot be referenced in filter or orderby "
+                                 "as it is not indexed.")
+                rows = [r for r in rows if r["fields"].get("Modified", r["modified"]) > m[1]]
+            rows = [state.render(lst, r, query.get("$expand")) for r in rows]
+            return 200, _page(rows, query, path, state, graph_url)
+        if len(sub) >= 2 and sub[0] == "items":
+            if sub[1] not in lst.items:
+                raise _Error(404, "itemNotFound", "The specified list item was not found.")
+            if sub[2:] == ["fields"] and method == "PATCH":
+                item = state.write(lst, sub[1], body or {})
+                return 200, state.render(lst, item, "fields")["fields"]
+            if sub[2:] == [] and method == "DELETE":
+                state.write(lst, sub[1], None)
+                return 204, {}
+            if sub[2:] == [] and method == "GET":
+                return 200, state.render(lst, lst.items[sub[1]], query.get("$expand"))
+    raise _Error(400, "invalidRequest", f"unsupported {method} {path}")
+
+
+def _delta(state: _State, graph_url: str, lst: _List, path: str, query: dict) -> dict:
+    if "token" in query:
+        if not query["token"].isdigit():
+            raise _Error(410, "resyncRequired", "The delta token is no longer valid.")
+        since = int(query["token"])
+        ids = list(dict.fromkeys(i for n, i in lst.changes if n > since))
+    else:
+        ids = list(lst.items)
+    expand = query.get("$expand")
+    rows = [state.render(lst, lst.items[i], expand) if i in lst.items
+            else {"id": i, "@removed": {"reason": "deleted"}} for i in ids]
+    body = _page(rows, query, path, state, graph_url)
+    if "@odata.nextLink" not in body:
+        link = {"token": str(state.seq), **({"$expand": expand} if expand else {})}
+        body["@odata.deltaLink"] = f"{graph_url}{path}?{urllib.parse.urlencode(link, safe='$(),=')}"
+    return body
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, *a) -> None:
+        pass
+
+    def _send(self, status: int, body: dict | None = None, headers: dict | None = None) -> None:
+        raw = json.dumps(body).encode() if body is not None and status != 204 else b""
+        state = self.server.state
+        with state.lock:
+            state.stats.status[status] += 1
+            state.stats.bytes_sent += len(raw)
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        if raw:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _json(self) -> dict | None:
+        left = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(left) if left else b""
+        with self.server.state.lock:
+            self.server.state.stats.bytes_received += len(raw)
+        return json.loads(raw) if raw.strip() else None
+
+    def _route(self) -> None:
+        state = self.server.state
+        faults = state.faults
+        body = self._json()
+        path = urllib.parse.urlsplit(self.path).path
+        with state.lock:
+            state.stats.requests[_label(self.command, path.removeprefix("/v1.0"))] += 1
+        if faults.latency:
+            time.sleep(faults.latency)
+        if self.headers.get("Authorization") != f"Bearer {state.token}":
+            return self._send(401, {"error": {"code": "InvalidAuthenticationToken",
+                                              "message": "Access token is empty or invalid."}})
+        if state.tick("throttle", faults.throttle_every):
+            return self._send(429, {"error": {"code": "TooManyRequests",
+                                              "message": "Too many requests"}},
+                              {"Retry-After": f"{faults.retry_after:g}"})
+        if path == "/v1.0/$batch" and self.command == "POST":
+            return self._batch(body or {})
+        try:
+            status, reply = _call(state, self.server.graph_url, self.command, self.path,
+                                 body, self.headers)
+        except _Error as e:
+            return self._send(e.status, e.body)
+        self._send(status, reply)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _route
+
+    def _batch(self, body: dict) -> None:
+        state = self.server.state
+        subs = body.get("requests") or []
+        if len(subs) > BATCH_MAX:
+            return self._send(400, {"error": {
+                "code": "BadRequest",
+                "message": f"Number of batch requests exceeds the limit of {BATCH_MAX}."}})
+        responses = []
+        for sub in subs:
+            url = sub.get("url", "")
+            with state.lock:
+                state.stats.sub_requests[_label(sub.get("method", "GET"),
+                                                urllib.parse.urlsplit(url).path)] += 1
+            if state.tick("sub_throttle", state.faults.sub_throttle_every):
+                with state.lock:
+                    state.stats.sub_throttled += 1
+                responses.append({
+                    "id": sub.get("id"), "status": 429,
+                    "headers": {"Retry-After": f"{state.faults.retry_after:g}"},
+                    "body": {"error": {"code": "TooManyRequests", "message": "Too many requests"}},
+                })
+                continue
+            try:
+                status, reply = _call(state, self.server.graph_url, sub.get("method", "GET"),
+                                     url, sub.get("body"), sub.get("headers"))
+            except _Error as e:
+                status, reply = e.status, e.body
+            responses.append({"id": sub.get("id"), "status": status,
+                              "headers": {"Content-Type": "application/json"}, "body": reply})
+        self._send(200, {"responses": responses})
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    state: _State
+    graph_url: str
+
+
+class FakeGraphServer:
+    """The fake API on ``127.0.0.1`` (ephemeral port) in a background thread."""
+
+    def __init__(self, token: str = "tok", site: str = "fake.sharepoint.com:/sites/PublicationsData"):
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.state = _State(token, site)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        self.graph_url = self._server.graph_url = f"{self.url}/v1.0"
+        self.site = site
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True,
+        )
+
+    @property
+    def faults(self) -> Faults:
+        return self._server.state.faults
+
+    @faults.setter
+    def faults(self, faults: Faults) -> None:
+        self._server.state.faults = faults
+
+    @property
+    def stats(self) -> Stats:
+        return self._server.state.stats
+
+    def reset_stats(self) -> None:
+        self._server.state.stats = Stats()
+
+    def add_users(self, *users: tuple[str, str]) -> None:
+        """Add ``(email, name)`` entries to the User Information List."""
+        state = self._server.state
+        with state.lock:
+            for email, name in users:
+                iid = str(state.uil.next_item + 9)
+                state.uil.next_item += 1
+                state.write(state.uil, iid, {"EMail": email, "UserName": email, "Title": name,
+                                             "Modified": _now()})
+
+    def list_id(self, name: str) -> str:
+        return self._server.state.find_list(name).id
+
+    def items(self, list_id: str) -> dict[str, dict]:
+        """Server-side item id → stored fields."""
+        with self._server.state.lock:
+            return {iid: dict(it["fields"]) for iid, it in self._server.state.lists[list_id].items.items()}
+
+    def edit(self, list_id: str, item_id: str, fields: dict) -> None:
+        """A user edit made in the SharePoint UI (shows up in delta rounds)."""
+        state = self._server.state
+        with state.lock:
+            state.write(state.lists[list_id], item_id, fields)
+
+    def start(self) -> "FakeGraphServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeGraphServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,389 @@
+"""Standard-library HTTP stand-in for Zenodo's InvenioRDM ``/api/records`` API.
+
+``test_zenodo.py``'s ``FakeZenodo`` replaces the *client*, so retries,
+streamed bodies, keep-alive and 429 handling in ``ZenodoClient`` never
+meet a socket there. This server implements the endpoints ``zenodo.py``
+calls, over real HTTP/1.1:
+
+    POST   /api/records                                  create draft
+    GET    /api/records/{id}                             published record (404 while draft)
+    GET    /api/records/{id}/draft                       draft
+    PUT    /api/records/{id}/draft                       update metadata
+    DELETE /api/records/{id}/draft                       discard
+    POST   /api/records/{id}/draft/pids/doi              reserve DOI
+    POST   /api/records/{id}/draft/actions/publish       publish
+    GET    /api/records/{id}/draft/files                 list entries
+    POST   /api/records/{id}/draft/files                 init (plain or multipart "M")
+    GET    /api/records/{id}/draft/files/{key}           one entry (with part links)
+    DELETE /api/records/{id}/draft/files/{key}           delete entry
+    PUT    /api/records/{id}/draft/files/{key}/content   single PUT
+    PUT    /api/records/{id}/draft/files/{key}/content/{n}  multipart part
+    POST   /api/records/{id}/draft/files/{key}/commit    commit
+
+Uploaded bytes are spooled to a temp directory (multi-GB benchmark files
+never sit in memory); md5 and size are computed on commit, as Zenodo
+reports them. Successful GETs carry a content-derived ``ETag`` and
+answer a matching ``If-None-Match`` with ``304``. Behaviour knobs live on ``Faults`` and can be changed
+while the server runs; ``Stats`` counts requests, bytes and connections.
+
+    with FakeInvenioServer(token="tok") as server:
+        client = zenodo.ZenodoClient(server.url, "tok")
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.server
+import json
+import re
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_RECORD = re.compile(r"^/api/records/(?P<rid>\d+)(?P<rest>/.*)?$")
+_NUMBER = re.compile(r"/\d+")
+
+
+@dataclass
+class Faults:
+    """Injected behaviour. ``*_every=n`` fires on every n-th matching
+    request (counted per knob); 0 disables it."""
+    latency: float = 0.0            # seconds added before every response
+    throttle_every: int = 0         # → 429 with ``Retry-After: retry_after``
+    retry_after: float = 0.0
+    fail_every: int = 0             # → 503 (retryable server error)
+    drop_part_at: int = 0           # close the connection on part n (once)
+    multipart_supported: bool = True
+    deny_part_put: bool = False     # Zenodo 2026-07-04: init OK, part PUT 403
+    report_md5: bool = True         # False: commit without an md5 checksum
+
+
+@dataclass
+class Stats:
+    requests: Counter = field(default_factory=Counter)   # "METHOD route" → n
+    status: Counter = field(default_factory=Counter)     # status code → n
+    connections: int = 0
+    bytes_received: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.requests.values())
+
+
+class _State:
+    def __init__(self, token: str, spool: Path):
+        self.token = token
+        self.spool = spool
+        self.lock = threading.RLock()
+        self.faults = Faults()
+        self.stats = Stats()
+        self.records: dict[str, dict] = {}
+        self.files: dict[str, dict[str, dict]] = {}
+        self.published: set[str] = set()
+        self.next_id = 100
+        self._ticks: Counter = Counter()
+        self._dropped: set[tuple[str, str, int]] = set()
+
+    def tick(self, knob: str, every: int) -> bool:
+        if every <= 0:
+            return False
+        with self.lock:
+            self._ticks[knob] += 1
+            return self._ticks[knob] % every == 0
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.state.lock:
+            self.server.state.stats.connections += 1
+
+    def log_message(self, *a) -> None:
+        pass
+
+    # ── plumbing ────────────────────────────────────────────────────
+
+    def _send(self, status: int, body: dict | None = None, headers: dict | None = None) -> None:
+        raw = json.dumps(body).encode() if body is not None else b""
+        headers = dict(headers or {})
+        if self.command == "GET" and status == 200:
+            # Content-derived ETag, so any change to the resource changes it.
+            etag = f'"{hashlib.md5(raw).hexdigest()[:16]}"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                status, raw = 304, b""
+        with self.server.state.lock:
+            self.server.state.stats.status[status] += 1
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        if raw:
+            self.send_header("Content-Type", "application/json")
+        if status != 304:
+            self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _drain(self, sink=None) -> int:
+        """Read the request body (always — a keep-alive connection is
+        unusable otherwise), optionally writing it to ``sink``."""
+        left = int(self.headers.get("Content-Length") or 0)
+        total = 0
+        while left:
+            chunk = self.rfile.read(min(left, 1 << 20))
+            if not chunk:
+                break
+            if sink is not None:
+                sink.write(chunk)
+            left -= len(chunk)
+            total += len(chunk)
+        with self.server.state.lock:
+            self.server.state.stats.bytes_received += total
+        return total
+
+    def _json(self) -> object:
+        raw = b""
+        left = int(self.headers.get("Content-Length") or 0)
+        while left:
+            chunk = self.rfile.read(left)
+            if not chunk:
+                break
+            raw += chunk
+            left -= len(chunk)
+        return json.loads(raw) if raw.strip() else None
+
+    def _route(self) -> None:
+        state = self.server.state
+        faults = state.faults
+        path = urllib.parse.urlsplit(self.path).path
+        label = f"{self.command} {_NUMBER.sub('/{n}', path)}"
+        with state.lock:
+            state.stats.requests[label] += 1
+        if faults.latency:
+            time.sleep(faults.latency)
+        if self.headers.get("Authorization") != f"Bearer {state.token}":
+            self._drain()
+            return self._send(401, {"status": 401, "message": "invalid token"})
+        if state.tick("throttle", faults.throttle_every):
+            self._drain()
+            return self._send(429, {"status": 429, "message": "rate limited"},
+                              {"Retry-After": f"{faults.retry_after:g}"})
+        if state.tick("fail", faults.fail_every):
+            self._drain()
+            return self._send(503, {"status": 503, "message": "unavailable"})
+        try:
+            self._dispatch(path)
+        except KeyError:
+            self._send(404, {"status": 404, "message": "not found"})
+
+    do_GET = do_PUT = do_POST = do_DELETE = _route
+
+    # ── endpoints ───────────────────────────────────────────────────
+
+    def _dispatch(self, path: str) -> None:
+        state = self.server.state
+        if path == "/api/records" and self.command == "POST":
+            payload = self._json()
+            with state.lock:
+                rid = str(state.next_id)
+                state.next_id += 1
+                state.records[rid] = payload
+                state.files[rid] = {}
+            return self._send(201, {"id": rid, "links": {"self_html": f"{self.server.url}/uploads/{rid}"}})
+        m = _RECORD.match(path)
+        if not m:
+            self._drain()
+            raise KeyError(path)
+        rid, rest = m["rid"], m["rest"] or ""
+        if rid not in state.records:
+            self._drain()
+            raise KeyError(rid)
+
+        if rest == "" and self.command == "GET":
+            if rid not in state.published:
+                raise KeyError(rid)
+            return self._send(200, self._record_body(rid))
+        if rest == "/draft":
+            if self.command == "GET":
+                return self._send(200, {"id": rid, **(state.records[rid] or {})})
+            if self.command == "PUT":
+                state.records[rid] = self._json()
+                return self._send(200, {"id": rid, **(state.records[rid] or {})})
+            if self.command == "DELETE":
+                with state.lock:
+                    state.records.pop(rid)
+                    state.files.pop(rid)
+                return self._send(204)
+        if rest == "/draft/pids/doi" and self.command == "POST":
+            self._drain()
+            return self._send(201, {"doi": f"10.5281/zenodo.{rid}", "pids": None})
+        if rest == "/draft/actions/publish" and self.command == "POST":
+            self._drain()
+            state.published.add(rid)
+            return self._send(202, self._record_body(rid))
+        if rest == "/draft/files":
+            if self.command == "GET":
+                return self._send(200, {"entries": [self._public(rid, e) for e in state.files[rid].values()]})
+            if self.command == "POST":
+                return self._init_files(rid, self._json() or [])
+        fm = re.match(r"^/draft/files/(?P<key>[^/]+)(?P<op>/content(?:/(?P<n>\d+))?|/commit)?$", rest)
+        if not fm:
+            self._drain()
+            raise KeyError(rest)
+        key = urllib.parse.unquote(fm["key"])
+        entry = state.files[rid].get(key)
+        if entry is None:
+            self._drain()
+            raise KeyError(key)
+        op = fm["op"] or ""
+        if op == "" and self.command == "GET":
+            return self._send(200, self._public(rid, entry))
+        if op == "" and self.command == "DELETE":
+            with state.lock:
+                state.files[rid].pop(key)
+            return self._send(204)
+        if op == "/content" and self.command == "PUT":
+            with open(entry["_dir"] / "content", "wb") as f:
+                self._drain(f)
+            return self._send(200, self._public(rid, entry))
+        if fm["n"] and self.command == "PUT":
+            return self._put_part(rid, key, entry, int(fm["n"]))
+        if op == "/commit" and self.command == "POST":
+            self._drain()
+            return self._commit(rid, entry)
+        self._drain()
+        raise KeyError(rest)
+
+    def _record_body(self, rid: str) -> dict:
+        return {"id": rid, "doi": f"10.5281/zenodo.{rid}", "pids": None,
+                "links": {"self_html": f"{self.server.url}/records/{rid}"}}
+
+    def _public(self, rid: str, entry: dict) -> dict:
+        out = {k: v for k, v in entry.items() if not k.startswith("_")}
+        if entry.get("_parts") is not None and entry["status"] == "pending":
+            base = f"{self.server.url}/api/records/{rid}/draft/files/{urllib.parse.quote(entry['key'])}"
+            out["links"] = {"parts": [
+                {"part": n, "url": f"{base}/content/{n}"}
+                for n in range(1, entry["_parts"] + 1)
+            ]}
+        return out
+
+    def _init_files(self, rid: str, specs: list) -> None:
+        state = self.server.state
+        entries = []
+        for spec in specs:
+            transfer = spec.get("transfer") or {}
+            multipart = transfer.get("type") == "M"
+            if multipart and not state.faults.multipart_supported:
+                return self._send(400, {"status": 400, "message": "unsupported transfer type M"})
+            spool = Path(tempfile.mkdtemp(dir=state.spool))
+            entry = {
+                "key": spec["key"], "status": "pending", "checksum": None,
+                "size": spec.get("size"), "_dir": spool,
+                "_parts": transfer["parts"] if multipart else None,
+            }
+            with state.lock:
+                old = state.files[rid].get(spec["key"])
+                if old is not None:
+                    shutil.rmtree(old["_dir"], ignore_errors=True)
+                state.files[rid][spec["key"]] = entry
+            entries.append(self._public(rid, entry))
+        return self._send(201, {"entries": entries})
+
+    def _put_part(self, rid: str, key: str, entry: dict, n: int) -> None:
+        state = self.server.state
+        if state.faults.deny_part_put:
+            self._drain()
+            return self._send(403, {"status": 403, "message": "Permission denied."})
+        with open(entry["_dir"] / f"part{n:05d}", "wb") as f:
+            self._drain(f)
+        drop = (rid, key, n)
+        if n == state.faults.drop_part_at and drop not in state._dropped:
+            # The body arrived but the response never does: the client
+            # sees a dropped connection mid-request.
+            state._dropped.add(drop)
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        return self._send(200, {})
+
+    def _commit(self, rid: str, entry: dict) -> None:
+        h = hashlib.md5()
+        size = 0
+        if entry["_parts"] is not None:
+            pieces = sorted(entry["_dir"].glob("part*"))
+        else:
+            pieces = [entry["_dir"] / "content"]
+        for piece in pieces:
+            with open(piece, "rb") as f:
+                while chunk := f.read(1 << 20):
+                    h.update(chunk)
+                    size += len(chunk)
+        entry.update(status="completed", size=size, _md5=h.hexdigest(),
+                     checksum=f"md5:{h.hexdigest()}" if self.server.state.faults.report_md5 else None)
+        return self._send(200, self._public(rid, entry))
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    state: _State
+    url: str
+
+
+class FakeInvenioServer:
+    """The fake API on ``127.0.0.1`` (ephemeral port) in a background thread."""
+
+    def __init__(self, token: str = "tok"):
+        self._spool = Path(tempfile.mkdtemp(prefix="fake-zenodo-"))
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.state = _State(token, self._spool)
+        self.url = self._server.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True,
+        )
+
+    @property
+    def faults(self) -> Faults:
+        return self._server.state.faults
+
+    @faults.setter
+    def faults(self, faults: Faults) -> None:
+        self._server.state.faults = faults
+
+    @property
+    def stats(self) -> Stats:
+        return self._server.state.stats
+
+    def reset_stats(self) -> None:
+        self._server.state.stats = Stats()
+
+    def entry(self, record_id: str, key: str) -> dict:
+        """Server-side view of a draft file (incl. ``_md5`` after commit)."""
+        return self._server.state.files[record_id][key]
+
+    def is_published(self, record_id: str) -> bool:
+        return record_id in self._server.state.published
+
+    def start(self) -> "FakeInvenioServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        shutil.rmtree(self._spool, ignore_errors=True)
+
+    def __enter__(self) -> "FakeInvenioServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,188 @@
+"""Tests for pipeline analytics (stage intervals from the events log)."""
+
+from datetime import datetime
+
+from typer.testing import CliRunner
+
+from oa_tracker import analytics
+from oa_tracker.analytics import compute_metrics, generate_metrics, render_metrics, update_intervals
+from oa_tracker.cli import app
+from oa_tracker.db import get_connection, get_sync_state
+from oa_tracker.status import (
+    CLOSED_DATA_ARCHIVED,
+    OPEN_ACTIVE,
+    OPEN_INACTIVE,
+    OPEN_READY_FOR_ZENODO_DRAFT,
+)
+from tests.test_cli_reopen import _write_config
+
+runner = CliRunner()
+
+# A Friday; its week starts Monday 2026-07-06.
+NOW = datetime(2026, 7, 10, 12, 0, 0)
+
+
+def _event(conn, ts, pub_id, old, new, action="status_change"):
+    conn.execute(
+        "INSERT INTO events (ts, publication_id, action_code, old_status, new_status, source) "
+        "VALUES (?, ?, ?, ?, ?, 'scan')",
+        (ts, pub_id, action, old, new),
+    )
+
+
+def _history(conn):
+    # PUB1: 2 days inactive, 4 days active, then ready; closed on 07-08.
+    _event(conn, "2026-06-01T00:00:00", "PUB1", None, OPEN_INACTIVE, "new_folder")
+    _event(conn, "2026-06-03T00:00:00", "PUB1", OPEN_INACTIVE, OPEN_ACTIVE)
+    _event(conn, "2026-06-04T00:00:00", "PUB1", OPEN_ACTIVE, OPEN_ACTIVE, "reminder_sent")
+    _event(conn, "2026-06-07T00:00:00", "PUB1", OPEN_ACTIVE, OPEN_READY_FOR_ZENODO_DRAFT)
+    _event(conn, "2026-07-08T00:00:00", "PUB1", OPEN_READY_FOR_ZENODO_DRAFT, CLOSED_DATA_ARCHIVED)
+    # PUB2: 1 day inactive, then 10 days active, then ready.
+    _event(conn, "2026-06-10T00:00:00", "PUB2", None, OPEN_INACTIVE, "new_folder")
+    _event(conn, "2026-06-11T00:00:00", "PUB2", OPEN_INACTIVE, OPEN_ACTIVE)
+    _event(conn, "2026-06-21T00:00:00", "PUB2", OPEN_ACTIVE, OPEN_READY_FOR_ZENODO_DRAFT)
+
+
+def _intervals(conn):
+    return [
+        tuple(r) for r in conn.execute(
+            "SELECT publication_id, stage, entered_at, left_at FROM stage_intervals "
+            "ORDER BY enter_event_id"
+        )
+    ]
+
+
+def test_intervals_reconstructed_from_events(test_config):
+    with get_connection(test_config.database) as conn:
+        _history(conn)
+        assert update_intervals(conn) == 8
+        assert _intervals(conn) == [
+            ("PUB1", OPEN_INACTIVE, "2026-06-01T00:00:00", "2026-06-03T00:00:00"),
+            ("PUB1", OPEN_ACTIVE, "2026-06-03T00:00:00", "2026-06-07T00:00:00"),
+            ("PUB1", OPEN_READY_FOR_ZENODO_DRAFT, "2026-06-07T00:00:00", "2026-07-08T00:00:00"),
+            ("PUB1", CLOSED_DATA_ARCHIVED, "2026-07-08T00:00:00", None),
+            ("PUB2", OPEN_INACTIVE, "2026-06-10T00:00:00", "2026-06-11T00:00:00"),
+            ("PUB2", OPEN_ACTIVE, "2026-06-11T00:00:00", "2026-06-21T00:00:00"),
+            ("PUB2", OPEN_READY_FOR_ZENODO_DRAFT, "2026-06-21T00:00:00", None),
+        ]
+
+
+def test_incremental_update_matches_rebuild(test_config):
+    with get_connection(test_config.database) as conn:
+        _event(conn, "2026-06-01T00:00:00", "PUB1", None, OPEN_INACTIVE, "new_folder")
+        _event(conn, "2026-06-03T00:00:00", "PUB1", OPEN_INACTIVE, OPEN_ACTIVE)
+        assert update_intervals(conn) == 2
+        assert update_intervals(conn) == 0
+
+        _event(conn, "2026-06-07T00:00:00", "PUB1", OPEN_ACTIVE, OPEN_READY_FOR_ZENODO_DRAFT)
+        _event(conn, "2026-06-10T00:00:00", "PUB2", None, OPEN_INACTIVE, "new_folder")
+        assert update_intervals(conn) == 2
+        incremental = _intervals(conn)
+        cursor = get_sync_state(conn, analytics.CURSOR_KEY)
+
+        conn.execute("DELETE FROM stage_intervals")
+        conn.execute("DELETE FROM sync_state WHERE key = ?", (analytics.CURSOR_KEY,))
+        assert update_intervals(conn) == 4
+        assert _intervals(conn) == incremental
+        assert get_sync_state(conn, analytics.CURSOR_KEY) == cursor
+
+
+def test_dwell_percentiles_and_bottleneck(test_config):
+    with get_connection(test_config.database) as conn:
+        _history(conn)
+        update_intervals(conn)
+        metrics = compute_metrics(conn, NOW)
+
+    stages = {s.stage: s for s in metrics.stages}
+    active = stages[OPEN_ACTIVE]
+    assert active.completed == 2
+    assert active.p50 == 7.0           # midway between 4 and 10 days
+    assert abs(active.p90 - 9.4) < 1e-9
+    assert active.wip == 0
+
+    ready = stages[OPEN_READY_FOR_ZENODO_DRAFT]
+    assert ready.completed == 1 and ready.p50 == 31.0
+    assert ready.wip == 1
+    assert abs(ready.oldest - 19.5) < 1e-9  # 06-21 00:00 → 07-10 12:00
+
+    assert metrics.bottleneck.stage == OPEN_READY_FOR_ZENODO_DRAFT
+
+
+def test_bottleneck_ignores_inactive(test_config):
+    with get_connection(test_config.database) as conn:
+        _event(conn, "2026-01-01T00:00:00", "PUB1", None, OPEN_INACTIVE, "new_folder")
+        _event(conn, "2026-06-01T00:00:00", "PUB1", OPEN_INACTIVE, OPEN_ACTIVE)
+        update_intervals(conn)
+        metrics = compute_metrics(conn, NOW)
+    assert metrics.bottleneck is None
+
+
+def test_weekly_throughput_and_wip(test_config):
+    with get_connection(test_config.database) as conn:
+        _history(conn)
+        update_intervals(conn)
+        metrics = compute_metrics(conn, NOW, weeks=4)
+
+    assert metrics.throughput == [
+        ("2026-06-15", 0), ("2026-06-22", 0), ("2026-06-29", 0), ("2026-07-06", 1),
+    ]
+    wip = dict(metrics.wip)
+    # End of the week of 06-15 (06-22 00:00): PUB1 and PUB2 both waiting on a draft.
+    assert wip["2026-06-15"] == {OPEN_READY_FOR_ZENODO_DRAFT: 2}
+    # Current week, counted at NOW: PUB1 closed on 07-08.
+    assert wip["2026-07-06"] == {OPEN_READY_FOR_ZENODO_DRAFT: 1, CLOSED_DATA_ARCHIVED: 1}
+
+    content = render_metrics(metrics, NOW)
+    assert "# Pipeline Metrics — 2026-07-10" in content
+    assert "Bottleneck: **OPEN_READY_FOR_ZENODO_DRAFT**" in content
+    assert "| 2026-07-06 | 1 |" in content
+
+
+def test_throughput_counts_an_archive_once(test_config):
+    with get_connection(test_config.database) as conn:
+        _history(conn)
+        # PUB1 reopened and closed again in the same week; PUB3 first
+        # closed before the window and re-closed inside it.
+        _event(conn, "2026-07-08T06:00:00", "PUB1", CLOSED_DATA_ARCHIVED, OPEN_ACTIVE, "reopen")
+        _event(conn, "2026-07-09T00:00:00", "PUB1", OPEN_ACTIVE, CLOSED_DATA_ARCHIVED)
+        _event(conn, "2026-05-01T00:00:00", "PUB3", None, CLOSED_DATA_ARCHIVED, "new_folder")
+        _event(conn, "2026-07-01T00:00:00", "PUB3", CLOSED_DATA_ARCHIVED, OPEN_ACTIVE, "reopen")
+        _event(conn, "2026-07-02T00:00:00", "PUB3", OPEN_ACTIVE, CLOSED_DATA_ARCHIVED)
+        update_intervals(conn)
+        metrics = compute_metrics(conn, NOW, weeks=4)
+
+    assert metrics.throughput == [
+        ("2026-06-15", 0), ("2026-06-22", 0), ("2026-06-29", 0), ("2026-07-06", 1),
+    ]
+
+
+def test_generate_metrics_writes_file(test_config, monkeypatch):
+    monkeypatch.setattr(analytics, "_now", lambda: NOW)
+    with get_connection(test_config.database) as conn:
+        _history(conn)
+    path = generate_metrics(test_config)
+    assert path == test_config.output_dir / "pipeline_metrics.md"
+    content = path.read_text()
+    assert "## Time in Stage (days)" in content
+    assert "## Throughput (archives closed per week)" in content
+    assert "## Work in Progress (end of week)" in content
+
+
+def test_empty_history(test_config):
+    path = generate_metrics(test_config)
+    assert "Bottleneck: _not enough history yet_" in path.read_text()
+
+
+def test_cli_report_metrics(test_config, tmp_path):
+    cfg = _write_config(
+        tmp_path, test_config.database, test_config.sharepoint_root,
+        test_config.output_dir, test_config.email_drafts_dir, test_config.template_dir,
+    )
+    result = runner.invoke(app, ["report", "--config", str(cfg)])
+    assert result.exit_code == 0, result.output
+    assert not (test_config.output_dir / "pipeline_metrics.md").exists()
+
+    result = runner.invoke(app, ["report", "--metrics", "--config", str(cfg)])
+    assert result.exit_code == 0, result.output
+    assert "Pipeline metrics:" in result.output
+    assert (test_config.output_dir / "pipeline_metrics.md").exists()
@@ -9,7 +9,7 @@ from oa_tracker import auto, db, status as st, zenodo
 from oa_tracker.actions import apply_single
 from oa_tracker.config import ZenodoSettings
 
-from tests.test_zenodo import FakeZenodo
+from tests.test_zenodo import FakeZenodo, zip_bytes
 
 
 NOW = "2026-07-02T10:00:00"
@@ -50,15 +50,17 @@ def zen_config(test_config, tmp_path, monkeypatch):
     test_config.automation.enabled = True
     fake = FakeZenodo()
     monkeypatch.setattr(zenodo, "get_client", lambda settings: fake)
+    extras = {
+        "abstract": "We did things.",
+        "author": "Carregal Romero, Susana",
+        "author_with_affiliation":
+            "Carregal-Romero, S (Carregal-Romero, Susana)[ 1 ]",
+        "first_author_name": "Susana Carregal Romero",
+    }
+    monkeypatch.setattr(zenodo, "fetch_publication_extras", lambda pub_id: dict(extras))
     monkeypatch.setattr(
-        zenodo, "fetch_publication_extras",
-        lambda pub_id: {
-            "abstract": "We did things.",
-            "author": "Carregal Romero, Susana",
-            "author_with_affiliation":
-                "Carregal-Romero, S (Carregal-Romero, Susana)[ 1 ]",
-            "first_author_name": "Susana Carregal Romero",
-        },
+        zenodo, "fetch_publication_extras_bulk",
+        lambda pub_ids: {pid: dict(extras) for pid in pub_ids},
     )
     test_config._fake_zenodo = fake
     return test_config
@@ -67,7 +69,7 @@ def zen_config(test_config, tmp_path, monkeypatch):
 def _folder_with_package(config, pub_id="3290"):
     folder = config.sharepoint_root / pub_id
     folder.mkdir(parents=True, exist_ok=True)
-    (folder / "data.zip").write_bytes(b"zip-content")
+    (folder / "data.zip").write_bytes(zip_bytes())
     (folder / "README.txt").write_text("hello")
     return folder
 
@@ -119,6 +121,35 @@ def test_zenodo_upload_files_applies(zen_config):
     assert set(fake.files["100"]) == {"data.zip", "README.txt"}
 
 
+def test_zenodo_upload_resumes_from_db_recorded_parts(zen_config):
+    # A run that dies mid-multipart leaves its confirmed parts in
+    # upload_parts; the next apply sends only the missing ones.
+    folder = _folder_with_package(zen_config)
+    (folder / "data.zip").write_bytes(zip_bytes(2 * 1024 * 1024 + 10))   # 3 parts
+    zen_config.zenodo.multipart_threshold_mb = 1
+    zen_config.zenodo.multipart_part_size_mb = 1
+    _seed(zen_config, status=st.OPEN_ZENODO_DRAFT_CREATED,
+          zenodo_code="100", zenodo_env="sandbox")
+    fake = zen_config._fake_zenodo
+    fake.records["100"] = {}
+    fake.files["100"] = {}
+    fake.fail_part_put_at = 3
+    result, _, _ = apply_single(zen_config, "3290", "zenodo_upload_files")
+    assert result.errors
+    with db.get_connection(zen_config.database) as conn:
+        assert [r["part_number"] for r in db.get_upload_parts(conn, "100", "data.zip")] == [1, 2]
+
+    fake.fail_part_put_at = None
+    fake.calls.clear()
+    result, _, _ = apply_single(zen_config, "3290", "zenodo_upload_files")
+    assert result.applied == 1 and not result.errors
+    part_puts = [p for m, p in fake.calls if m == "PUT" and "/content/" in p]
+    assert [p.rsplit("/", 1)[-1] for p in part_puts] == ["3"]
+    with db.get_connection(zen_config.database) as conn:
+        assert db.get_upload_parts(conn, "100", "data.zip") == []
+        assert "resumed 1" in db.get_last_event(conn, "3290", "zenodo_upload_files")["note"]
+
+
 def test_zenodo_publish_records_doi(zen_config):
     _seed(zen_config, status=st.OPEN_ZENODO_DRAFT_VALIDATED,
           zenodo_code="100", zenodo_env="sandbox")
@@ -210,6 +241,168 @@ def test_auto_qc_advances_through_draft_and_upload(zen_config):
     assert any("validate the Zenodo draft" in w for w in result.awaiting_operator)
 
 
+def test_ready_archives_drafted_and_uploaded_concurrently(zen_config):
+    """Step 3c runs READY archives on a worker pool: all three drafts are
+    in flight at once (the barrier only opens with three callers), yet
+    every status/event write lands and the digest keeps READY order."""
+    import threading
+
+    ids = ["3290", "3291", "3292"]
+    for pid in ids:
+        _folder_with_package(zen_config, pid)
+        _seed(zen_config, pub_id=pid, status=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    zen_config.zenodo.max_parallel_archives = 3
+    fake = zen_config._fake_zenodo
+    barrier = threading.Barrier(3, timeout=5)
+    real_request = fake.request
+
+    def request(method, path, *args, **kwargs):
+        if method == "POST" and path == "/api/records":
+            barrier.wait()
+        return real_request(method, path, *args, **kwargs)
+
+    fake.request = request
+    result = auto.AutoRunResult(started_at=NOW)
+    auto._advance(zen_config, result)
+    assert not result.errors
+    drafted = [ln.split(":")[0] for ln in result.auto_applied if "draft created" in ln]
+    assert drafted == ids
+    with db.get_connection(zen_config.database) as conn:
+        for pid in ids:
+            a = db.get_archive(conn, pid)
+            assert a["status"] == st.OPEN_ZENODO_DRAFT_CREATED
+            assert set(fake.files[a["zenodo_code"]]) == {"data.zip", "README.txt"}
+            assert db.get_last_event(conn, pid, "zenodo_upload_files") is not None
+
+
+def test_pipeline_draft_failure_is_reported_and_others_continue(zen_config):
+    for pid in ("3290", "3291"):
+        _folder_with_package(zen_config, pid)
+        _seed(zen_config, pub_id=pid, status=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    fake = zen_config._fake_zenodo
+    real_request = fake.request
+
+    def request(method, path, json_body=None, *args, **kwargs):
+        if method == "POST" and path == "/api/records" \
+                and json_body["metadata"]["title"] == "broken":
+            raise zenodo.ZenodoError("data", "HTTP 400 from Zenodo: bad title", 400)
+        return real_request(method, path, json_body, *args, **kwargs)
+
+    fake.request = request
+    with db.get_connection(zen_config.database) as conn:
+        db.upsert_archive(conn, publication_id="3290", pub_title="broken")
+    result = auto.AutoRunResult(started_at=NOW)
+    auto._advance(zen_config, result)
+    assert result.errors == ["Action (3290): Zenodo [data] HTTP 400 from Zenodo: bad title"]
+    with db.get_connection(zen_config.database) as conn:
+        assert db.get_archive(conn, "3290")["status"] == st.OPEN_READY_FOR_ZENODO_DRAFT
+        assert db.get_archive(conn, "3291")["status"] == st.OPEN_ZENODO_DRAFT_CREATED
+
+
+def test_pipeline_unexpected_worker_error_still_records_other_drafts(zen_config, monkeypatch):
+    """A non-Zenodo exception in one worker (here a PermissionError from
+    the upload) is reported for that archive; every draft already created
+    on Zenodo is still recorded, so the next run makes no duplicates."""
+    import threading
+
+    ids = ["3290", "3291", "3292"]
+    for pid in ids:
+        _folder_with_package(zen_config, pid)
+        _seed(zen_config, pub_id=pid, status=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    zen_config.zenodo.max_parallel_archives = 3
+    fake = zen_config._fake_zenodo
+    barrier = threading.Barrier(3, timeout=5)
+    real_request = fake.request
+
+    def request(method, path, *args, **kwargs):
+        if method == "POST" and path == "/api/records":
+            barrier.wait()
+        return real_request(method, path, *args, **kwargs)
+
+    fake.request = request
+    real_upload = zenodo.upload_files
+
+    def upload_files(client, record_id, folder, *args, **kwargs):
+        if folder.name == "3290":
+            raise PermissionError(13, "Permission denied", str(folder / "data.zip"))
+        return real_upload(client, record_id, folder, *args, **kwargs)
+
+    monkeypatch.setattr(zenodo, "upload_files", upload_files)
+    with db.get_connection(zen_config.database) as conn:
+        ready = db.get_all_archives(conn, status_filter=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    result = auto.AutoRunResult(started_at=NOW)
+    auto._zenodo_pipeline(zen_config, ready, result)
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("Action (3290): upload failed: ")
+    assert "Permission denied" in result.errors[0]
+    with db.get_connection(zen_config.database) as conn:
+        for pid in ids:
+            a = db.get_archive(conn, pid)
+            assert a["status"] == st.OPEN_ZENODO_DRAFT_CREATED
+            assert a["zenodo_code"] in fake.records
+        assert db.get_last_event(conn, "3290", "zenodo_upload_files") is None
+        assert db.get_last_event(conn, "3291", "zenodo_upload_files") is not None
+
+
+def test_pipeline_recording_failure_keeps_draining(zen_config, monkeypatch):
+    """A DB error while the main thread records one draft is reported
+    with the record id to reconcile; the other drafts are still recorded."""
+    import sqlite3
+
+    from oa_tracker import actions
+
+    ids = ["3290", "3291", "3292"]
+    for pid in ids:
+        _folder_with_package(zen_config, pid)
+        _seed(zen_config, pub_id=pid, status=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    zen_config.zenodo.max_parallel_archives = 3
+    real_record = actions.record_draft_created
+
+    def record_draft_created(conn, archive, *args, **kwargs):
+        if archive["publication_id"] == "3291":
+            raise sqlite3.OperationalError("database is locked")
+        return real_record(conn, archive, *args, **kwargs)
+
+    monkeypatch.setattr(actions, "record_draft_created", record_draft_created)
+    with db.get_connection(zen_config.database) as conn:
+        ready = db.get_all_archives(conn, status_filter=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    result = auto.AutoRunResult(started_at=NOW)
+    auto._zenodo_pipeline(zen_config, ready, result)
+    assert len(result.errors) == 1
+    assert result.errors[0].startswith("Action (3291): Zenodo draft ")
+    assert "database is locked" in result.errors[0]
+    with db.get_connection(zen_config.database) as conn:
+        for pid in ("3290", "3292"):
+            assert db.get_archive(conn, pid)["status"] == st.OPEN_ZENODO_DRAFT_CREATED
+            assert db.get_last_event(conn, pid, "zenodo_upload_files") is not None
+
+
+def test_pipeline_rechecks_candidates_and_skips_placeholder_extras(zen_config, monkeypatch):
+    """The pipeline re-reads its candidates: one that got a zenodo_code in
+    the meantime is refused by the shared check, and placeholder ids never
+    reach the central-DB bulk fetch."""
+    for pid in ("3290", "3291", "TMP-1"):
+        _folder_with_package(zen_config, pid)
+        _seed(zen_config, pub_id=pid, status=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    with db.get_connection(zen_config.database) as conn:
+        stale = db.get_all_archives(conn, status_filter=st.OPEN_READY_FOR_ZENODO_DRAFT)
+        db.upsert_archive(conn, publication_id="3291", zenodo_code="555")
+    fetched = []
+    monkeypatch.setattr(
+        zenodo, "fetch_publication_extras_bulk",
+        lambda pub_ids: fetched.append(list(pub_ids)) or {},
+    )
+    result = auto.AutoRunResult(started_at=NOW)
+    auto._zenodo_pipeline(zen_config, stale, result)
+    assert fetched == [["3290"]]
+    assert any(w.startswith("3291: ready for Zenodo but already has zenodo_code '555'")
+               for w in result.awaiting_operator)
+    with db.get_connection(zen_config.database) as conn:
+        assert db.get_archive(conn, "3291")["status"] == st.OPEN_READY_FOR_ZENODO_DRAFT
+        assert db.get_archive(conn, "TMP-1")["status"] == st.OPEN_ZENODO_DRAFT_CREATED
+    assert len(zen_config._fake_zenodo.records) == 2
+
+
 def test_auto_qc_mismatch_done_without_package(zen_config):
     _seed(zen_config, status=st.OPEN_ACTIVE, user_done_flag=1,
           package_has_zip=1, package_has_readme=0)
@@ -304,6 +497,63 @@ def test_upload_retry_for_created_draft_without_upload(zen_config):
     assert upload_calls == []
 
 
+def test_upload_retry_outside_window_is_scheduled_not_failed(zen_config, monkeypatch):
+    """A big file outside the large-upload window is neither an error nor
+    an operator hand-off — it waits, and no upload event is written."""
+    folder = _folder_with_package(zen_config)
+    (folder / "data.zip").write_bytes(zip_bytes(2 * 1024 * 1024 + 10))
+    zen_config.zenodo.single_put_max_mb = 1
+    zen_config.zenodo.large_upload_window = "22:00-06:00"
+    monkeypatch.setattr(zenodo, "in_upload_window", lambda window, now: False)
+    _seed(zen_config, status=st.OPEN_ZENODO_DRAFT_CREATED,
+          zenodo_code="100", zenodo_env="sandbox")
+    fake = zen_config._fake_zenodo
+    fake.records["100"] = {}
+    fake.files["100"] = {}
+    with db.get_connection(zen_config.database) as conn:
+        db.insert_event(conn, "3290", "zenodo_create_draft",
+                        st.OPEN_READY_FOR_ZENODO_DRAFT, st.OPEN_ZENODO_DRAFT_CREATED,
+                        "auto")
+    result = auto.AutoRunResult(started_at=NOW)
+    auto._advance(zen_config, result)
+    assert not result.errors
+    assert not any("keeps failing" in w for w in result.awaiting_operator)
+    assert len(result.scheduled) == 1 and "data.zip" in result.scheduled[0]
+    assert set(fake.files["100"]) == {"README.txt"}
+    with db.get_connection(zen_config.database) as conn:
+        assert db.get_last_event(conn, "3290", "zenodo_upload_files") is None
+    text = auto.write_digest(zen_config, result).read_text()
+    assert "Scheduled for the large-upload window" in text
+
+
+def test_ready_upload_deferred_by_pipeline_is_not_retried_in_same_run(zen_config, monkeypatch):
+    """READY → draft → upload deferred to the window: step 3d of the same
+    run leaves the fresh draft alone, so there is one scheduled line and
+    no second listing/preflight."""
+    folder = _folder_with_package(zen_config)
+    (folder / "data.zip").write_bytes(zip_bytes(2 * 1024 * 1024 + 10))
+    zen_config.zenodo.single_put_max_mb = 1
+    zen_config.zenodo.large_upload_window = "22:00-06:00"
+    monkeypatch.setattr(zenodo, "in_upload_window", lambda window, now: False)
+    _seed(zen_config, status=st.OPEN_READY_FOR_ZENODO_DRAFT)
+    calls = []
+    real_upload = zenodo.upload_files
+
+    def upload_files(*args, **kwargs):
+        calls.append(args[1])
+        return real_upload(*args, **kwargs)
+
+    monkeypatch.setattr(zenodo, "upload_files", upload_files)
+    result = auto.AutoRunResult(started_at=NOW)
+    auto._advance(zen_config, result)
+    assert not result.errors
+    assert calls == ["100"]
+    assert len(result.scheduled) == 1
+    assert result.scheduled[0].startswith("3290: ") and "data.zip" in result.scheduled[0]
+    with db.get_connection(zen_config.database) as conn:
+        assert db.get_archive(conn, "3290")["status"] == st.OPEN_ZENODO_DRAFT_CREATED
+
+
 def test_hand_made_draft_not_auto_uploaded(zen_config):
     """No zenodo_create_draft event → the draft was made by hand; the
     engine leaves uploads to the operator."""
@@ -328,6 +578,12 @@ def test_digest_written(zen_config):
     assert (zen_config.output_dir / "auto_log.txt").exists()
 
 
+def test_digest_reports_rate_limit_wait(zen_config):
+    result = auto.AutoRunResult(started_at=NOW, rate_limit_wait="zenodo.org 3.0 s over 9 request(s)")
+    text = auto.write_digest(zen_config, result).read_text()
+    assert "API rate limiting: zenodo.org 3.0 s over 9 request(s)" in text
+
+
 def test_package_complete_helper():
     assert auto.package_complete({"package_has_zip": 1, "package_has_readme": 1,
                                   "package_has_manuscript": 1})
@@ -348,3 +604,194 @@ def test_auto_qc_mismatch_missing_manuscript(zen_config):
     with db.get_connection(zen_config.database) as conn:
         assert db.get_archive(conn, "3290")["status"] == st.OPEN_ACTIVE
     assert any("manuscript (.doc/.docx/.pdf)" in m for m in result.mismatches)
+
+
+def test_digest_reports_zenodo_requests(zen_config):
+    result = auto.AutoRunResult(started_at=NOW, zenodo_requests="7 request(s) (~3.5 per archive over 2)")
+    text = auto.write_digest(zen_config, result).read_text()
+    assert "Zenodo requests: 7 request(s) (~3.5 per archive over 2)" in text
+
+
+def test_sharepoint_pull_uses_delta_and_push_reuses_the_mirror(test_config, monkeypatch):
+    from oa_tracker import sharepoint as sp_mod
+    from tests.test_sharepoint import SID, FakeGraph
+
+    graph = FakeGraph()
+    graph.get_site_id = lambda site: SID
+    uil = graph.add_users(("scarregal@cicbiomagune.es", "Susana", "2026-07-01T00:00:00Z"))
+    monkeypatch.setattr(sp_mod, "GraphClient", lambda sp, interactive=True: graph)
+    test_config.sharepoint.enabled = True
+    test_config.sharepoint.client_id = "app"
+    list_id, _, _ = sp_mod.ensure_list(graph, SID, test_config.sharepoint)
+    _seed(test_config, "3290")
+    _seed(test_config, "3291")
+
+    def run():
+        graph.calls.clear()
+        result = auto.AutoRunResult(started_at=NOW)
+        ctx = auto._pull_sharepoint(test_config, result)
+        auto._push_sharepoint(test_config, ctx, result)
+        gets = [p for m, p in graph.calls
+                if m == "GET" and "/items" in p and f"/lists/{uil}/" not in p]
+        user_reads = [p for m, p in graph.calls if f"/lists/{uil}/items" in p]
+        assert len(user_reads) == 1             # shared by the pull and the push
+        return result, gets
+
+    first, gets = run()
+    assert first.sharepoint_pushed == "created 2, updated 0, unchanged 0"
+    assert first.sharepoint_pulled == "0 changed, 0 removed (full resync)"
+    assert len(gets) == 1 and "/items/delta" in gets[0]        # no second full fetch
+
+    second, gets = run()
+    # Our own creates come back once through the delta; the rows are matched.
+    assert second.sharepoint_pulled == "2 changed, 0 removed"
+    assert second.sharepoint_pushed == "created 0, updated 0, unchanged 2"
+    assert len(gets) == 1 and "token=" in gets[0]
+    with db.get_connection(test_config.database) as conn:
+        mirror = db.get_sharepoint_items(conn, list_id)
+    assert sorted(it["fields"]["PubId"] for it in mirror.values()) == ["3290", "3291"]
+    assert all(it["fields"]["DataContactLookupId"] == "1" for it in mirror.values())
+
+
+def test_sharepoint_list_ids_are_cached_and_rediscovered_on_404(test_config, monkeypatch):
+    from oa_tracker import sharepoint as sp_mod
+    from tests.test_sharepoint import SID, FakeGraph
+
+    graph = FakeGraph()
+    site_lookups = []
+    graph.get_site_id = lambda site: site_lookups.append(site) or SID
+    monkeypatch.setattr(sp_mod, "GraphClient", lambda sp, interactive=True: graph)
+    test_config.sharepoint.enabled = True
+    test_config.sharepoint.client_id = "app"
+    list_id, _, _ = sp_mod.ensure_list(graph, SID, test_config.sharepoint)
+    key = f"sharepoint.list.{test_config.sharepoint.site}|{test_config.sharepoint.list_name}"
+
+    def pull():
+        graph.calls.clear()
+        ctx = auto._pull_sharepoint(test_config, auto.AutoRunResult(started_at=NOW))
+        discovery = [p for m, p in graph.calls
+                     if p.endswith("$select=id,displayName,webUrl&$top=200") or "/columns" in p]
+        return ctx, discovery
+
+    ctx, discovery = pull()
+    assert ctx.list_id == list_id and discovery and len(site_lookups) == 1
+    ctx, discovery = pull()
+    assert ctx.list_id == list_id and discovery == [] and len(site_lookups) == 1
+
+    # The list was re-created under a new id: the cached id 404s → rediscover.
+    with db.get_connection(test_config.database) as conn:
+        stale = sp_mod.ListHandle.from_json(db.get_sync_state(conn, key))
+        stale.list_id = "GONE"
+        db.set_sync_state(conn, key, stale.to_json())
+    ctx, discovery = pull()
+    assert ctx.list_id == list_id and discovery and len(site_lookups) == 2
+    with db.get_connection(test_config.database) as conn:
+        assert sp_mod.ListHandle.from_json(db.get_sync_state(conn, key)).list_id == list_id
+
+
+def test_sharepoint_column_dropped_from_live_list_rediscovers(test_config, monkeypatch):
+    """A column deleted on the live list stays in the cached (registry-
+    complete) map; Graph's 400 on the delta $select rediscovers, and the
+    run names the missing column instead of failing on a raw HTTP error."""
+    from oa_tracker import sharepoint as sp_mod
+    from tests.test_sharepoint import SID, FakeGraph
+
+    graph = FakeGraph()
+    site_lookups = []
+    graph.get_site_id = lambda site: site_lookups.append(site) or SID
+    graph.add_users(("scarregal@cicbiomagune.es", "Susana", "2026-07-01T00:00:00Z"))
+    graph.strict_select = True
+    monkeypatch.setattr(sp_mod, "GraphClient", lambda sp, interactive=True: graph)
+    test_config.sharepoint.enabled = True
+    test_config.sharepoint.client_id = "app"
+    list_id, _, _ = sp_mod.ensure_list(graph, SID, test_config.sharepoint)
+
+    assert auto._pull_sharepoint(test_config, auto.AutoRunResult(started_at=NOW)) is not None
+    assert len(site_lookups) == 1
+
+    del graph.lists[list_id]["columns"][sp_mod.D_NOTES]
+    result = auto.AutoRunResult(started_at=NOW)
+    assert auto._pull_sharepoint(test_config, result) is None
+    assert len(site_lookups) == 2                       # rediscovered
+    assert result.errors == [
+        f"SharePoint list {test_config.sharepoint.list_name!r} is missing column(s) "
+        f"{sp_mod.D_NOTES} — run `oa sharepoint provision`."
+    ]
+
+    # Provisioning restores the column; the next run syncs again.
+    sp_mod.ensure_list(graph, SID, test_config.sharepoint)
+    result = auto.AutoRunResult(started_at=NOW)
+    assert auto._pull_sharepoint(test_config, result) is not None
+    assert not result.errors
+
+
+def test_sharepoint_mirror_marks_save_writes_and_resync_periodically(test_config, monkeypatch):
+    from oa_tracker import sharepoint as sp_mod
+    from tests.test_sharepoint import SID, FakeGraph
+
+    graph = FakeGraph()
+    graph.get_site_id = lambda site: SID
+    graph.add_users(("scarregal@cicbiomagune.es", "Susana", "2026-07-01T00:00:00Z"))
+    monkeypatch.setattr(sp_mod, "GraphClient", lambda sp, interactive=True: graph)
+    test_config.sharepoint.enabled = True
+    test_config.sharepoint.client_id = "app"
+    list_id, _, name_for = sp_mod.ensure_list(graph, SID, test_config.sharepoint)
+    _seed(test_config, "3290")
+
+    def run():
+        graph.calls.clear()
+        graph.sub_calls.clear()
+        result = auto.AutoRunResult(started_at=NOW)
+        ctx = auto._pull_sharepoint(test_config, result)
+        auto._push_sharepoint(test_config, ctx, result)
+        assert result.errors == []
+        return result
+
+    run()
+    # Our create comes back through the delta: taken in locally, no stamp.
+    second = run()
+    assert second.sharepoint_pulled == "1 changed, 0 removed"
+    assert graph.sub_calls == []
+    with db.get_connection(test_config.database) as conn:
+        (row,) = db.get_sharepoint_items(conn, list_id).values()
+    assert row["pulled_sig"] and row["pushed_hash"]
+
+    # Edited outside the sync: the local diff can't see it until the
+    # periodic full resync re-reads the list and compares every row.
+    graph.lists[list_id]["items"][row["id"]]["fields"][name_for[sp_mod.D_STATUS]] = "hand edit"
+    assert run().sharepoint_pushed == "created 0, updated 0, unchanged 1"
+    with db.get_connection(test_config.database) as conn:
+        db.set_sync_state(conn, f"sharepoint.full_sync.{list_id}", "2026-01-01T00:00:00")
+    resync = run()
+    assert resync.sharepoint_pulled.endswith("(full resync)")
+    assert resync.sharepoint_pushed == "created 0, updated 1, unchanged 0"
+
+
+def test_cli_sync_honours_rows_taken_in_by_auto(test_config, monkeypatch):
+    from typer.testing import CliRunner
+
+    from oa_tracker import cli
+    from oa_tracker import sharepoint as sp_mod
+    from tests.test_sharepoint import SID, FakeGraph
+
+    graph = FakeGraph()
+    graph.get_site_id = lambda site: SID
+    graph.add_users(("scarregal@cicbiomagune.es", "Susana", "2026-07-01T00:00:00Z"))
+    graph.resolve_users = lambda site: {}
+    graph.resolve_user_details = lambda site: {}
+    monkeypatch.setattr(sp_mod, "GraphClient", lambda sp, interactive=True: graph)
+    monkeypatch.setattr(cli, "_get_config", lambda config, db=None: test_config)
+    test_config.sharepoint.enabled = True
+    test_config.sharepoint.client_id = "app"
+    sp_mod.ensure_list(graph, SID, test_config.sharepoint)
+    _seed(test_config, "3290")
+    for _ in range(2):      # create, then take the create in locally
+        result = auto.AutoRunResult(started_at=NOW)
+        auto._push_sharepoint(test_config, auto._pull_sharepoint(test_config, result), result)
+
+    graph.calls.clear()
+    graph.sub_calls.clear()
+    out = CliRunner().invoke(cli.app, ["sharepoint", "sync"])
+    assert out.exit_code == 0, out.output
+    assert "No new user proposals." in out.output
+    assert [c for c in graph.calls + graph.sub_calls if c[0] == "PATCH"] == []
@@ -14,6 +14,15 @@ from oa_tracker.db import (
     upsert_archive,
     update_archive_status,
     get_recent_events,
+    get_upload_parts,
+    record_upload_part,
+    clear_upload_parts,
+    apply_sharepoint_delta,
+    get_sharepoint_items,
+    save_sharepoint_items,
+    get_sync_state,
+    set_sync_state,
+    load_sheet_context,
 )
 
 
@@ -303,3 +312,151 @@ def test_migrates_v4_to_v5(tmp_path):
         assert _V5_COLUMNS <= _columns(conn)
         row = conn.execute("SELECT MAX(version) AS v FROM schema_version").fetchone()
         assert row["v"] == _SCHEMA_VERSION
+
+
+def test_fresh_db_has_upload_parts_table(tmp_db):
+    with get_connection(tmp_db) as conn:
+        names = {r["name"] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'").fetchall()}
+    assert "upload_parts" in names
+
+
+def test_upload_parts_record_and_clear(tmp_db):
+    with get_connection(tmp_db) as conn:
+        record_upload_part(conn, "100", "data.zip", 30, "abc", 10, 2)
+        record_upload_part(conn, "100", "data.zip", 30, "abc", 10, 1)
+        record_upload_part(conn, "100", "data.zip", 30, "abc", 10, 1)  # idempotent
+        record_upload_part(conn, "100", "other.zip", 30, "def", 10, 1)
+        rows = get_upload_parts(conn, "100", "data.zip")
+        assert [(r["part_number"], r["file_md5"]) for r in rows] == [(1, "abc"), (2, "abc")]
+        clear_upload_parts(conn, "100", "data.zip")
+        assert get_upload_parts(conn, "100", "data.zip") == []
+        assert len(get_upload_parts(conn, "100", "other.zip")) == 1
+
+
+def test_sync_state_set_get_clear(tmp_db):
+    with get_connection(tmp_db) as conn:
+        assert get_sync_state(conn, "k") is None
+        set_sync_state(conn, "k", "v1")
+        set_sync_state(conn, "k", "v2")
+        assert get_sync_state(conn, "k") == "v2"
+        set_sync_state(conn, "k", None)
+        assert get_sync_state(conn, "k") is None
+
+
+def test_sharepoint_mirror_delta_and_full_replace(tmp_db):
+    row = lambda iid, pub: {"id": iid, "fields": {"PubId": pub, "Notes": iid}}
+    with get_connection(tmp_db) as conn:
+        apply_sharepoint_delta(conn, "L1", [row("1", "100"), row("2", "101")], [], "PubId",
+                               full=True)
+        apply_sharepoint_delta(conn, "L2", [row("9", "900")], [], "PubId", full=True)
+        apply_sharepoint_delta(conn, "L1", [row("3", "102")], ["1"], "PubId")
+        assert sorted(get_sharepoint_items(conn, "L1")) == ["2", "3"]
+        assert get_sharepoint_items(conn, "L1")["3"] == row("3", "102")
+        apply_sharepoint_delta(conn, "L1", [row("5", "103")], [], "PubId", full=True)
+        assert list(get_sharepoint_items(conn, "L1")) == ["5"]
+        assert list(get_sharepoint_items(conn, "L2")) == ["9"]
+
+
+_V6_TABLES = {"upload_parts", "sharepoint_items", "sync_state", "stage_intervals"}
+
+
+def test_migrates_v5_to_v6(tmp_path):
+    """A v5 database (the last release) gains the v6 tables in one step."""
+    db_path = tmp_path / "legacy_v5.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(
+        """
+        CREATE TABLE archives (publication_id TEXT PRIMARY KEY, status TEXT NOT NULL,
+                               package_has_manuscript INTEGER);
+        CREATE TABLE schema_version (version INTEGER NOT NULL);
+        INSERT INTO schema_version (version) VALUES (5);
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    init_db(db_path)
+
+    with get_connection(db_path) as conn:
+        names = {r["name"] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'").fetchall()}
+        assert _V6_TABLES <= names
+        assert {"pushed_hash", "pulled_sig"} <= _columns(conn, "sharepoint_items")
+        row = conn.execute("SELECT MAX(version) AS v FROM schema_version").fetchone()
+        assert row["v"] == _SCHEMA_VERSION == 6
+
+
+def test_sharepoint_marks_survive_delta_rounds(tmp_db):
+    row = lambda iid, pub, note: {"id": iid, "fields": {"PubId": pub, "Notes": note}}
+    with get_connection(tmp_db) as conn:
+        apply_sharepoint_delta(conn, "L1", [row("1", "100", "a"), row("2", "101", "a")], [],
+                               "PubId", full=True)
+        items = get_sharepoint_items(conn, "L1")
+        assert "pushed_hash" not in items["1"]
+        items["1"].update(pushed_hash="h1", pulled_sig="s1")
+        save_sharepoint_items(conn, "L1", [items["1"]], "PubId")
+
+        apply_sharepoint_delta(conn, "L1", [row("1", "100", "b")], [], "PubId")
+        apply_sharepoint_delta(conn, "L1", [row("1", "100", "c")], [], "PubId", full=True)
+        items = get_sharepoint_items(conn, "L1")
+        assert list(items) == ["1"]
+        assert items["1"] == {**row("1", "100", "c"), "pushed_hash": "h1", "pulled_sig": "s1"}
+
+
+def _open(conn, pub_id, status="OPEN_ACTIVE", **kw):
+    upsert_archive(conn, publication_id=pub_id, folder_path=f"/tmp/{pub_id}",
+                   first_seen_at="2026-01-01T00:00:00",
+                   last_seen_at="2026-01-01T00:00:00", status=status, **kw)
+
+
+def test_sheet_context_event_state(tmp_db):
+    with get_connection(tmp_db) as conn:
+        _open(conn, "A", next_reminder_at="2026-03-01T00:00:00")
+        _open(conn, "B", next_reminder_at="2026-02-01T00:00:00")
+        _open(conn, "C", status="OPEN_ZENODO_PUBLISHED", next_reminder_at="2027-01-01T00:00:00")
+        _open(conn, "D", status="CLOSED_DATA_ARCHIVED")
+        _open(conn, "E", status="CLOSED_DATA_ARCHIVED")
+        insert_event(conn, "A", "data_contact_handover", "OPEN_ACTIVE", "OPEN_ACTIVE", "auto")
+        insert_event(conn, "B", "data_contact_handover", "OPEN_ACTIVE", "OPEN_ACTIVE", "auto")
+        insert_event(conn, "B", "handover_sent", "OPEN_ACTIVE", "OPEN_ACTIVE", "sheet")
+        insert_event(conn, "C", "completion_sent", "OPEN_ZENODO_PUBLISHED",
+                     "OPEN_ZENODO_PUBLISHED", "sheet")
+        insert_event(conn, "D", "full_closure", "OPEN_ACTIVE", "CLOSED_DATA_ARCHIVED", "sheet")
+        conn.execute("UPDATE events SET ts = '2020-01-01T00:00:00' WHERE publication_id = 'D'")
+        insert_event(conn, "E", "full_closure", "OPEN_ACTIVE", "CLOSED_DATA_ARCHIVED", "sheet")
+
+        ctx = load_sheet_context(conn, "2026-06-01T00:00:00", closed_since="2026-01-01T00:00:00")
+        assert [a["publication_id"] for a in ctx.open_archives] == ["A", "B", "C"]
+        assert [a["publication_id"] for a in ctx.reminders_due] == ["B", "A"]
+        assert ctx.due_ids == {"A", "B"}
+        assert set(ctx.pending_handovers) == {"A"}
+        assert ctx.completion_sent == {"C"}
+        assert [a["publication_id"] for a in ctx.recently_closed] == ["E"]
+        assert [a["publication_id"] for a in ctx.with_status("OPEN_ZENODO_PUBLISHED")] == ["C"]
+
+        # A handover after the last handover_sent is pending again.
+        insert_event(conn, "B", "data_contact_handover", "OPEN_ACTIVE", "OPEN_ACTIVE", "auto")
+        assert set(load_sheet_context(conn).pending_handovers) == {"A", "B"}
+
+
+def test_sheet_context_query_count_is_constant(tmp_db):
+    def count(n):
+        with get_connection(tmp_db) as conn:
+            for i in range(n):
+                _open(conn, f"P{i:03d}", next_reminder_at="2020-01-01T00:00:00")
+                insert_event(conn, f"P{i:03d}", "data_contact_handover",
+                             "OPEN_ACTIVE", "OPEN_ACTIVE", "auto")
+            seen = []
+            conn.set_trace_callback(seen.append)
+            load_sheet_context(conn, closed_since="2026-01-01T00:00:00")
+            return len(seen)
+
+    assert count(2) == count(40)
+
+
+def test_lookup_indexes_exist(tmp_db):
+    with get_connection(tmp_db) as conn:
+        names = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert {"idx_events_pub_action", "idx_events_action", "idx_events_ts",
+            "idx_archives_status", "idx_archives_first_seen"} <= names
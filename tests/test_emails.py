@@ -7,7 +7,7 @@ from email.parser import BytesParser
 from oa_tracker.config import EmailSettings
 from oa_tracker.db import get_connection, upsert_archive
 from oa_tracker.emails import (
-    _cc_line, _write_draft, generate_emails, pending_response_pubs,
+    _cc, _write_draft, generate_emails, pending_response_pubs,
 )
 from oa_tracker.status import (
     OPEN_ACTIVE, OPEN_INACTIVE, OPEN_READY_FOR_ZENODO_DRAFT,
@@ -16,7 +16,7 @@ from oa_tracker.status import (
 
 
 def test_no_emails_when_nothing_due(test_config):
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert paths == []
 
 
@@ -33,7 +33,7 @@ def test_reminder_email_generated(test_config):
             next_reminder_at="2020-01-01T00:00:00",  # past → due
         )
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert len(paths) == 1
     assert "reminder_PUB001_1" in paths[0].name
     content = paths[0].read_text()
@@ -61,7 +61,7 @@ def test_past_due_reminder_at_manual_contact_stage(test_config):
             reminder_count=max_rem - 1,
         )
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert len(paths) == 1
     assert f"reminder_PUB001_{max_rem}_PASTDUE" in paths[0].name
     content = paths[0].read_text()
@@ -88,7 +88,7 @@ def test_past_due_reminder_keeps_regenerating_beyond_max(test_config):
             reminder_count=max_rem + 2,
         )
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert len(paths) == 1
     assert f"reminder_PUB001_{max_rem + 3}_PASTDUE" in paths[0].name
 
@@ -107,7 +107,7 @@ def test_normal_reminder_has_no_past_due_marker(test_config):
             reminder_count=0,
         )
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert len(paths) == 1
     assert "PASTDUE" not in paths[0].name
     content = paths[0].read_text()
@@ -129,7 +129,7 @@ def test_completion_email_generated(test_config):
             final_url="https://zenodo.org/record/123",
         )
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert len(paths) == 1
     assert "completion_PUB002" in paths[0].name
     content = paths[0].read_text()
@@ -160,7 +160,7 @@ def test_both_reminder_and_completion(test_config):
             final_url="https://zenodo.org/record/456",
         )
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert len(paths) == 2
     names = {p.name for p in paths}
     assert any("reminder" in n for n in names)
@@ -191,7 +191,7 @@ def test_reminder_suppressed_for_paper_only_archive(test_config):
         next_reminder_at="2020-01-01T00:00:00",
         oa_data_required=0, oa_paper_required=1, oa_mandate_missing=0,
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert all("reminder_PUB600" not in p.name for p in paths)
 
 
@@ -201,7 +201,7 @@ def test_reminder_suppressed_for_no_oa_archive(test_config):
         next_reminder_at="2020-01-01T00:00:00",
         oa_data_required=0, oa_paper_required=0, oa_mandate_missing=0,
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert all("reminder_PUB601" not in p.name for p in paths)
 
 
@@ -211,7 +211,7 @@ def test_reminder_suppressed_for_missing_mandate(test_config):
         next_reminder_at="2020-01-01T00:00:00",
         oa_mandate_missing=1, oa_data_required=None, oa_paper_required=None,
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert all("reminder_PUB602" not in p.name for p in paths)
 
 
@@ -223,7 +223,7 @@ def test_reminder_sent_for_data_required_archive(test_config):
         pub_title="Real Paper Title", data_contact_name="Contact A",
         data_contact_email="contact@example.org", max_embargo_months=0,
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     reminder = [p for p in paths if p.name.startswith("reminder_PUB603")]
     assert len(reminder) == 1
     content = reminder[0].read_text()
@@ -246,7 +246,7 @@ def test_legacy_archive_still_reminded(test_config):
             status=OPEN_ACTIVE,
             next_reminder_at="2020-01-01T00:00:00",
         )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert any("reminder_LEGACY1" in p.name for p in paths)
 
 
@@ -261,7 +261,7 @@ def test_cheat_sheet_generated_for_ready_archive(test_config):
         central_repository="Zenodo", central_repository_code="999",
         zenodo_code="999",
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     cheat = [p for p in paths if p.parent.name == "zenodo_cheat" and p.name == "PUB700.txt"]
     assert len(cheat) == 1
     content = cheat[0].read_text()
@@ -275,7 +275,7 @@ def test_cheat_sheet_generated_for_ready_archive(test_config):
 def test_cheat_sheet_not_generated_for_other_statuses(test_config):
     """Only ready/draft/validated statuses get cheat sheets."""
     _enriched_archive(test_config.database, "PUB701", OPEN_ACTIVE)
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert not any(p.parent.name == "zenodo_cheat" for p in paths)
 
 
@@ -291,7 +291,7 @@ def test_reminder_suppressed_once_operator_owned(test_config):
         next_reminder_at="2020-01-01T00:00:00",  # due
         oa_data_required=1, oa_paper_required=1, oa_mandate_missing=0,
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert all("reminder_PUB710" not in p.name for p in paths)
 
 
@@ -304,7 +304,7 @@ def test_reminder_still_sent_for_open_active(test_config):
         next_reminder_at="2020-01-01T00:00:00",
         oa_data_required=1, oa_paper_required=1, oa_mandate_missing=0,
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert any(p.name.startswith("reminder_PUB711") for p in paths)
 
 
@@ -321,7 +321,7 @@ def test_reminder_status_note_differs_by_status(test_config):
         next_reminder_at="2020-01-01T00:00:00",
         oa_data_required=1, oa_paper_required=1,
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     inactive = next(p for p in paths if p.name.startswith("reminder_PUBINA"))
     active = next(p for p in paths if p.name.startswith("reminder_PUBACT"))
     assert "nothing has been uploaded" in inactive.read_text()
@@ -336,7 +336,7 @@ def test_cheat_sheet_includes_derived_zenodo_doi(test_config):
         oa_paper_required=1, oa_data_required=1, max_embargo_months=0,
         zenodo_code="20662261",
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     cheat = next(p for p in paths if p.name == "PUB720.txt")
     assert "10.5281/zenodo.20662261" in cheat.read_text()
 
@@ -370,7 +370,7 @@ def test_reminder_held_when_tracker_response_pending(test_config):
     ppath.write_text("publication_id\ttask_code\tdone\nPUB800\tpropose_done\t0\n")
 
     assert "PUB800" in pending_response_pubs(test_config)
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert all("reminder_PUB800" not in p.name for p in paths)
 
 
@@ -381,18 +381,23 @@ def test_reminder_sent_when_no_pending_response(test_config):
         oa_data_required=1, oa_mandate_missing=0,
         next_reminder_at="2020-01-01T00:00:00",
     )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert any("reminder_PUB801" in p.name for p in paths)
 
 
 # ── .eml drafts, cc, and format selection ────────────────────────────
 
 
-def test_cc_line_only_for_distinct_corresponding_author():
+def test_cc_only_for_distinct_corresponding_author():
     a = {"corresponding_author_name": "CA", "corresponding_author_email": "ca@x.es"}
-    assert _cc_line(a, "dc@x.es") == "Cc: CA <ca@x.es>\n"
-    assert _cc_line(a, "ca@x.es") == ""                 # CA == data contact → no cc
-    assert _cc_line({"corresponding_author_email": ""}, "dc@x.es") == ""
+    assert _cc(a, "dc@x.es") == "CA <ca@x.es>"
+    assert _cc(a, "ca@x.es") == ""                 # CA == data contact → no cc
+    assert _cc({"corresponding_author_email": ""}, "dc@x.es") == ""
+
+
+def _draft(text):
+    from oa_tracker.emails import _CompiledTemplate
+    return _CompiledTemplate(text).render()
 
 
 def test_write_draft_eml_has_proper_headers(test_config, tmp_path):
@@ -400,7 +405,7 @@ def test_write_draft_eml_has_proper_headers(test_config, tmp_path):
         test_config,
         email=EmailSettings(sender_name="Q Officer", sender_email="q@x.es", draft_format="eml"),
     )
-    rendered = "To: Jane <jane@x.es>\nCc: Boss <boss@x.es>\nSubject: Hi 42\n\nBody line.\n"
+    rendered = _draft("To: Jane <jane@x.es>\nCc: Boss <boss@x.es>\nSubject: Hi 42\n\nBody line.\n")
     written = _write_draft(tmp_path / "draft_42", rendered, cfg)
     assert len(written) == 1 and written[0].suffix == ".eml"
     msg = BytesParser(policy=policy.default).parse(open(written[0], "rb"))
@@ -413,12 +418,13 @@ def test_write_draft_eml_has_proper_headers(test_config, tmp_path):
 
 def test_write_draft_both_writes_txt_and_eml(test_config, tmp_path):
     cfg = dataclasses.replace(test_config, email=EmailSettings(draft_format="both"))
-    written = _write_draft(tmp_path / "d", "To: a@b.es\nSubject: x\n\nbody\n", cfg)
+    written = _write_draft(tmp_path / "d", _draft("To: a@b.es\nSubject: x\n\nbody\n"), cfg)
     assert {p.suffix for p in written} == {".txt", ".eml"}
 
 
 def test_write_draft_txt_is_default(test_config, tmp_path):
-    written = _write_draft(tmp_path / "d", "To: a@b.es\nSubject: x\n\nbody\n", test_config)
+    written = _write_draft(tmp_path / "d", _draft("To: a@b.es\nSubject: x\n\nbody\n"),
+                           test_config)
     assert len(written) == 1 and written[0].suffix == ".txt"
 
 
@@ -458,7 +464,7 @@ def test_completion_draft_generated_for_recently_closed_via_done2(test_config):
     recent = (datetime.now() - timedelta(days=2)).isoformat(timespec="seconds")
     _insert_closed_archive(test_config.database, "PUB800", "10.5281/zenodo.111", recent)
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     completion = [p for p in paths if p.name == "completion_PUB800.txt"]
     assert len(completion) == 1
     content = completion[0].read_text()
@@ -472,7 +478,7 @@ def test_completion_draft_not_generated_for_old_closure(test_config):
     old = (datetime.now() - timedelta(days=30)).isoformat(timespec="seconds")
     _insert_closed_archive(test_config.database, "PUB801", "10.5281/zenodo.222", old)
 
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert not any(p.name == "completion_PUB801.txt" for p in paths)
 
 
@@ -498,7 +504,7 @@ def test_completion_draft_not_generated_for_closed_without_pid(test_config):
             "VALUES (?, 'PUB802', 'full_closure', ?, ?, 'action_sheet')",
             (recent, OPEN_READY_FOR_ZENODO_DRAFT, CLOSED_DATA_ARCHIVED),
         )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert not any(p.name == "completion_PUB802.txt" for p in paths)
 
 
@@ -521,7 +527,7 @@ def test_completion_draft_not_generated_for_closed_exception(test_config):
             "VALUES (?, 'PUB803', 'close_exception', ?, ?, 'action_sheet')",
             (recent, OPEN_ACTIVE, CLOSED_EXCEPTION),
         )
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert not any(p.name == "completion_PUB803.txt" for p in paths)
 
 
@@ -596,7 +602,7 @@ def _archive_with_handover(db_path, previous_name):
 
 def test_handover_draft_generated_while_pending(test_config):
     _archive_with_handover(test_config.database, "Old Contact")
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     handover = [p for p in paths if "handover_PUB001" in p.name]
     assert len(handover) == 1
     content = handover[0].read_text()
@@ -610,7 +616,7 @@ def test_handover_draft_first_assignment_wording(test_config):
     """No previous contact on record → the handover line degrades to a
     first-assignment sentence instead of naming nobody."""
     _archive_with_handover(test_config.database, "")
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     handover = [p for p in paths if "handover_PUB001" in p.name]
     assert len(handover) == 1
     content = handover[0].read_text()
@@ -624,5 +630,183 @@ def test_handover_draft_stops_after_sent(test_config):
     with get_connection(test_config.database) as conn:
         insert_event(conn, "PUB001", "handover_sent",
                      OPEN_ACTIVE, OPEN_ACTIVE, "sheet", note=None)
-    paths = generate_emails(test_config)
+    paths = generate_emails(test_config).paths
     assert [p for p in paths if "handover" in p.name] == []
+
+
+def test_generators_use_set_based_event_state(test_config, monkeypatch):
+    """Sheet and drafts read handovers/completions from the shared
+    SheetContext, not per-archive event lookups."""
+    from oa_tracker import db
+    from oa_tracker.sheet import generate_sheet
+    _archive_with_handover(test_config.database, "Old Contact")
+
+    def per_archive(*a, **kw):
+        raise AssertionError("per-archive event lookup")
+    monkeypatch.setattr(db, "get_pending_handover", per_archive)
+    monkeypatch.setattr(db, "get_last_event", per_archive)
+    paths = generate_emails(test_config).paths
+    assert [p.name for p in paths if "handover" in p.name] == ["handover_PUB001.txt"]
+    assert "handover_sent" in generate_sheet(test_config).read_text()
+
+
+# ── Content-addressed writes ─────────────────────────────────────────
+
+def _due_archive(db_path, pub_id, **kw):
+    with get_connection(db_path) as conn:
+        upsert_archive(
+            conn, publication_id=pub_id, folder_path=f"/tmp/{pub_id}",
+            first_seen_at="2026-01-01T00:00:00", last_seen_at="2026-01-15T00:00:00",
+            status=OPEN_ACTIVE, next_reminder_at="2020-01-01T00:00:00", **kw,
+        )
+
+
+def test_unchanged_drafts_are_not_rewritten(test_config):
+    cfg = dataclasses.replace(test_config, email=EmailSettings(draft_format="both"))
+    _due_archive(cfg.database, "PUB001")
+    _due_archive(cfg.database, "PUB002")
+    first = generate_emails(cfg)
+    assert (len(first.written), first.unchanged) == (4, [])
+    mtimes = {p: p.stat().st_mtime_ns for p in first.paths}
+
+    again = generate_emails(cfg)
+    assert (again.written, len(again.unchanged)) == ([], 4)
+    assert {p: p.stat().st_mtime_ns for p in again.paths} == mtimes
+    assert again.summary == "0 written, 4 unchanged, 0 removed"
+
+    _due_archive(cfg.database, "PUB002", data_contact_name="Someone Else")
+    changed = generate_emails(cfg)
+    assert sorted(p.name for p in changed.written) == ["reminder_PUB002_1.eml",
+                                                       "reminder_PUB002_1.txt"]
+
+
+def test_hand_edited_draft_is_restored(test_config):
+    _due_archive(test_config.database, "PUB001")
+    (path,) = generate_emails(test_config).paths
+    original = path.read_bytes()
+    path.write_text("edited by hand")
+    assert generate_emails(test_config).written == [path]
+    assert path.read_bytes() == original
+
+
+def test_existing_identical_file_counts_as_unchanged_without_sidecar(test_config):
+    _due_archive(test_config.database, "PUB001")
+    generate_emails(test_config)
+    (test_config.output_dir / "email_drafts.state.json").unlink()
+    result = generate_emails(test_config)
+    assert (result.written, len(result.unchanged)) == ([], 1)
+
+
+def test_stale_drafts_are_pruned(test_config):
+    _due_archive(test_config.database, "PUB001")
+    _due_archive(test_config.database, "PUB002")
+    generate_emails(test_config)
+    keep = test_config.email_drafts_dir / "notes_for_me.txt"
+    keep.write_text("not ours")
+
+    # PUB001's reminder went out (count + next date moved); PUB002 left
+    # the reminder states.
+    with get_connection(test_config.database) as conn:
+        upsert_archive(conn, publication_id="PUB001", reminder_count=1,
+                       next_reminder_at="2020-02-01T00:00:00")
+        upsert_archive(conn, publication_id="PUB002", status=OPEN_READY_FOR_ZENODO_DRAFT)
+    result = generate_emails(test_config)
+    assert sorted(p.name for p in result.removed) == ["reminder_PUB001_1.txt",
+                                                      "reminder_PUB002_1.txt"]
+    assert [p.name for p in result.written if p.parent.name == "email_drafts"] == \
+        ["reminder_PUB001_2.txt"]
+    assert keep.exists()
+    assert sorted(p.name for p in test_config.email_drafts_dir.iterdir()) == \
+        ["notes_for_me.txt", "reminder_PUB001_2.txt"]
+
+
+def test_cheat_sheet_timestamp_alone_does_not_rewrite(test_config, monkeypatch):
+    from oa_tracker import emails
+    _enriched_archive(test_config.database, "PUB700", OPEN_READY_FOR_ZENODO_DRAFT,
+                      pub_title="My Paper")
+    first = generate_emails(test_config)
+    (cheat,) = [p for p in first.written if p.parent.name == "zenodo_cheat"]
+    stamped = cheat.read_text()
+
+    real = emails._cheat_template_vars
+    monkeypatch.setattr(emails, "_cheat_template_vars",
+                        lambda a, now, cfg: {**real(a, now, cfg), "generated_at": "later"})
+    assert cheat in generate_emails(test_config).unchanged
+    assert cheat.read_text() == stamped
+
+    _enriched_archive(test_config.database, "PUB700", OPEN_READY_FOR_ZENODO_DRAFT,
+                      pub_title="Renamed Paper")
+    assert cheat in generate_emails(test_config).written
+    assert "Generated: later" in cheat.read_text()
+
+
+# ── Compiled templates and parallel rendering ────────────────────────
+
+def _parsed_eml(rendered, config):
+    """The former .eml path: parse the rendered text, then rebuild."""
+    from email.message import EmailMessage
+    from email.parser import Parser
+    parsed = Parser().parsestr(rendered)
+    msg = EmailMessage()
+    for header in ("To", "Cc", "Subject"):
+        if parsed[header]:
+            msg[header] = parsed[header]
+    msg["From"] = f"{config.email.sender_name} <{config.email.sender_email}>"
+    msg.set_content(parsed.get_payload())
+    return msg.as_bytes()
+
+
+def test_compiled_templates_build_the_same_eml(test_config):
+    from pathlib import Path
+    from oa_tracker.emails import _load_template, _render_eml
+    cfg = dataclasses.replace(test_config, email=EmailSettings(sender_email="q@x.es"))
+    repo_templates = Path(__file__).resolve().parents[1] / "templates"
+    vars_ = {"data_contact_name": "Jane Roe", "data_contact_email": "jane@x.es",
+             "publication_id": "42", "publication_title": "Títulø",
+             "cc": "Boss <boss@x.es>", "past_due_marker": "PAST DUE - "}
+    for name in ("reminder.txt", "completion.txt", "handover.txt"):
+        tpl = _load_template(repo_templates, name)
+        draft = tpl.render(**vars_)
+        assert draft.text == tpl.safe_substitute(**vars_)
+        assert _render_eml(draft, cfg) == _parsed_eml(draft.text, cfg), name
+
+
+def test_empty_header_is_left_out_of_the_draft(test_config):
+    from pathlib import Path
+    from oa_tracker.emails import _load_template
+    repo_templates = Path(__file__).resolve().parents[1] / "templates"
+    tpl = _load_template(repo_templates, "completion.txt")
+    draft = tpl.render(data_contact_name="Jane", data_contact_email="jane@x.es",
+                       publication_id="42", cc="")
+    assert draft.text.startswith("To: Jane <jane@x.es>\nSubject: Data deposit complete")
+    assert [n for n, _ in draft.headers] == ["To", "Subject"]
+
+
+def test_template_cache_follows_the_file(tmp_path):
+    import os
+    from oa_tracker.emails import _load_template
+    path = tmp_path / "t.txt"
+    path.write_text("Subject: ${x}\n\nbody ${x}\n")
+    first = _load_template(tmp_path, "t.txt")
+    assert _load_template(tmp_path, "t.txt") is first
+    path.write_text("Subject: ${x}!\n\nbody ${x}\n")
+    os.utime(path, ns=(1, 1))
+    second = _load_template(tmp_path, "t.txt")
+    assert second is not first and second.render(x="a").header("Subject") == "a!"
+    assert _load_template(tmp_path, "missing.txt", optional=True) is None
+
+
+def test_parallel_rendering_matches_inline(test_config):
+    from oa_tracker import emails
+    for n in range(emails._PARALLEL_MIN + 8):
+        _due_archive(test_config.database, f"PUB{n:03d}", data_contact_name=f"C {n}")
+
+    def run(workers):
+        cfg = dataclasses.replace(test_config, email=EmailSettings(
+            draft_format="both", render_workers=workers))
+        for p in cfg.email_drafts_dir.iterdir():
+            p.unlink()
+        result = generate_emails(cfg)
+        return result.paths, {p.name: p.read_bytes() for p in result.paths}
+
+    assert run(4) == run(1)
@@ -0,0 +1,15 @@
+"""Tests for the shared atomic file writer (fileio.py)."""
+
+from __future__ import annotations
+
+from oa_tracker.fileio import write_atomic
+
+
+def test_write_atomic_replaces_and_leaves_no_temp(tmp_path):
+    path = tmp_path / "out.tsv"
+    path.write_text("old")
+    write_atomic(path, "a\tb\r\nc\n")
+    assert path.read_bytes() == b"a\tb\r\nc\n"       # no newline translation
+    write_atomic(path, b"\x00raw")
+    assert path.read_bytes() == b"\x00raw"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.tsv"]
@@ -0,0 +1,119 @@
+"""Tests for the pre-upload zip CRC + md5 pass (preflight.py)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from oa_tracker import preflight
+
+
+def _zip(path, members, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(path, "w", compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+def _md5(path):
+    return hashlib.md5(path.read_bytes()).hexdigest()
+
+
+def test_valid_zip_passes_and_md5_matches(tmp_path):
+    p = _zip(tmp_path / "a.zip", {
+        "one.txt": b"hello " * 5000,
+        "two.bin": os.urandom(300_000),
+        "dir/three.csv": b"a,b\n" * 10_000,
+    })
+    check = preflight.check_file(str(p))
+    assert check.zip_ok is True and check.ok and check.error == ""
+    assert check.md5 == _md5(p)
+    assert check.size == p.stat().st_size
+
+
+def test_streamed_members_with_data_descriptors(tmp_path):
+    # Members written through ZipFile.open carry data descriptors — small
+    # gaps the hashing reader must fill so the md5 still covers every byte.
+    p = tmp_path / "s.zip"
+    with zipfile.ZipFile(p, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(3):
+            with zf.open(f"m{i}.bin", "w") as f:
+                f.write(os.urandom(50_000))
+    check = preflight.check_file(str(p))
+    assert check.zip_ok is True
+    assert check.md5 == _md5(p)
+
+
+def test_crc_mismatch_is_reported(tmp_path):
+    p = _zip(tmp_path / "bad.zip", {"data.txt": b"A" * 10_000}, zipfile.ZIP_STORED)
+    raw = bytearray(p.read_bytes())
+    raw[raw.index(b"AAAA") + 100] = ord("B")       # corrupt stored content
+    p.write_bytes(bytes(raw))
+    check = preflight.check_file(str(p))
+    assert check.zip_ok is False and not check.ok
+    assert "data.txt" in check.error
+    assert check.md5 == _md5(p)
+
+
+def test_truncated_zip_is_reported(tmp_path):
+    p = _zip(tmp_path / "cut.zip", {"data.bin": os.urandom(100_000)})
+    p.write_bytes(p.read_bytes()[:60_000])
+    check = preflight.check_file(str(p))
+    assert check.zip_ok is False
+    assert "not a readable zip" in check.error
+
+
+def test_non_zip_only_hashed(tmp_path):
+    p = tmp_path / "README.txt"
+    p.write_text("hello")
+    check = preflight.check_file(str(p))
+    assert check.zip_ok is None and check.ok
+    assert check.md5 == _md5(p)
+
+
+def test_results_cached_by_size_and_mtime(tmp_path, monkeypatch):
+    p = _zip(tmp_path / "a.zip", {"x": b"x" * 1000})
+    cache = tmp_path / "cache.json"
+    first = preflight.check_files([p], cache)
+    calls = []
+    real = preflight.check_file
+    monkeypatch.setattr(preflight, "check_file", lambda path: calls.append(path) or real(path))
+    again = preflight.check_files([p], cache)
+    assert calls == []
+    assert again[p] == first[p]
+    _zip(p, {"x": b"y" * 2000})                  # changed → re-checked
+    changed = preflight.check_files([p], cache)
+    assert calls == [str(p)]
+    assert changed[p].md5 == _md5(p)
+
+
+def test_worker_process_path_matches_in_process(tmp_path):
+    paths = [_zip(tmp_path / f"{i}.zip", {"d": os.urandom(20_000)}) for i in range(3)]
+    pooled = preflight.check_files(paths, pool_min_bytes=0)
+    for p in paths:
+        assert pooled[p] == preflight.check_file(str(p))
+
+
+def test_worker_pool_spawns_rather_than_forks(tmp_path, monkeypatch):
+    seen = {}
+
+    class Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers=None, mp_context=None):
+            seen["start"] = mp_context.get_start_method()
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(preflight, "ProcessPoolExecutor", Pool)
+    p = _zip(tmp_path / "a.zip", {"d": b"x" * 100})
+    preflight.check_files([p], pool_min_bytes=0)
+    assert seen == {"start": "spawn"}
+
+
+@pytest.mark.parametrize("name", ["a.ZIP", "b.zip"])
+def test_zip_suffix_is_case_insensitive(tmp_path, name):
+    p = tmp_path / name
+    p.write_bytes(b"not a zip at all")
+    assert preflight.check_file(str(p)).zip_ok is False
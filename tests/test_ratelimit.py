@@ -0,0 +1,264 @@
+"""Tests for the shared per-host rate limiter — fake clock, no real sleeps."""
+
+from __future__ import annotations
+
+import io
+import urllib.error
+from email.message import Message
+
+import pytest
+
+from oa_tracker import ratelimit, sharepoint, zenodo
+from oa_tracker.config import SharePointSettings
+from oa_tracker.ratelimit import HostLimiter, _Budget
+
+
+class FakeClock:
+    def __init__(self, wall_offset=1_700_000_000.0):
+        self.now = 0.0
+        self.wall_offset = wall_offset
+        self.slept: list[float] = []
+
+    def clock(self):
+        return self.now
+
+    def wall(self):
+        return self.now + self.wall_offset
+
+    def sleep(self, s):
+        self.slept.append(s)
+        self.now += s
+
+
+def _limiter(clock, rate=1.0, burst=2, conc=4, pause=10.0):
+    return HostLimiter(
+        "api.test", _Budget(rate, burst, conc, pause),
+        clock=clock.clock, sleep=clock.sleep, wall=clock.wall,
+    )
+
+
+def _headers(**kv):
+    m = Message()
+    for k, v in kv.items():
+        m[k.replace("_", "-")] = str(v)
+    return m
+
+
+def test_token_bucket_paces_after_burst():
+    c = FakeClock()
+    lim = _limiter(c, rate=2.0, burst=2)
+    for _ in range(3):
+        lim.acquire()
+        lim.release(200)
+    assert c.slept == [pytest.approx(0.5)]
+    assert lim.waited == pytest.approx(0.5)
+    assert lim.requests == 3
+
+
+def test_retry_after_pauses_every_caller_and_halves_concurrency():
+    c = FakeClock()
+    lim = _limiter(c, rate=100.0, burst=100)
+    lim.acquire()
+    lim.release(429, _headers(Retry_After=7))
+    assert lim.concurrency == 2
+    assert lim.throttles == 1
+    lim.acquire()                       # the next caller, whoever it is
+    assert c.now == pytest.approx(7.0)
+
+
+def test_observed_sub_response_throttle_pauses_without_a_slot():
+    c = FakeClock()
+    lim = _limiter(c, rate=100.0, burst=100)
+    lim.observe(429, {"Retry-After": "3"})      # a $batch sub-response (dict headers)
+    assert lim.throttles == 1 and lim.concurrency == 2
+    lim.acquire()
+    assert c.now == pytest.approx(3.0)
+
+
+def test_throttle_without_retry_after_uses_default_pause():
+    c = FakeClock()
+    lim = _limiter(c, rate=100.0, burst=100, pause=3.0)
+    lim.acquire()
+    lim.release(429)
+    lim.acquire()
+    assert c.now == pytest.approx(3.0)
+
+
+def test_exhausted_remaining_waits_for_epoch_reset():
+    c = FakeClock()
+    lim = _limiter(c, rate=100.0, burst=100)
+    lim.acquire()
+    lim.release(200, _headers(X_RateLimit_Remaining=0,
+                              X_RateLimit_Reset=int(c.wall()) + 12))
+    lim.acquire()
+    assert c.now == pytest.approx(12.0)
+    assert lim.throttles == 0
+
+
+def test_remaining_budget_does_not_pause():
+    c = FakeClock()
+    lim = _limiter(c, rate=100.0, burst=100)
+    lim.acquire()
+    lim.release(200, _headers(X_RateLimit_Remaining=40, X_RateLimit_Reset=int(c.wall()) + 60))
+    lim.acquire()
+    assert c.slept == []
+
+
+def test_concurrency_grows_back_after_clean_run():
+    c = FakeClock()
+    lim = _limiter(c, rate=1000.0, burst=1000, conc=4)
+    lim.acquire()
+    lim.release(429, _headers(Retry_After=0))
+    assert lim.concurrency == 2
+    for _ in range(ratelimit._GROW_AFTER):
+        lim.acquire()
+        lim.release(200)
+    assert lim.concurrency == 3
+
+
+def test_slot_releases_on_error():
+    c = FakeClock()
+    lim = _limiter(c, conc=1)
+    with pytest.raises(RuntimeError):
+        with lim.slot():
+            raise RuntimeError("boom")
+    assert lim._in_flight == 0
+
+
+def test_streamed_body_takes_a_token_but_no_concurrency_slot():
+    c = FakeClock()
+    lim = _limiter(c, rate=1000.0, burst=1000, conc=1)
+    with lim.slot(hold=False) as upload:
+        assert lim._in_flight == 0
+        with lim.slot() as api:          # not queued behind the transfer
+            api.record(200, None)
+        upload.record(429, _headers(Retry_After=0))
+    assert lim.requests == 2
+    assert lim.throttles == 1 and lim._in_flight == 0
+
+
+def test_wait_report_and_reset(monkeypatch):
+    c = FakeClock()
+    lim = _limiter(c, rate=1.0, burst=1)
+    monkeypatch.setattr(ratelimit, "_LIMITERS", {"api.test": lim})
+    assert ratelimit.wait_report() == "no waits"
+    lim.acquire()
+    lim.release(429, _headers(Retry_After=4))
+    lim.acquire()
+    lim.release(200)
+    report = ratelimit.wait_report()
+    assert report.startswith("api.test 4.0 s over 2 request(s)")
+    assert "1 throttled" in report
+    ratelimit.reset_stats()
+    assert ratelimit.wait_report() == "no waits"
+
+
+def test_limiter_for_is_shared_per_host(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_LIMITERS", {})
+    a = ratelimit.limiter_for("https://zenodo.org/api/records")
+    b = ratelimit.limiter_for("https://zenodo.org/api/records/1/draft")
+    assert a is b
+    assert a.budget.rate == pytest.approx(100 / 60)
+    assert ratelimit.limiter_for("https://graph.microsoft.com/v1.0/sites") is not a
+
+
+# ── Client integration ───────────────────────────────────────────────
+
+class _Resp:
+    status = 200
+    headers = Message()
+
+    def read(self):
+        return b'{"ok": true}'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a):
+        return False
+
+
+def _throttle_then_ok(n_throttles, url="https://api.test/x"):
+    calls = []
+
+    def fake_urlopen(req, timeout=None):
+        calls.append(req.full_url)
+        if len(calls) <= n_throttles:
+            raise urllib.error.HTTPError(
+                url, 429, "Too Many Requests", _headers(Retry_After=2), io.BytesIO(b""))
+        return _Resp()
+    return calls, fake_urlopen
+
+
+@pytest.fixture
+def fake_limiter(monkeypatch):
+    c = FakeClock()
+    lim = _limiter(c, rate=100.0, burst=100)
+    monkeypatch.setattr(ratelimit, "limiter_for", lambda url: lim)
+    return c, lim
+
+
+def test_zenodo_client_retries_429_through_the_limiter(monkeypatch, fake_limiter):
+    c, lim = fake_limiter
+    calls, fake = _throttle_then_ok(4)      # more than the old 3-attempt loop
+    monkeypatch.setattr(zenodo.urllib.request, "urlopen", fake)
+    client = zenodo.ZenodoClient("https://api.test", "tok")
+    status, body = client.request("GET", "/x")
+    assert (status, body) == (200, {"ok": True})
+    assert len(calls) == 5
+    assert c.now == pytest.approx(8.0)
+    assert lim.throttles == 4
+
+
+def test_zenodo_client_gives_up_after_throttle_budget(monkeypatch, fake_limiter):
+    calls, fake = _throttle_then_ok(100)
+    monkeypatch.setattr(zenodo.urllib.request, "urlopen", fake)
+    client = zenodo.ZenodoClient("https://api.test", "tok")
+    with pytest.raises(zenodo.ZenodoError) as exc:
+        client.request("GET", "/x")
+    assert exc.value.kind == "transient" and exc.value.status == 429
+    assert len(calls) == ratelimit.MAX_THROTTLE_RETRIES + 1
+
+
+def test_zenodo_upload_body_holds_no_concurrency_slot(monkeypatch, fake_limiter):
+    _, lim = fake_limiter
+    in_flight = []
+
+    def fake_urlopen(req, timeout=None):
+        in_flight.append(lim._in_flight)
+        return _Resp()
+
+    monkeypatch.setattr(zenodo.urllib.request, "urlopen", fake_urlopen)
+    client = zenodo.ZenodoClient("https://api.test", "tok")
+    client.request("PUT", "/x", data=io.BytesIO(b"abc"), content_length=3)
+    client.request("GET", "/y")
+    assert in_flight == [0, 1]
+    assert lim.requests == 2
+
+
+def test_graph_client_retries_429_through_the_limiter(monkeypatch, fake_limiter):
+    c, _ = fake_limiter
+    calls, fake = _throttle_then_ok(1)
+    monkeypatch.setattr(sharepoint.urllib.request, "urlopen", fake)
+    client = sharepoint.GraphClient(SharePointSettings(client_id="cid"))
+    client._token = "tok"
+    status, _ = client.request("GET", "https://api.test/x")
+    assert status == 200
+    assert len(calls) == 2
+    assert c.now == pytest.approx(2.0)
+
+
+def test_bandwidth_limiter_paces_bytes():
+    c = FakeClock()
+    bw = ratelimit.BandwidthLimiter(1000, clock=c.clock, sleep=c.sleep)
+    bw.consume(1000)                    # the first second's burst
+    assert c.slept == []
+    bw.consume(500)
+    assert c.slept == [pytest.approx(0.5)]
+    assert bw.waited == pytest.approx(0.5)
+
+
+def test_upload_bandwidth_shared_and_optional(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_BANDWIDTH", {})
+    assert ratelimit.upload_bandwidth(0) is None
+    assert ratelimit.upload_bandwidth(2048) is ratelimit.upload_bandwidth(2048)
@@ -190,3 +190,107 @@ def test_report_inline_annotation_shows_mandate_label(test_config):
     content = path.read_text()
     # Annotation appears under New This Week / Newly Active entries
     assert "mandate: Open Data Required" in content
+
+
+# ── SQL-aggregated sections ──────────────────────────────────────────
+
+def _golden_fixture(test_config, monkeypatch):
+    """A registry touching every report section, at a fixed 'now'."""
+    from oa_tracker import report
+    monkeypatch.setattr(report, "_now", lambda: datetime(2026, 7, 10, 12, 0, 0))
+    rows = [
+        ("P01", "OPEN_INACTIVE", dict(first_seen_at="2026-07-08T09:00:00",
+                                      next_reminder_at="2026-07-09T00:00:00", reminder_count=1)),
+        ("P02", "OPEN_ACTIVE", dict(first_seen_at="2026-05-01T00:00:00",
+                                    became_active_at="2026-07-05T00:00:00",
+                                    pub_db_last_refreshed_at="2026-07-01T00:00:00",
+                                    oa_data_required=1)),
+        ("P03", "OPEN_ACTIVE", dict(first_seen_at="2026-03-01T00:00:00",
+                                    became_active_at="2026-04-01T00:00:00",
+                                    unexpected_missing_folder=1,
+                                    missing_folder_detected_at="2026-07-02T00:00:00")),
+        ("P04", "OPEN_ZENODO_PUBLISHED", dict(first_seen_at="2026-02-01T00:00:00",
+                                              pub_db_last_refreshed_at="2026-07-01T00:00:00",
+                                              oa_mandate_missing=1,
+                                              oa_mandate_source="proj=7:unknown")),
+        ("P05", "OPEN_READY_FOR_ZENODO_DRAFT", dict(first_seen_at="2026-02-01T00:00:00",
+                                                    oa_mandate_missing=1)),
+        ("P06", "CLOSED_DATA_ARCHIVED", dict(first_seen_at="2026-01-01T00:00:00",
+                                             final_pid="10.5281/zenodo.6")),
+        ("P07", "CLOSED_PUBLICATION_ONLY", dict(first_seen_at="2026-01-01T00:00:00")),
+        ("P08", "CLOSED_EXCEPTION", dict(first_seen_at="2026-07-09T00:00:00",
+                                         became_active_at="", pub_db_last_refreshed_at="x",
+                                         oa_data_required=0, oa_paper_required=0)),
+    ]
+    with get_connection(test_config.database) as conn:
+        for pub_id, status, kw in rows:
+            kw.setdefault("last_seen_at", "2026-07-10T00:00:00")
+            upsert_archive(conn, publication_id=pub_id, folder_path=f"/tmp/{pub_id}",
+                           status=status, **kw)
+        for pub_id, ts, new in (("P06", "2026-07-08T00:00:00", "CLOSED_DATA_ARCHIVED"),
+                                ("P07", "2026-06-01T00:00:00", "CLOSED_PUBLICATION_ONLY"),
+                                ("P08", "2026-07-09T00:00:00", "CLOSED_EXCEPTION"),
+                                ("P02", "2026-07-09T00:00:00", None)):
+            conn.execute(
+                "INSERT INTO events (ts, publication_id, action_code, new_status, source) "
+                "VALUES (?, ?, 'x', ?, 'test')", (ts, pub_id, new))
+
+
+_GOLDEN = """\
+# Weekly Report — 2026-07-10
+
+## New This Week
+- **P01** — OPEN_INACTIVE (seen 2026-07-08T09:00:00)
+    - mandate: not yet derived
+- **P08** — CLOSED_EXCEPTION (seen 2026-07-09T00:00:00)
+    - mandate: No OA
+
+## Newly Active
+- **P02** — active since 2026-07-05T00:00:00
+    - mandate: Open Data Required
+
+## Stuck / Long-Idle (OPEN_ACTIVE > 30 days)
+- **P03** — active for 100 days
+    - mandate: not yet derived
+
+## Reminders Due
+- **P01** — reminder #2 (due 2026-07-09T00:00:00)
+
+## Ready Queue (Pipeline View)
+- OPEN_INACTIVE: 1
+- OPEN_ACTIVE: 2
+- OPEN_READY_FOR_ZENODO_DRAFT: 1
+- OPEN_ZENODO_DRAFT_CREATED: 0
+- OPEN_ZENODO_DRAFT_VALIDATED: 0
+- OPEN_ZENODO_PUBLISHED: 1
+- OPEN_DB_UPDATED: 0
+
+## Integrity Warnings
+- **P03** — folder missing since 2026-07-02T00:00:00, status: OPEN_ACTIVE
+
+## Mandate Issues — confirm with PO/IT
+- **P04** — OPEN_ZENODO_PUBLISHED; no mandate derivable (refreshed 2026-07-01T00:00:00)
+    - trace: `proj=7:unknown`
+- **P05** — OPEN_READY_FOR_ZENODO_DRAFT; no mandate derivable (refreshed unknown)
+
+## Recently Closed
+- **P06** — CLOSED_DATA_ARCHIVED, PID: 10.5281/zenodo.6
+- **P08** — CLOSED_EXCEPTION
+
+## Summary
+- Total open: 5
+- Total closed: 3
+- Total tracked: 8
+"""
+
+
+def test_report_output_is_unchanged_by_sql_sections(test_config, monkeypatch):
+    """The per-section queries reproduce the former Python-filtered
+    report byte for byte (this text is that version's output)."""
+    from oa_tracker import db
+    _golden_fixture(test_config, monkeypatch)
+
+    def everything(*a, **kw):
+        raise AssertionError("report loaded the whole registry")
+    monkeypatch.setattr(db, "get_all_archives", everything)
+    assert generate_report(test_config).read_text() == _GOLDEN
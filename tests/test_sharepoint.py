@@ -6,7 +6,11 @@ provisioning are exercised end to end. Pure mappers are tested directly.
 """
 
 import io
+import json
+import re
+import threading
 import urllib.error
+import urllib.parse
 
 import pytest
 
@@ -14,10 +18,11 @@ from oa_tracker import sharepoint as sp_mod
 from oa_tracker.config import SharePointSettings, load_config
 from oa_tracker.sharepoint import (
     COLUMNS, D_PUBID, D_CONTACT, D_CORR, D_INGESTED, D_REQSTATUS, D_STATUS,
-    EXEMPTION_CHOICES, Proposal, PulledItem,
+    EXEMPTION_CHOICES, GraphExecutor, Proposal, PulledItem,
     build_system_fields, data_archiving_label, diff_against_list,
     ensure_list, fetch_items, folder_url, pull_proposals, push_archives,
-    reconcile_closed_rows, status_label, user_signature, write_proposal_feedback,
+    reconcile_closed_rows, status_label, user_signature, write_feedback_batch,
+    write_proposal_feedback,
 )
 
 
@@ -72,18 +77,123 @@ class FakeGraph:
         # Column display names that 409 on create (simulating an already-existing
         # column the columns API doesn't list back, e.g. a hidden one).
         self.conflict_displays = set(conflict_displays)
-
-    def request(self, method, path, json_body=None):
+        # /items/delta: every item write appends (seq, item id) to the
+        # change log; a delta link carries the seq it was issued at.
+        self.seq = 0
+        self.changes = []
+        self.delta_page = 1000
+        # $batch: sizes of the batch calls, sub-requests seen, and how
+        # many sub-requests to answer 429 next.
+        self.batches = []
+        self.sub_calls = []
+        self.throttle_subs = 0
+        # Answer 400 to a delta $select naming a field the list lacks, as
+        # Graph does (off by default: conflict_displays columns aren't listed).
+        self.strict_select = False
+        # Batches may arrive from several GraphExecutor threads at once.
+        self._lock = threading.Lock()
+
+    def add_users(self, *users):
+        """Create (or extend) the site User Information List with
+        ``(email, name, modified)`` entries."""
+        uil = next((lid for lid, l in self.lists.items()
+                    if l["displayName"] == "User Information List"), None)
+        if uil is None:
+            self._lid += 1
+            uil = f"L{self._lid}"
+            self.lists[uil] = {"displayName": "User Information List",
+                               "webUrl": "", "columns": {}, "items": {}}
+        items = self.lists[uil]["items"]
+        for email, name, modified in users:
+            uid = str(len(items) + 1)
+            items[uid] = {"id": uid, "fields": {"EMail": email, "Title": name,
+                                                "Modified": modified}}
+        return uil
+
+    def _changed(self, iid):
+        self.seq += 1
+        self.changes.append((self.seq, iid))
+
+    @staticmethod
+    def _narrow(path, rows):
+        """Apply ``$expand=fields($select=...)`` the way Graph does."""
+        m = re.search(r"fields\(\$select=([^)]*)\)", urllib.parse.unquote(path))
+        if m is None:
+            return rows
+        keep = set(m.group(1).split(","))
+        return [{**r, "fields": {k: v for k, v in r.get("fields", {}).items() if k in keep}}
+                if "fields" in r else r for r in rows]
+
+    def _delta(self, path, lst):
+        query = urllib.parse.parse_qs(path.split("?", 1)[1]) if "?" in path else {}
+        base = path.split("?", 1)[0]
+        if "token" in query:
+            if query["token"][0] == "expired":
+                raise urllib.error.HTTPError(path, 410, "Gone", {}, io.BytesIO(b"resyncRequired"))
+            since = int(query["token"][0])
+            ids = list(dict.fromkeys(i for n, i in self.changes if n > since))
+            rows = [lst["items"].get(i) or {"id": i, "@removed": {"reason": "deleted"}}
+                    for i in ids]
+        else:
+            rows = list(lst["items"].values())
+        if self.strict_select:
+            m = re.search(r"fields\(\$select=([^)]*)\)", urllib.parse.unquote(path))
+            known = {"Title"} | {n + s for n in lst["columns"].values() for s in ("", "LookupId")}
+            unknown = set(m.group(1).split(",")) - known if m else set()
+            if unknown:
+                raise urllib.error.HTTPError(
+                    path, 400, "Bad Request", {},
+                    io.BytesIO(json.dumps({"error": {
+                        "code": "invalidRequest",
+                        "message": f"Field '{sorted(unknown)[0]}' is not recognized"}}).encode()),
+                )
+        skip = int(query.get("skip", ["0"])[0])
+        page = rows[skip:skip + self.delta_page]
+        body = {"value": self._narrow(path, [dict(r) for r in page])}
+        if skip + self.delta_page < len(rows):
+            keep = "&".join(f"{k}={v[0]}" for k, v in query.items() if k != "skip")
+            body["@odata.nextLink"] = f"{base}?{keep}&skip={skip + self.delta_page}"
+        else:
+            expand = "&".join(f"{k}={v[0]}" for k, v in query.items() if k == "$expand")
+            body["@odata.deltaLink"] = f"{base}?token={self.seq}" + (f"&{expand}" if expand else "")
+        return 200, body
+
+    def request(self, method, path, json_body=None, headers=None):
+        with self._lock:
+            return self._request(method, path, json_body, headers)
+
+    def _request(self, method, path, json_body=None, headers=None):
         self.calls.append((method, path))
+        self.headers = headers or {}
+        if path == "/$batch":
+            self.batches.append(len(json_body["requests"]))
+            return 200, {"responses": [self._sub(r) for r in json_body["requests"]]}
+        return self._route(method, path, json_body)
+
+    def _sub(self, req):
+        self.sub_calls.append((req["method"], req["url"]))
+        if self.throttle_subs:
+            self.throttle_subs -= 1
+            return {"id": req["id"], "status": 429, "headers": {"Retry-After": "0"},
+                    "body": {"error": {"code": "TooManyRequests"}}}
+        try:
+            status, body = self._route(req["method"], req["url"], req.get("body"))
+        except urllib.error.HTTPError as e:
+            status, body = e.code, json.loads(e.read() or b"{}")
+        return {"id": req["id"], "status": status, "body": body}
+
+    def _route(self, method, path, json_body=None):
         parts = path.split("?", 1)[0].strip("/").split("/")
         # /sites/{sid}/lists ...
         if parts[:3] == ["sites", SID, "lists"]:
             rest = parts[3:]
             if not rest:
                 if method == "GET":
+                    m = re.search(r"displayName eq '([^']*)'", urllib.parse.unquote(path))
                     return 200, {"value": [
                         {"id": lid, "displayName": l["displayName"], "webUrl": l["webUrl"]}
                         for lid, l in self.lists.items()
+                        if m is None or l["displayName"] == m.group(1)
                     ]}
                 if method == "POST":
                     self._lid += 1
@@ -97,7 +207,11 @@ class FakeGraph:
                                  "webUrl": self.lists[lid]["webUrl"]}
             else:
                 lid = rest[0]
+                if lid not in self.lists:
+                    raise urllib.error.HTTPError(path, 404, "Not Found", {}, io.BytesIO(b"{}"))
                 lst = self.lists[lid]
+                if rest[1:] == [] and method == "GET":
+                    return 200, {"id": lid, "displayName": lst["displayName"]}
                 if rest[1:] == ["columns"]:
                     if method == "GET":
                         return 200, {"value": [
@@ -111,9 +225,17 @@ class FakeGraph:
                             )
                         lst["columns"][json_body["displayName"]] = json_body["name"]
                         return 201, {"name": json_body["name"], "displayName": json_body["displayName"]}
+                if rest[1:] == ["items", "delta"] and method == "GET":
+                    return self._delta(path, lst)
                 if rest[1:] == ["items"]:
                     if method == "GET":
-                        return 200, {"value": list(lst["items"].values())}
+                        rows = list(lst["items"].values())
+                        m = re.search(r"fields/Modified gt '([^']*)'", urllib.parse.unquote(path))
+                        if m:
+                            assert self.headers.get("Prefer") == \
+                                "HonorNonIndexedQueriesWarningMayFailRandomly"
+                            rows = [r for r in rows if r["fields"].get("Modified", "") > m.group(1)]
+                        return 200, {"value": self._narrow(path, rows)}
                     if method == "POST":
                         fields = json_body["fields"]
                         if fields.get("PubId") in self.fail_create_pubids:
@@ -123,13 +245,20 @@ class FakeGraph:
                         self._iid += 1
                         iid = f"I{self._iid}"
                         lst["items"][iid] = {"id": iid, "fields": dict(fields)}
+                        self._changed(iid)
                         return 201, lst["items"][iid]
                 if len(rest) == 4 and rest[1] == "items" and rest[3] == "fields" and method == "PATCH":
                     iid = rest[2]
+                    if iid not in lst["items"]:
+                        raise urllib.error.HTTPError(
+                            path, 404, "Not Found", {}, io.BytesIO(b'{"error":"itemNotFound"}')
+                        )
                     lst["items"][iid]["fields"].update(json_body)
+                    self._changed(iid)
                     return 200, json_body
                 if len(rest) == 3 and rest[1] == "items" and method == "DELETE":
                     lst["items"].pop(rest[2], None)
+                    self._changed(rest[2])
                     return 204, {}
         raise AssertionError(f"unhandled fake request: {method} {path}")
 
@@ -250,11 +379,21 @@ def test_push_creates_then_updates_idempotent():
     assert (r1.created, r1.updated) == (2, 0)
     assert len(fetch_items(g, SID, list_id, name_for[D_PUBID])) == 2
 
-    # Second push updates the same rows (matched on PubId), no duplicates.
+    # Second push matches the same rows on PubId: no duplicates, and
+    # nothing written for rows that already show these values.
     r2 = push_archives(g, SID, list_id, sp, name_for, {}, archives, "2026-06-03T01:00:00")
-    assert (r2.created, r2.updated) == (0, 2)
+    assert (r2.created, r2.updated, r2.skipped_unchanged) == (0, 0, 2)
     assert len(fetch_items(g, SID, list_id, name_for[D_PUBID])) == 2
 
+    # A real change is patched — and only then does Last updated move.
+    archives[1]["status"] = "OPEN_INACTIVE"
+    r3 = push_archives(g, SID, list_id, sp, name_for, {}, archives, "2026-06-03T02:00:00")
+    assert (r3.created, r3.updated, r3.skipped_unchanged) == (0, 1, 1)
+    items = fetch_items(g, SID, list_id, name_for[D_PUBID])
+    synced = name_for[sp_mod.D_SYNCED]
+    assert items["100"]["fields"][synced] == "2026-06-03T00:00:00"
+    assert items["101"]["fields"][synced] == "2026-06-03T02:00:00"
+
 
 def test_push_counts_person_columns_when_resolved():
     g = FakeGraph()
@@ -279,6 +418,272 @@ def test_push_is_resilient_to_a_failing_row():
     assert "BAD" in r.warnings[0]
 
 
+def test_push_with_existing_skips_the_list_fetch_and_updates_it():
+    g = FakeGraph()
+    sp = SharePointSettings()
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    existing = {}
+    r1 = push_archives(g, SID, list_id, sp, name_for, {}, [_archive("100")], "t0",
+                       existing=existing)
+    assert r1.created == 1 and existing["100"]["id"] == "I1"
+    r2 = push_archives(g, SID, list_id, sp, name_for, {},
+                       [_archive("100", status="OPEN_INACTIVE")], "t1", existing=existing)
+    assert r2.updated == 1
+    assert existing["100"]["fields"][name_for[D_STATUS]] == status_label("OPEN_INACTIVE")
+    assert not any(p.split("?")[0].endswith("/items") and m == "GET" for m, p in g.calls)
+
+
+def test_push_writes_go_out_in_batches_of_twenty():
+    g = FakeGraph()
+    sp = SharePointSettings()
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    archives = [_archive(str(n)) for n in range(45)]
+    r1 = push_archives(g, SID, list_id, sp, name_for, {}, archives, "t0")
+    assert (r1.created, r1.updated) == (45, 0)
+    assert g.batches == [20, 20, 5]
+    for a in archives:
+        a["status"] = "OPEN_INACTIVE"
+    r2 = push_archives(g, SID, list_id, sp, name_for, {}, archives, "t1")
+    assert (r2.created, r2.updated) == (0, 45)
+    assert g.batches[3:] == [20, 20, 5]
+    assert not any(m in ("POST", "PATCH") and "/items" in p for m, p in g.calls)
+
+
+def test_throttled_sub_requests_are_retried_individually(monkeypatch):
+    from oa_tracker import ratelimit
+
+    monkeypatch.setattr(ratelimit, "_LIMITERS", {})
+    g = FakeGraph()
+    sp = SharePointSettings()
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    g.throttle_subs = 2
+    r = push_archives(g, SID, list_id, sp, name_for, {},
+                      [_archive("1"), _archive("2"), _archive("3")], "t0")
+    assert r.created == 3 and r.warnings == []
+    singles = [(m, p) for m, p in g.calls if m == "POST" and p.endswith("/items")]
+    assert len(singles) == 2
+    assert ratelimit.limiter_for(sp_mod.GRAPH).throttles == 2
+
+
+def test_push_skips_rows_whose_pushed_hash_matches():
+    g = FakeGraph()
+    sp = SharePointSettings()
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    existing: dict = {}
+    r1 = push_archives(g, SID, list_id, sp, name_for, {}, [_archive("1")], "t0", existing=existing)
+    assert r1.touched == ["1"] and existing["1"]["pushed_hash"]
+
+    # The row was changed outside the sync; the mirror doesn't know yet.
+    existing["1"]["fields"][name_for[D_STATUS]] = "edited by hand"
+    r2 = push_archives(g, SID, list_id, sp, name_for, {}, [_archive("1")], "t1", existing=existing)
+    assert (r2.updated, r2.skipped_unchanged, r2.touched) == (0, 1, [])
+    r3 = push_archives(g, SID, list_id, sp, name_for, {}, [_archive("1")], "t2",
+                       existing=existing, full=True)
+    assert (r3.updated, r3.touched) == (1, ["1"])
+    assert existing["1"]["fields"][name_for[D_STATUS]] == status_label("OPEN_ACTIVE")
+
+
+def test_pull_skips_signatures_taken_in_locally():
+    nf = _name_for()
+    it = _item("3000", "I1", **{nf[sp_mod.D_NOTES]: "hello"})
+    (pi,) = pull_proposals([it], nf)
+    assert pull_proposals([{**it, "pulled_sig": pi.new_sig}], nf) == []
+    assert pull_proposals([{**it, "pulled_sig": "older"}], nf)[0].new_sig == pi.new_sig
+
+
+def test_graph_executor_runs_calls_concurrently_in_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def call(n):
+        barrier.wait()              # deadlocks (BrokenBarrierError) if run serially
+        return n
+
+    calls = [lambda n=n: call(n) for n in range(3)]
+    assert GraphExecutor(3).run(calls) == [0, 1, 2]
+    assert GraphExecutor(1).run([lambda: "a", lambda: "b"]) == ["a", "b"]
+
+
+def test_concurrent_push_matches_serial_results_and_warning_order():
+    def run(executor):
+        g = FakeGraph(fail_create_pubids={"7", "33"})
+        sp = SharePointSettings()
+        list_id, _, name_for = ensure_list(g, SID, sp)
+        r = push_archives(g, SID, list_id, sp, name_for, {},
+                          [_archive(str(n)) for n in range(45)], "t0", executor=executor)
+        return r.created, r.warnings, sorted(g.batches)
+
+    assert run(GraphExecutor(4)) == run(None)
+    created, warnings, _ = run(GraphExecutor(4))
+    assert created == 43
+    assert [w.split(":")[0] for w in warnings] == ["7", "33"]
+
+
+def test_feedback_batch_stamps_rows_and_reports_failures_in_order():
+    g = FakeGraph()
+    lid, _, name_for = ensure_list(g, SID, SharePointSettings())
+    for iid in ("I1", "I2"):
+        g.lists[lid]["items"][iid] = {"id": iid, "fields": {}}
+    stamps = [
+        (PulledItem("3000", "I1", "s1", proposals=[Proposal("propose_done", "t")]),
+         sp_mod.REQUEST_STATUS_PROCESSED),
+        (PulledItem("3001", "GONE", "s2", user_notes="n"), None),
+        (PulledItem("3002", "I2", "s3", user_notes="n"), None),
+    ]
+    fb = write_feedback_batch(g, SID, lid, name_for, stamps, GraphExecutor(2))
+    assert len(fb.warnings) == 1 and fb.warnings[0].startswith("3001: feedback stamp failed: HTTP 404")
+    assert [pi.pub_id for pi in fb.stamped] == ["3000", "3002"]
+    f1 = g.lists[lid]["items"]["I1"]["fields"]
+    assert f1[name_for[D_REQSTATUS]] == sp_mod.REQUEST_STATUS_PROCESSED
+    assert g.lists[lid]["items"]["I2"]["fields"] == {name_for[D_INGESTED]: "s3"}
+    assert g.batches == [3]
+
+
+def test_reconcile_failures_map_back_to_their_rows():
+    g = FakeGraph()
+    sp = SharePointSettings(sync_closed=False)
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    push_archives(g, SID, list_id, sp, name_for, {}, [_archive("1"), _archive("2")], "t0")
+    existing = fetch_items(g, SID, list_id, name_for[D_PUBID])
+    existing["2"]["id"] = "NOPE"                  # row vanished since the fetch
+    closed = {pid: _archive(pid, status="CLOSED_DATA_ARCHIVED") for pid in ("1", "2")}
+    r = reconcile_closed_rows(g, SID, list_id, sp, name_for, existing, closed, "t1")
+    assert r.relabeled == 1
+    assert len(r.warnings) == 1 and r.warnings[0].startswith("2: HTTP 404 on reconcile")
+
+
+def test_fields_changed_tolerates_graph_representations():
+    want = {"EmbargoMonths": 6, "DataContactLookupId": 7, "Title": "T", "LastSynced": "t1"}
+    have = {"EmbargoMonths": 6.0, "DataContactLookupId": "7", "Title": "T", "LastSynced": "t0"}
+    assert not sp_mod.fields_changed(want, have, ignore="LastSynced")
+    assert sp_mod.fields_changed(want, have)
+    assert sp_mod.fields_changed({**want, "Title": "U"}, have, ignore="LastSynced")
+    assert sp_mod.fields_changed({"Folder": "https://x"}, {}, ignore="LastSynced")
+
+
+def test_push_summary_reports_skipped_rows():
+    r = sp_mod.PushResult(created=1, updated=2, skipped_unchanged=40)
+    assert "Unchanged (skipped): 40" in r.summary
+
+
+def test_list_handle_round_trip_and_registry_check():
+    h = sp_mod.ListHandle("S", "L", _name_for())
+    back = sp_mod.ListHandle.from_json(h.to_json())
+    assert back == h and back.covers_registry()
+    partial = {d: n for d, n in _name_for().items() if d != D_REQSTATUS}
+    assert not sp_mod.ListHandle("S", "L", partial).covers_registry()
+    assert sp_mod.ListHandle.from_json('{"site_id": "S"}') is None
+
+
+# ── Site user directory ──────────────────────────────────────────────
+
+def test_user_directory_full_read_then_incremental_top_up():
+    from datetime import datetime
+
+    g = FakeGraph()
+    uil = g.add_users(("a@x.es", "Ann", "2026-10-01T00:00:00Z"),
+                      ("b@x.es", "Bob", "2026-10-02T00:00:00Z"))
+    t0 = datetime(2026, 10, 19, 8, 0)
+    d = sp_mod.load_user_directory(g, SID, None, t0, ttl_hours=24)
+    assert d.list_id == uil and d.by_email() == {"a@x.es": "1", "b@x.es": "2"}
+    assert d.details()["2"] == {"name": "Bob", "email": "b@x.es"}
+    assert d.modified == "2026-10-02T00:00:00Z"
+
+    g.add_users(("c@x.es", "Cy", "2026-10-19T07:30:00Z"))
+    g.calls.clear()
+    cached = sp_mod.UserDirectory.from_json(d.to_json())
+    d2 = sp_mod.load_user_directory(g, SID, cached, t0.replace(hour=12), ttl_hours=24)
+    assert d2.by_email()["c@x.es"] == "3" and len(d2.users) == 3
+    # No list discovery, one filtered read that returned only the new entry.
+    assert len(g.calls) == 1 and "Modified" in urllib.parse.unquote(g.calls[0][1])
+    assert d2.refreshed_at == d.refreshed_at
+
+
+def test_user_directory_rereads_in_full_after_ttl():
+    from datetime import datetime
+
+    g = FakeGraph()
+    uil = g.add_users(("a@x.es", "Ann", "2026-10-01T00:00:00Z"),
+                      ("b@x.es", "Bob", "2026-10-02T00:00:00Z"))
+    d = sp_mod.load_user_directory(g, SID, None, datetime(2026, 10, 18, 8, 0), ttl_hours=24)
+    g.lists[uil]["items"].pop("2")                  # Bob left the site
+    d2 = sp_mod.load_user_directory(g, SID, d, datetime(2026, 10, 19, 9, 0), ttl_hours=24)
+    assert d2.by_email() == {"a@x.es": "1"}
+    assert d2.refreshed_at == "2026-10-19T09:00:00"
+
+
+def test_user_directory_from_json_rejects_garbage():
+    assert sp_mod.UserDirectory.from_json(None) is None
+    assert sp_mod.UserDirectory.from_json("{not json") is None
+    assert sp_mod.UserDirectory.from_json('{"users": {}}') is None
+
+
+# ── Delta pull ───────────────────────────────────────────────────────
+
+def test_delta_first_round_is_full_then_only_changes():
+    g = FakeGraph()
+    sp = SharePointSettings()
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    push_archives(g, SID, list_id, sp, name_for, {},
+                  [_archive("1"), _archive("2"), _archive("3")], "t0")
+    g.delta_page = 2                               # exercise nextLink paging
+
+    first = sp_mod.fetch_delta(g, SID, list_id)
+    assert first.full and len(first.changed) == 3 and first.removed == []
+    assert first.delta_link
+
+    quiet = sp_mod.fetch_delta(g, SID, list_id, first.delta_link)
+    assert not quiet.full and quiet.changed == [] and quiet.removed == []
+
+    g.request("PATCH", f"/sites/{SID}/lists/{list_id}/items/I2/fields", {"Notes": "hi"})
+    g.request("DELETE", f"/sites/{SID}/lists/{list_id}/items/I3")
+    later = sp_mod.fetch_delta(g, SID, list_id, quiet.delta_link)
+    assert [it["id"] for it in later.changed] == ["I2"]
+    assert later.changed[0]["fields"]["Notes"] == "hi"
+    assert later.removed == ["I3"]
+
+
+def test_expired_delta_link_restarts_as_full_round():
+    g = FakeGraph()
+    sp = SharePointSettings()
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    push_archives(g, SID, list_id, sp, name_for, {}, [_archive("1")], "t0")
+    stale = f"/sites/{SID}/lists/{list_id}/items/delta?token=expired"
+    r = sp_mod.fetch_delta(g, SID, list_id, stale)
+    assert r.full and [it["id"] for it in r.changed] == ["I1"]
+    assert "token=expired" not in r.delta_link
+
+
+def test_select_fields_follow_the_registry():
+    nf = _name_for()
+    pull = sp_mod.select_fields(nf, "pull")
+    assert pull[0] == nf[D_PUBID] and nf[D_INGESTED] in pull
+    assert nf[sp_mod.D_REASSIGN] + "LookupId" in pull and nf[D_STATUS] not in pull
+    assert sp_mod.select_fields(nf, "reconcile") == [nf[D_PUBID], nf[D_STATUS]]
+    both = sp_mod.select_fields(nf, "pull", "reconcile")
+    assert len(both) == len(set(both)) == len(pull) + 1
+    push = sp_mod.select_fields(nf, "push")
+    assert nf[D_CONTACT] + "LookupId" in push and nf[sp_mod.D_NOTES] not in push
+    assert sp_mod.select_fields({D_PUBID: "PubId"}, "reconcile") == ["PubId"]
+
+
+def test_fetches_read_only_the_selected_fields():
+    g = FakeGraph()
+    sp = SharePointSettings()
+    list_id, _, name_for = ensure_list(g, SID, sp)
+    push_archives(g, SID, list_id, sp, name_for, {}, [_archive("1")], "t0")
+    g.lists[list_id]["items"]["I1"]["fields"]["_UIVersionString"] = "1.0"
+    sel = sp_mod.select_fields(name_for, "reconcile")
+    items = fetch_items(g, SID, list_id, name_for[D_PUBID], sel)
+    assert set(items["1"]["fields"]) == {name_for[D_PUBID], name_for[D_STATUS]}
+    assert "$select=" in g.calls[-1][1]
+
+    first = sp_mod.fetch_delta(g, SID, list_id, select=sel)
+    assert set(first.changed[0]["fields"]) == set(sel)
+    g.request("PATCH", f"/sites/{SID}/lists/{list_id}/items/I1/fields", {"UserNotes": "x"})
+    later = sp_mod.fetch_delta(g, SID, list_id, first.delta_link)
+    assert set(later.changed[0]["fields"]) == set(sel)      # the link keeps the $select
+
+
 # ── Reconcile closed rows ────────────────────────────────────────────
 
 def test_reconcile_closed_relabels_then_removes_when_sync_closed_false():
@@ -0,0 +1,143 @@
+"""HTTP-level tests: the real GraphClient against the local fake Graph
+server (tests/fake_graph.py, shared with the benchmarks).
+
+test_sharepoint.py fakes the client; these exercise what only a socket
+can — absolute paging links, ``$batch`` over the wire, delta tokens, 429
+pacing and the ``oa auto`` stages end to end.
+"""
+
+from __future__ import annotations
+
+import urllib.error
+
+import pytest
+
+from oa_tracker import auto, db, ratelimit, sharepoint as sp_mod
+from oa_tracker.config import SharePointSettings
+
+from tests.fake_graph import FakeGraphServer
+from tests.test_auto import NOW, _seed
+from tests.test_sharepoint import _archive
+
+TOKEN = "tok"
+
+
+@pytest.fixture
+def server(monkeypatch, fresh_limiters):
+    monkeypatch.setattr(ratelimit, "_DEFAULT_BUDGET", ratelimit._Budget(1000.0, 100, 4, 0.0))
+    with FakeGraphServer(token=TOKEN) as srv:
+        yield srv
+
+
+def _client(server, token=TOKEN):
+    sp = SharePointSettings(client_id="app", site=server.site)
+    return sp, sp_mod.GraphClient(sp, base_url=server.graph_url, token=token)
+
+
+def _provisioned(server):
+    sp, client = _client(server)
+    site_id = client.get_site_id(server.site)
+    list_id, _, name_for = sp_mod.ensure_list(client, site_id, sp)
+    return sp, client, site_id, list_id, name_for
+
+
+def test_push_then_paged_fetch_round_trip(server):
+    sp, client, site_id, list_id, name_for = _provisioned(server)
+    archives = [_archive(str(n)) for n in range(45)]
+    r = sp_mod.push_archives(client, site_id, list_id, sp, name_for, {}, archives, "t0")
+    assert (r.created, r.warnings) == (45, [])
+    assert server.stats.sub_requests["POST /sites/{site}/lists/{list}/items"] == 45
+
+    server.faults.max_page = 10
+    server.reset_stats()
+    items = sp_mod.fetch_items(client, site_id, list_id, name_for[sp_mod.D_PUBID],
+                               sp_mod.select_fields(name_for, "push"))
+    assert len(items) == 45 and server.stats.total == 5
+    fields = items["7"]["fields"]
+    assert "_UIVersionString" not in fields and fields["EmbargoMonths"] == 6.0
+
+    r2 = sp_mod.push_archives(client, site_id, list_id, sp, name_for, {}, archives, "t1")
+    assert (r2.created, r2.updated, r2.skipped_unchanged) == (0, 0, 45)
+
+
+def test_delta_rounds_over_http(server):
+    sp, client, site_id, list_id, name_for = _provisioned(server)
+    sp_mod.push_archives(client, site_id, list_id, sp, name_for, {},
+                         [_archive("1"), _archive("2")], "t0")
+    sel = sp_mod.select_fields(name_for, "sync")
+    first = sp_mod.fetch_delta(client, site_id, list_id, select=sel)
+    assert first.full and len(first.changed) == 2
+
+    item_id = first.changed[0]["id"]
+    server.edit(list_id, item_id, {"UserNotes": "hi"})
+    later = sp_mod.fetch_delta(client, site_id, list_id, first.delta_link)
+    assert [it["id"] for it in later.changed] == [item_id]
+    assert later.changed[0]["fields"]["UserNotes"] == "hi"
+    assert set(later.changed[0]["fields"]) <= set(sel) | {"@odata.etag"}
+
+    stale = first.delta_link.replace("token=", "token=x")
+    assert sp_mod.fetch_delta(client, site_id, list_id, stale).full
+
+
+def test_throttling_is_absorbed(server):
+    sp, client, site_id, list_id, name_for = _provisioned(server)
+    server.faults.throttle_every = 3
+    server.faults.sub_throttle_every = 4
+    archives = [_archive(str(n)) for n in range(30)]
+    r = sp_mod.push_archives(client, site_id, list_id, sp, name_for, {}, archives, "t0")
+    assert (r.created, r.warnings) == (30, [])
+    assert server.stats.status[429] and server.stats.sub_throttled
+    assert len(server.items(list_id)) == 30
+
+
+def test_user_directory_refresh_needs_prefer_header(server):
+    server.add_users(("a@example.org", "A"), ("b@example.org", "B"))
+    _, client = _client(server)
+    site_id = client.get_site_id(server.site)
+    uil = sp_mod.find_user_info_list(client, site_id)
+    assert len(sp_mod.read_user_rows(client, site_id, uil)) == 2
+    assert sp_mod.read_user_rows(client, site_id, uil, since="2000-01-01T00:00:00Z")
+    with pytest.raises(urllib.error.HTTPError) as e:
+        client.request("GET", f"/sites/{site_id}/lists/{uil}/items"
+                              "?$filter=fields/Modified%20gt%20%272000%27")
+    assert e.value.code == 400
+
+
+def test_bad_token_is_rejected(server):
+    _, client = _client(server, token="wrong")
+    with pytest.raises(urllib.error.HTTPError) as e:
+        client.get_site_id(server.site)
+    assert e.value.code == 401
+
+
+def test_auto_stages_against_the_server(server, test_config, monkeypatch):
+    server.add_users(("scarregal@cicbiomagune.es", "Susana"))
+    test_config.sharepoint.enabled = True
+    test_config.sharepoint.client_id = "app"
+    test_config.sharepoint.site = server.site
+    _, client = _client(server)
+    list_id, _, _ = sp_mod.ensure_list(client, client.get_site_id(server.site), test_config.sharepoint)
+    real = sp_mod.GraphClient
+    monkeypatch.setattr(sp_mod, "GraphClient", lambda sp, interactive=True: real(
+        sp, interactive=interactive, base_url=server.graph_url, token=TOKEN))
+    _seed(test_config, "3290")
+    _seed(test_config, "3291")
+
+    result = auto.AutoRunResult(started_at=NOW)
+    ctx = auto._pull_sharepoint(test_config, result)
+    auto._push_sharepoint(test_config, ctx, result)
+    assert result.errors == []
+    assert result.sharepoint_pushed == "created 2, updated 0, unchanged 0"
+    stored = {f["PubId"]: f for f in server.items(list_id).values()}
+    assert sorted(stored) == ["3290", "3291"]
+    assert stored["3290"]["DataContactLookupId"] == "10"
+
+    item_id = next(i for i, f in server.items(list_id).items() if f["PubId"] == "3291")
+    server.edit(list_id, item_id, {"UserNotes": "please check"})
+    result = auto.AutoRunResult(started_at=NOW)
+    ctx = auto._pull_sharepoint(test_config, result)
+    assert result.user_notes == ["3291: please check"]
+    with db.get_connection(test_config.database) as conn:
+        mirror = db.get_sharepoint_items(conn, list_id)
+    assert mirror[item_id]["fields"]["UserNotes"] == "please check"
+
@@ -479,3 +479,100 @@ def test_no_handover_row_after_sent(test_config):
     path = generate_sheet(test_config)
     rows = _read_sheet(path)
     assert [r for r in rows if r["task_code"] == "handover_sent"] == []
+
+
+# ── Incremental regeneration (row key = publication_id + task_code) ──
+
+def _write_sheet(path, rows):
+    from oa_tracker.sheet import SHEET_COLUMNS
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SHEET_COLUMNS, delimiter="\t")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_regeneration_keeps_operator_cells(test_config):
+    _seed_active(test_config, "5001")
+    _seed_active(test_config, "5002", status="OPEN_READY_FOR_ZENODO_DRAFT")
+    path = generate_sheet(test_config)
+    rows = _read_sheet(path)
+    rows[0].update(done="1", note="QA ok, README a bit thin")
+    rows[1].update(pid="10.5281/zenodo.1", url="https://zenodo.org/records/1")
+    _write_sheet(path, rows)
+
+    # The generated note of 5001 changes; the operator's note still wins.
+    _seed_active(test_config, "5001", package_has_zip=1, package_has_readme=1,
+                 package_has_manuscript=1)
+    after = {r["publication_id"]: r for r in _read_sheet(generate_sheet(test_config))}
+    assert (after["5001"]["done"], after["5001"]["note"]) == ("1", "QA ok, README a bit thin")
+    assert after["5002"]["pid"] == "10.5281/zenodo.1"
+    assert after["5002"]["done"] == "0"
+
+
+def test_untouched_generated_note_follows_the_archive(test_config):
+    _seed_active(test_config, "5001")
+    assert _read_sheet(generate_sheet(test_config))[0]["note"] == ""
+    _seed_active(test_config, "5001", package_has_zip=1, package_has_readme=1,
+                 package_has_manuscript=1)
+    assert "hasn't ticked" in _read_sheet(generate_sheet(test_config))[0]["note"]
+
+
+def test_only_changed_archives_are_recomputed(test_config, monkeypatch):
+    from oa_tracker import sheet
+    from oa_tracker.db import insert_event
+    for n in range(3):
+        _seed_active(test_config, f"500{n}")
+    generate_sheet(test_config)
+
+    seen = []
+    real = sheet._archive_rows
+    monkeypatch.setattr(sheet, "_archive_rows",
+                        lambda ctx, cfg, a: seen.append(a["publication_id"])
+                        or real(ctx, cfg, a))
+    # A scan touching last_seen_at alone doesn't count as a change.
+    _seed_active(test_config, "5000", last_seen_at="2026-07-09T00:00:00")
+    generate_sheet(test_config)
+    assert seen == []
+
+    _seed_active(test_config, "5001", status="OPEN_READY_FOR_ZENODO_DRAFT")
+    with get_connection(test_config.database) as conn:
+        insert_event(conn, "5002", "data_contact_handover",
+                     OPEN_ACTIVE, OPEN_ACTIVE, "auto", note="Old Contact")
+    rows = _read_sheet(generate_sheet(test_config))
+    assert seen == ["5001", "5002"]
+    assert [(r["publication_id"], r["task_code"]) for r in rows] == [
+        ("5000", "qa_pass"), ("5001", "zenodo_draft_created"),
+        ("5002", "handover_sent"), ("5002", "qa_pass"),
+    ]
+
+
+def test_rekeyed_operator_row_replaces_its_original(test_config):
+    """qa_pass switched to qa_hold with done=1 (a QA failure) stays put
+    until applied, without a fresh qa_pass row beside it."""
+    _seed_active(test_config, "5001")
+    path = generate_sheet(test_config)
+    rows = _read_sheet(path)
+    rows[0].update(task_code="qa_hold", done="1", note="missing README")
+    _write_sheet(path, rows)
+    rows = _read_sheet(generate_sheet(test_config))
+    assert [(r["task_code"], r["done"]) for r in rows] == [("qa_hold", "1")]
+
+    # Once apply has taken it off the sheet, the archive's row comes back.
+    _write_sheet(path, [])
+    rows = _read_sheet(generate_sheet(test_config))
+    assert [(r["task_code"], r["done"]) for r in rows] == [("qa_pass", "0")]
+
+
+def test_missing_sheet_state_keeps_only_filled_rows(test_config):
+    from oa_tracker.db import get_connection, set_sync_state
+    from oa_tracker.sheet import STATE_KEY
+    _seed_active(test_config, "5001", package_has_zip=1, package_has_readme=1,
+                 package_has_manuscript=1)
+    path = generate_sheet(test_config)
+    assert not path.with_suffix(".state.json").exists()
+    rows = _read_sheet(path)
+    rows[0]["note"] = "stale generated note"
+    _write_sheet(path, rows)
+    with get_connection(test_config.database) as conn:
+        set_sync_state(conn, STATE_KEY, None)
+    assert "hasn't ticked" in _read_sheet(generate_sheet(test_config))[0]["note"]
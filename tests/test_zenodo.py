@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
+import threading
 import urllib.parse
 import zipfile
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 
 import pytest
@@ -24,7 +26,9 @@ class FakeZenodo:
     with a 400-style ZenodoError (feature-detect fallback path);
     ``report_md5=False`` commits without an md5 checksum (S3-style
     backend), leaving only status+size to match on; ``corrupt_on_commit``
-    garbles assembled multipart content (verification path).
+    garbles assembled multipart content (verification path);
+    ``fail_part_put_at=n`` drops the connection on part ``n`` (an
+    interrupted run, for the resume path).
     """
 
     def __init__(self):
@@ -37,9 +41,16 @@ class FakeZenodo:
         self.deny_part_put = False      # real Zenodo 2026-07-04: init OK, part PUT 403
         self.report_md5 = True
         self.corrupt_on_commit = False
+        self.fail_part_put_at: int | None = None
+        self._lock = threading.RLock()
 
     def request(self, method, path, json_body=None, data=None,
                 content_type=None, content_length=None):
+        # The auto pipeline calls from worker threads — one at a time here.
+        with self._lock:
+            return self._handle(method, path, json_body, data)
+
+    def _handle(self, method, path, json_body, data):
         self.calls.append((method, path))
         if method == "POST" and path == "/api/records":
             rid = str(self.next_id)
@@ -56,6 +67,12 @@ class FakeZenodo:
         if method == "GET" and path.endswith("/draft/files"):
             rid = path.split("/")[3]
             return 200, {"entries": list(self.files[rid].values())}
+        if method == "GET" and "/draft/files/" in path:
+            rid = path.split("/")[3]
+            key = urllib.parse.unquote(path.split("/")[-1])
+            if key not in self.files[rid]:
+                raise zenodo.ZenodoError("data", "HTTP 404 from Zenodo: no such file", 404)
+            return 200, self.files[rid][key]
         if method == "POST" and path.endswith("/draft/files"):
             rid = path.split("/")[3]
             entries = []
@@ -90,6 +107,8 @@ class FakeZenodo:
             rid = path.split("/")[3]
             key = urllib.parse.unquote(path.split("/")[-3])
             part = int(path.split("/")[-1])
+            if part == self.fail_part_put_at:
+                raise zenodo.ZenodoError("transient", "connection to Zenodo failed")
             content = data.read() if hasattr(data, "read") else data
             self.files[rid][key]["_parts"][part] = content
             return 200, {}
@@ -270,6 +289,112 @@ def test_payload_locked_fields(settings):
     assert md["contributors"][0]["role"] == {"id": "datacurator"}
 
 
+def test_batch_payloads_match_single_builds(settings):
+    archives = [_archive(), _archive(publication_id="3291", pub_title="Other")]
+    extras = {"3290": {
+        "abstract": "We did things.",
+        "author_with_affiliation": "Carregal-Romero, S (Carregal-Romero, Susana)[ 1 ]",
+        "first_author_name": "Susana Carregal Romero",
+    }}
+    batch = zenodo.build_record_payloads(archives, settings, extras, today=date(2026, 7, 2))
+    assert list(batch) == ["3290", "3291"]
+    assert batch["3290"] == zenodo.build_record_payload(
+        archives[0], settings,
+        abstract="We did things.",
+        author_with_affiliation="Carregal-Romero, S (Carregal-Romero, Susana)[ 1 ]",
+        extra_biomagune_names=["Susana Carregal Romero"],
+        today=date(2026, 7, 2),
+    )
+    # No extras → degrades like an unreachable central DB.
+    assert batch["3291"] == zenodo.build_record_payload(
+        archives[1], settings, today=date(2026, 7, 2),
+    )
+
+
+class _ExtrasCursor:
+    """Central-DB cursor stand-in: answers the two bulk-extras queries."""
+
+    def __init__(self, log):
+        self.log = log
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        self.log.append((sql, list(params)))
+        if "FROM publication " in sql:
+            self._rows = [
+                {"id": 3290, "abstract": "We did things.", "author": "Romero, S",
+                 "author_with_affiliation": None},
+                {"id": 3291, "abstract": None, "author": "Other, O",
+                 "author_with_affiliation": "Other, O (Other, Olga)[ 1 ]"},
+            ]
+        else:
+            self._rows = [
+                {"id_publi": 3290, "name": "Susana Carregal Romero"},
+                {"id_publi": 3290, "name": "Second Row"},
+                {"id_publi": 3291, "name": "Jos&eacute; Ruiz"},
+            ]
+
+    def fetchall(self):
+        return self._rows
+
+
+def test_bulk_extras_use_one_connection_and_two_queries(monkeypatch):
+    from oa_tracker import pub_db
+
+    log, opened = [], []
+
+    class Conn:
+        def cursor(self):
+            return _ExtrasCursor(log)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(pub_db, "get_connection", lambda: opened.append(1) or Conn())
+    out = zenodo.fetch_publication_extras_bulk(["3290", "3291", "9999"])
+    assert len(opened) == 1 and len(log) == 2
+    assert all("IN (%s, %s, %s)" in sql and params == ["3290", "3291", "9999"]
+               for sql, params in log)
+    assert out["3290"] == {"abstract": "We did things.", "author": "Romero, S",
+                           "author_with_affiliation": "",
+                           "first_author_name": "Susana Carregal Romero"}
+    assert out["3291"]["first_author_name"] == "José Ruiz"
+    assert out["9999"] == {"abstract": "", "author_with_affiliation": "",
+                           "author": "", "first_author_name": ""}
+    assert zenodo.fetch_publication_extras("3291")["author"] == "Other, O"
+
+
+def test_bulk_extras_degrade_when_central_db_is_down(monkeypatch):
+    from oa_tracker import pub_db
+
+    def down():
+        raise OSError("unreachable")
+
+    monkeypatch.setattr(pub_db, "get_connection", down)
+    out = zenodo.fetch_publication_extras_bulk(["3290"])
+    assert out == {"3290": {"abstract": "", "author_with_affiliation": "",
+                            "author": "", "first_author_name": ""}}
+    assert zenodo.fetch_publication_extras_bulk([]) == {}
+
+
+def test_large_author_list_normalizes_each_name_once(settings):
+    zenodo._normalize.cache_clear()
+    authors = " ; ".join(f"Author{i}, A (Author{i}, Anne)[ 1 ]" for i in range(300))
+    creators, _ = zenodo.build_creators(
+        authors, None, ["Susana Carregal Romero", "Author7 Anne"], "CIC biomaGUNE",
+    )
+    assert len(creators) == 300
+    assert [i for i, c in enumerate(creators) if c.get("affiliations")] == [7]
+    info = zenodo._normalize.cache_info()
+    assert info.misses <= 2 * 300 + 2
+
+
 def test_payload_embargo(settings):
     payload = zenodo.build_record_payload(
         _archive(max_embargo_months=6), settings, today=date(2026, 7, 2),
@@ -375,10 +500,20 @@ def test_discover_files_all_mode(tmp_path):
 
 # ── Uploads (idempotent) ─────────────────────────────────────────────
 
+def zip_bytes(size: int = 200, fill: bytes = b"x") -> bytes:
+    """A valid (stored) zip of exactly ``size`` bytes — one member whose
+    content is ``fill`` repeated; the uploader CRC-checks zips now."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("d", (fill * size)[:size - 100])
+    assert len(buf.getvalue()) == size
+    return buf.getvalue()
+
+
 def _folder_with_package(tmp_path):
     folder = tmp_path / "3290"
     folder.mkdir()
-    (folder / "data.zip").write_bytes(b"zip-content")
+    (folder / "data.zip").write_bytes(zip_bytes())
     (folder / "README.txt").write_text("hello")
     return folder
 
@@ -415,7 +550,7 @@ def test_upload_files_replaces_changed_file(tmp_path, settings):
     fake.files["100"] = {}
     folder = _folder_with_package(tmp_path)
     zenodo.upload_files(fake, "100", folder, settings)
-    (folder / "data.zip").write_bytes(b"NEW-zip-content")
+    (folder / "data.zip").write_bytes(zip_bytes(300, b"NEW"))
     res = zenodo.upload_files(fake, "100", folder, settings)
     assert res.ok
     assert res.replaced == ["data.zip"]
@@ -455,13 +590,27 @@ def test_upload_includes_manuscript(tmp_path, settings):
     assert fake.files["100"]["preprint.pdf"]["_content"] == b"pdf-bytes"
 
 
+def test_corrupt_zip_is_not_uploaded(tmp_path, settings):
+    fake = FakeZenodo()
+    fake.records["100"] = {}
+    fake.files["100"] = {}
+    folder = _folder_with_package(tmp_path)
+    (folder / "data.zip").write_bytes(zip_bytes()[:150])      # truncated
+    res = zenodo.upload_files(fake, "100", folder, settings)
+    assert not res.ok
+    assert res.uploaded == ["README.txt"]
+    assert "zip integrity check failed" in res.errors[0]
+    assert "data.zip" not in fake.files["100"]
+    assert (Path(settings.manifest_dir) / "preflight_cache.json").exists()
+
+
 # ── Multipart uploads (large files) ──────────────────────────────────
 
 def _big_folder(tmp_path, size=2 * 1024 * 1024 + 512 * 1024):
     """A folder whose data.zip exceeds a 1 MB multipart threshold."""
     folder = tmp_path / "big"
     folder.mkdir()
-    (folder / "data.zip").write_bytes(b"x" * size)
+    (folder / "data.zip").write_bytes(zip_bytes(size))
     return folder
 
 
@@ -492,7 +641,7 @@ def test_small_file_still_single_put(tmp_path, settings):
     fake.files["100"] = {}
     folder = tmp_path / "small"
     folder.mkdir()
-    (folder / "data.zip").write_bytes(b"tiny")
+    (folder / "data.zip").write_bytes(zip_bytes())
     res = zenodo.upload_files(fake, "100", folder, _mp(settings))
     assert res.ok and res.uploaded == ["data.zip"]
     assert "_parts" not in fake.files["100"]["data.zip"]
@@ -576,6 +725,71 @@ def test_working_multipart_ignores_single_put_ceiling(tmp_path, settings):
     assert sorted(fake.files["100"]["data.zip"]["_parts"]) == [1, 2, 3]
 
 
+def test_oversized_file_deferred_outside_upload_window(tmp_path, settings):
+    fake = FakeZenodo()
+    fake.deny_part_put = True
+    fake.files["100"] = {}
+    folder = _big_folder(tmp_path)
+    settings = _mp(settings)
+    settings.single_put_max_mb = 2
+    settings.large_upload_window = "22:00-06:00"
+    res = zenodo.upload_files(fake, "100", folder, settings, now=datetime(2026, 7, 6, 14, 0))
+    assert res.ok and not res.complete
+    assert res.deferred == ["data.zip"] and res.manual_required == []
+    assert "deferred to the upload window 22:00-06:00" in res.summary
+    assert "data.zip" not in fake.files["100"]
+
+
+def test_oversized_file_sent_unattended_inside_window(tmp_path, settings):
+    fake = FakeZenodo()
+    fake.deny_part_put = True
+    fake.files["100"] = {}
+    folder = _big_folder(tmp_path)
+    settings = _mp(settings)
+    settings.single_put_max_mb = 2
+    settings.large_upload_window = "22:00-06:00"
+    res = zenodo.upload_files(fake, "100", folder, settings, now=datetime(2026, 7, 6, 2, 30))
+    assert res.complete
+    assert res.uploaded == ["data.zip"]
+    assert fake.files["100"]["data.zip"]["_content"] == (folder / "data.zip").read_bytes()
+
+
+@pytest.mark.parametrize("window,hour,inside", [
+    ("", 12, True),
+    ("01:00-05:00", 3, True),
+    ("01:00-05:00", 5, False),
+    ("22:00-06:00", 23, True),
+    ("22:00-06:00", 5, True),
+    ("22:00-06:00", 6, False),
+])
+def test_in_upload_window(window, hour, inside):
+    assert zenodo.in_upload_window(window, datetime(2026, 7, 6, hour, 0)) is inside
+
+
+def test_bad_upload_window_is_a_config_error():
+    with pytest.raises(zenodo.ZenodoError) as exc:
+        zenodo.in_upload_window("nightly", datetime(2026, 7, 6))
+    assert exc.value.kind == "config"
+
+
+def test_upload_bodies_draw_on_bandwidth_budget(tmp_path, settings, monkeypatch):
+    consumed = []
+
+    class _Budget:
+        def consume(self, n):
+            consumed.append(n)
+
+    monkeypatch.setattr(zenodo.ratelimit, "upload_bandwidth", lambda rate: _Budget())
+    fake = FakeZenodo()
+    fake.files["100"] = {}
+    folder = _big_folder(tmp_path)
+    settings = _mp(settings)
+    settings.upload_bytes_per_sec = 1024**2
+    res = zenodo.upload_files(fake, "100", folder, settings)
+    assert res.complete
+    assert sum(consumed) == (folder / "data.zip").stat().st_size
+
+
 def test_multipart_verification_failure_is_an_error(tmp_path, settings):
     fake = FakeZenodo()
     fake.corrupt_on_commit = True
@@ -601,6 +815,92 @@ def test_stale_pending_entry_is_replaced(tmp_path, settings):
     assert fake.files["100"]["data.zip"]["status"] == "completed"
 
 
+class _MemoryProgress(zenodo.UploadProgress):
+    def __init__(self):
+        self.rows: dict[tuple[str, str], dict[int, dict]] = {}
+
+    def completed_parts(self, record_id, key):
+        return list(self.rows.get((record_id, key), {}).values())
+
+    def part_done(self, record_id, key, **row):
+        self.rows.setdefault((record_id, key), {})[row["part_number"]] = row
+
+    def clear(self, record_id, key):
+        self.rows.pop((record_id, key), None)
+
+
+def _part_puts(fake):
+    return [p for m, p in fake.calls if m == "PUT" and "/content/" in p]
+
+
+def test_interrupted_multipart_resumes_missing_parts(tmp_path, settings):
+    fake = FakeZenodo()
+    fake.files["100"] = {}
+    folder = _big_folder(tmp_path)          # 3 parts at 1 MB
+    progress = _MemoryProgress()
+    fake.fail_part_put_at = 2
+    res1 = zenodo.upload_files(fake, "100", folder, _mp(settings), progress=progress)
+    assert not res1.ok
+    assert [r["part_number"] for r in progress.completed_parts("100", "data.zip")] == [1]
+    assert fake.files["100"]["data.zip"]["status"] == "pending"
+
+    fake.fail_part_put_at = None
+    fake.calls.clear()
+    res2 = zenodo.upload_files(fake, "100", folder, _mp(settings), progress=progress)
+    assert res2.ok
+    assert res2.resumed == ["data.zip"] and res2.replaced == []
+    assert [p.rsplit("/", 1)[-1] for p in _part_puts(fake)] == ["2", "3"]
+    assert fake.files["100"]["data.zip"]["_content"] == (folder / "data.zip").read_bytes()
+    assert progress.completed_parts("100", "data.zip") == []   # cleared on commit
+    assert "resumed 1" in res2.summary
+
+
+def test_resume_without_part_links_restarts_clean(tmp_path, settings):
+    # The server no longer hands out the pending entry's part URLs —
+    # resume is unsupported, so the entry is deleted and re-sent whole.
+    fake = FakeZenodo()
+    fake.files["100"] = {}
+    folder = _big_folder(tmp_path)
+    progress = _MemoryProgress()
+    fake.fail_part_put_at = 2
+    zenodo.upload_files(fake, "100", folder, _mp(settings), progress=progress)
+    fake.files["100"]["data.zip"]["links"] = {}
+    fake.fail_part_put_at = None
+    fake.calls.clear()
+    res = zenodo.upload_files(fake, "100", folder, _mp(settings), progress=progress)
+    assert res.ok
+    assert res.replaced == ["data.zip"] and res.resumed == []
+    assert [p.rsplit("/", 1)[-1] for p in _part_puts(fake)] == ["1", "2", "3"]
+
+
+def test_resume_ignores_parts_of_a_changed_file(tmp_path, settings):
+    fake = FakeZenodo()
+    fake.files["100"] = {}
+    folder = _big_folder(tmp_path)
+    progress = _MemoryProgress()
+    fake.fail_part_put_at = 2
+    zenodo.upload_files(fake, "100", folder, _mp(settings), progress=progress)
+    (folder / "data.zip").write_bytes(zip_bytes(2 * 1024 * 1024 + 512 * 1024 + 1, b"y"))
+    fake.fail_part_put_at = None
+    fake.calls.clear()
+    res = zenodo.upload_files(fake, "100", folder, _mp(settings), progress=progress)
+    assert res.ok and res.resumed == []
+    assert len(_part_puts(fake)) == 3
+    assert fake.files["100"]["data.zip"]["_content"] == (folder / "data.zip").read_bytes()
+
+
+def test_recorded_parts_are_pinned_by_the_whole_file_md5():
+    progress = _MemoryProgress()
+    for i in (1, 2):
+        progress.part_done("100", "data.zip", file_size=30, file_md5="abc",
+                           part_size=10, part_number=i)
+    assert zenodo._recorded_parts(progress, "100", "data.zip", 30, "abc", 10) == {1, 2}
+    assert zenodo._recorded_parts(progress, "100", "data.zip", 30, "abd", 10) == set()
+    assert zenodo._recorded_parts(progress, "100", "data.zip", 30, "abc", 5) == set()
+    # No preflight md5 to compare against → nothing is trusted.
+    assert zenodo._recorded_parts(progress, "100", "data.zip", 30, "", 10) == set()
+
+
 def test_part_reader_slices_and_reseeks(tmp_path):
     p = tmp_path / "f.bin"
     p.write_bytes(b"0123456789")
@@ -647,6 +947,99 @@ def test_client_retry_rewinds_streamed_body(monkeypatch, tmp_path):
     assert sent == [b"HELLO", b"HELLO"]
 
 
+def test_part_reader_sendfile_sends_the_slice(tmp_path):
+    import socket
+
+    p = tmp_path / "f.bin"
+    data = bytes(range(256)) * 64
+    p.write_bytes(data)
+    a, b = socket.socketpair()
+    try:
+        with zenodo._PartReader(p, 100, 5000) as r:
+            r.send_to(a)
+            a.close()
+            got = b""
+            while chunk := b.recv(65536):
+                got += chunk
+            assert got == data[100:5100]
+    finally:
+        b.close()
+
+
+def test_part_reader_buffer_path_throttles(tmp_path, monkeypatch):
+    # Anything that isn't a plain socket (TLS) gets memoryview slices of
+    # one reused buffer — never a fresh bytes object per block.
+    monkeypatch.setattr(zenodo, "_SEND_BLOCK", 1000)
+    p = tmp_path / "f.bin"
+    data = bytes(range(256)) * 20
+    p.write_bytes(data)
+
+    class Sock:
+        def __init__(self):
+            self.blocks = []
+
+        def sendall(self, view):
+            assert isinstance(view, memoryview)
+            self.blocks.append(bytes(view))
+
+    class Budget:
+        consumed = 0
+
+        def consume(self, n):
+            Budget.consumed += n
+
+    sock = Sock()
+    with zenodo._PartReader(p, 10, 2500, Budget()) as r:
+        r.send_to(sock)
+        assert [len(b) for b in sock.blocks] == [1000, 1000, 500]
+        assert b"".join(sock.blocks) == data[10:2510]
+    assert Budget.consumed == 2500
+
+
+def test_client_streams_bodies_over_one_keepalive_connection(tmp_path):
+    import http.server
+
+    seen = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_PUT(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            seen.append((self.client_address[1], self.path, body))
+            out = json.dumps({"key": self.path.rsplit("/", 1)[-1]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(out)))
+            self.end_headers()
+            self.wfile.write(out)
+
+        def log_message(self, *a):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        p = tmp_path / "f.bin"
+        p.write_bytes(b"A" * 3000 + b"B" * 3000)
+        client = zenodo.ZenodoClient(f"http://127.0.0.1:{server.server_port}", "tok")
+        for n, offset in ((1, 0), (2, 3000)):
+            with zenodo._PartReader(p, offset, 3000) as body:
+                status, resp = client.request(
+                    "PUT", f"/api/parts/{n}", data=body,
+                    content_type="application/octet-stream", content_length=3000,
+                )
+            assert (status, resp) == (200, {"key": str(n)})
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert [(path, body) for _, path, body in seen] == [
+        ("/api/parts/1", b"A" * 3000), ("/api/parts/2", b"B" * 3000),
+    ]
+    assert seen[0][0] == seen[1][0]          # same client port: one connection
+
+
 def test_record_ui_url(settings):
     assert zenodo.record_ui_url(settings, "42") == "https://sandbox.zenodo.org/uploads/42"
     settings.environment = "production"
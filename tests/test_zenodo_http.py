@@ -0,0 +1,191 @@
+"""HTTP-level tests: the real ZenodoClient against the local fake
+InvenioRDM server (tests/fake_invenio.py, shared with the benchmarks).
+
+test_zenodo.py fakes the client; these exercise what only a socket can —
+retries, 429 pacing, streamed multipart bodies, keep-alive reuse.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from oa_tracker import ratelimit, zenodo
+from oa_tracker.config import ZenodoSettings
+
+from tests.fake_invenio import Faults, FakeInvenioServer
+from tests.test_zenodo import zip_bytes
+
+TOKEN = "tok"
+
+
+@pytest.fixture
+def server(monkeypatch, fresh_limiters):
+    monkeypatch.setattr(zenodo.time, "sleep", lambda s: None)   # 5xx backoff
+    with FakeInvenioServer(token=TOKEN) as srv:
+        yield srv
+
+
+@pytest.fixture
+def client(server):
+    c = zenodo.ZenodoClient(server.url, TOKEN)
+    yield c
+    c.close()
+
+
+def _settings(tmp_path, **over):
+    s = ZenodoSettings(enabled=True, manifest_dir=tmp_path / "uploads")
+    for k, v in over.items():
+        setattr(s, k, v)
+    return s
+
+
+def _folder(tmp_path, size):
+    folder = tmp_path / "pkg"
+    folder.mkdir()
+    data = zip_bytes(size, bytes(range(256)))
+    (folder / "data.zip").write_bytes(data)
+    (folder / "README.txt").write_text("hello")
+    return folder, hashlib.md5(data).hexdigest()
+
+
+def test_draft_upload_publish_round_trip(server, client, tmp_path):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    assert draft.doi == f"10.5281/zenodo.{draft.record_id}"
+    folder, md5 = _folder(tmp_path, 50_000)
+    res = zenodo.upload_files(client, draft.record_id, folder, _settings(tmp_path))
+    assert res.complete and sorted(res.uploaded) == ["README.txt", "data.zip"]
+    assert server.entry(draft.record_id, "data.zip")["_md5"] == md5
+    with pytest.raises(zenodo.ZenodoError) as exc:
+        zenodo.get_record(client, draft.record_id)
+    assert exc.value.status == 404
+    published = zenodo.publish(client, draft.record_id)
+    assert published["doi"] == draft.doi
+    # Second run: checksums match, nothing re-sent.
+    again = zenodo.upload_files(client, draft.record_id, folder, _settings(tmp_path))
+    assert sorted(again.already_present) == ["README.txt", "data.zip"]
+
+
+def test_multipart_parts_share_one_connection(server, client, tmp_path):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    folder, md5 = _folder(tmp_path, 3 * 1024 * 1024 + 7)
+    settings = _settings(tmp_path, multipart_threshold_mb=1, multipart_part_size_mb=1)
+    server.reset_stats()
+    res = zenodo.upload_files(client, draft.record_id, folder, settings)
+    assert res.complete
+    assert server.entry(draft.record_id, "data.zip")["_md5"] == md5
+    parts = server.stats.requests["PUT /api/records/{n}/draft/files/data.zip/content/{n}"]
+    assert parts == 4
+    # JSON calls go through urllib (one connection each); the four part
+    # PUTs and the README body ride a single keep-alive connection.
+    json_calls = server.stats.total - parts - 1
+    assert server.stats.connections == json_calls + 1
+
+
+def test_throttling_is_absorbed_by_the_limiter(server, client, tmp_path):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    server.faults = Faults(throttle_every=3)
+    folder, md5 = _folder(tmp_path, 2 * 1024 * 1024 + 1)
+    res = zenodo.upload_files(
+        client, draft.record_id, folder,
+        _settings(tmp_path, multipart_threshold_mb=1, multipart_part_size_mb=1),
+    )
+    assert res.complete
+    assert server.entry(draft.record_id, "data.zip")["_md5"] == md5
+    assert server.stats.status[429] >= 2
+    assert ratelimit.limiter_for(server.url).throttles == server.stats.status[429]
+
+
+def test_server_errors_and_dropped_part_are_retried(server, client, tmp_path):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    server.faults = Faults(fail_every=4, drop_part_at=2)
+    folder, md5 = _folder(tmp_path, 3 * 1024 * 1024)
+    res = zenodo.upload_files(
+        client, draft.record_id, folder,
+        _settings(tmp_path, multipart_threshold_mb=1, multipart_part_size_mb=1),
+    )
+    assert res.complete
+    assert server.entry(draft.record_id, "data.zip")["_md5"] == md5
+    assert server.stats.status[503] >= 1
+
+
+def test_denied_part_put_falls_back_to_single_put(server, client, tmp_path):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    server.faults = Faults(deny_part_put=True)
+    folder, md5 = _folder(tmp_path, 2 * 1024 * 1024 + 5)
+    res = zenodo.upload_files(
+        client, draft.record_id, folder,
+        _settings(tmp_path, multipart_threshold_mb=1, multipart_part_size_mb=1),
+    )
+    assert res.complete and "data.zip" in res.uploaded
+    assert server.entry(draft.record_id, "data.zip")["_md5"] == md5
+    assert server.stats.requests["PUT /api/records/{n}/draft/files/data.zip/content"] == 1
+
+
+def test_bad_token_is_a_config_error(server):
+    client = zenodo.ZenodoClient(server.url, "wrong")
+    with pytest.raises(zenodo.ZenodoError) as exc:
+        zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    assert exc.value.kind == "config" and exc.value.status == 401
+
+
+def test_new_draft_file_listing_comes_from_the_cache(server, client, tmp_path):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    folder, _ = _folder(tmp_path, 10_000)
+    server.reset_stats()
+    res = zenodo.upload_files(client, draft.record_id, folder, _settings(tmp_path))
+    assert res.complete
+    # The empty listing was seeded by create_draft: no GET was needed.
+    assert server.stats.requests["GET /api/records/{n}/draft/files"] == 0
+    assert client.stats["cache_hits"] == 1
+    # The uploads invalidated it, so the next run's listing asks again.
+    again = zenodo.upload_files(client, draft.record_id, folder, _settings(tmp_path))
+    assert sorted(again.already_present) == ["README.txt", "data.zip"]
+    assert server.stats.requests["GET /api/records/{n}/draft/files"] == 1
+
+
+def test_record_state_is_cached_and_revalidated_after_mutations(server, client):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    server.reset_stats()
+    first = zenodo.get_draft(client, draft.record_id)
+    assert zenodo.get_draft(client, draft.record_id) == first
+    assert server.stats.requests["GET /api/records/{n}/draft"] == 1
+    # Our own mutation marks the record stale; the unchanged draft
+    # revalidates with a 304 instead of a full body.
+    client.request("POST", f"/api/records/{draft.record_id}/draft/pids/doi")
+    assert zenodo.get_draft(client, draft.record_id) == first
+    assert server.stats.status[304] == 1 and client.stats["revalidated"] == 1
+    # A real change comes back in full.
+    zenodo.update_metadata(client, draft.record_id, {"metadata": {"title": "new"}})
+    assert zenodo.get_draft(client, draft.record_id)["metadata"]["title"] == "new"
+    assert server.stats.requests["GET /api/records/{n}/draft"] == 3
+
+
+def test_published_record_is_remembered_from_publish(server, client):
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    zenodo.publish(client, draft.record_id)
+    server.reset_stats()
+    record = zenodo.get_record(client, draft.record_id)
+    assert zenodo.record_doi(record, draft.record_id) == draft.doi
+    assert server.stats.total == 0
+
+
+def test_get_client_is_shared_per_run_and_reported(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(zenodo, "load_token", lambda s: TOKEN)
+    monkeypatch.setattr(ZenodoSettings, "base_url", property(lambda s: server.url))
+    zenodo.reset_clients()
+    settings = _settings(tmp_path)
+    client = zenodo.get_client(settings)
+    assert zenodo.get_client(settings) is client
+    draft = zenodo.create_draft(client, {"metadata": {"title": "t"}})
+    zenodo.get_draft(client, draft.record_id)
+    zenodo.get_draft(client, draft.record_id)
+    assert zenodo.request_report() == (
+        "3 request(s) (~3.0 per archive over 1); "
+        "1 answered from the state cache, 0 revalidated (304)"
+    )
+    zenodo.reset_clients()
+    assert zenodo.get_client(settings) is not client
+    assert zenodo.request_report() == ""
+    client.close()